@@ -0,0 +1,178 @@
+"""What each JSON API endpoint exposes and how it reads it.
+
+A ``Resource`` maps public field names to ORM paths. Rows are read with
+``values()`` over just the selected columns (plus the ordering keys), so a
+sparse request selects only what it returns, and serializing is a dict
+rename with no model instances or related lookups involved.
+"""
+
+from django.core.exceptions import BadRequest
+
+from kingdoms.models import Kingdom
+from leadership.models import LeadershipAssignment
+from skills.models import KingdomSkillProficiency
+from turns.models import TALLY_FIELDS, ActivityLog, KingdomTurn
+
+
+class Resource:
+    """A model's public fields, with ORM paths for any that are renamed."""
+
+    def __init__(self, name, model, fields, ordering, paths=None):
+        self.name = name
+        self.model = model
+        paths = paths or {}
+        self.fields = {field: paths.get(field, field) for field in fields}
+        self.ordering = ordering
+
+    def parse_fields(self, param):
+        """Field names selected by a ``fields`` parameter; ``id`` is always in.
+
+        Raises:
+            BadRequest: If a name isn't one of this resource's fields.
+        """
+        if not param:
+            return list(self.fields)
+        names = [name.strip() for name in param.split(",") if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise BadRequest(
+                f"Unknown {self.name} field(s): {', '.join(unknown)}. "
+                f"Choose from: {', '.join(self.fields)}."
+            )
+        return list(dict.fromkeys(["id", *names]))
+
+    def values(self, queryset, names):
+        """``queryset`` projected onto ``names`` and the ordering keys."""
+        paths = [self.fields[name] for name in names]
+        keys = [key.lstrip("-") for key in self.ordering]
+        return queryset.values(*dict.fromkeys([*paths, *keys]))
+
+    def serialize(self, row, names):
+        return {name: row[self.fields[name]] for name in names}
+
+    def serialize_instance(self, obj, names):
+        return {name: getattr(obj, self.fields[name]) for name in names}
+
+
+KINGDOM = Resource(
+    "kingdom",
+    Kingdom,
+    # Leaves out invite_code, a join secret shown only to members on the site,
+    # and the version counters, which are cache and ETag bookkeeping.
+    [
+        "id",
+        "name",
+        "charter",
+        "charter_ability_boost",
+        "government",
+        "government_ability_boost",
+        "heartland",
+        "culture_score",
+        "economy_score",
+        "loyalty_score",
+        "stability_score",
+        "level",
+        "xp",
+        "unrest",
+        "fame_points",
+        "fame_type",
+        "resource_points",
+        "bonus_dice",
+        "penalty_dice",
+        "corruption_points",
+        "corruption_threshold",
+        "corruption_penalty",
+        "crime_points",
+        "crime_threshold",
+        "crime_penalty",
+        "strife_points",
+        "strife_threshold",
+        "strife_penalty",
+        "decay_points",
+        "decay_threshold",
+        "decay_penalty",
+        "claimed_hexes",
+        "food",
+        "lumber",
+        "ore",
+        "stone",
+        "luxuries",
+    ],
+    ("id",),
+)
+
+TURN = Resource(
+    "turn",
+    KingdomTurn,
+    [
+        "id",
+        "turn_number",
+        "in_game_month",
+        "starting_rp",
+        "resource_dice_rolled",
+        "collected_taxes",
+        "improved_lifestyle",
+        "tapped_treasury",
+        "event_occurred",
+        "event_xp",
+        "ending_rp",
+        "rp_converted_to_xp",
+        "xp_gained",
+        "leveled_up",
+        "notes",
+        "created_at",
+        "completed_at",
+        *TALLY_FIELDS,
+    ],
+    ("-turn_number", "-id"),
+)
+
+ACTIVITY = Resource(
+    "activity",
+    ActivityLog,
+    [
+        "id",
+        "turn",
+        "turn_number",
+        "activity_name",
+        "activity_trait",
+        "skill_used",
+        "performed_by",
+        "performer_role",
+        "roll_result",
+        "total_modifier",
+        "dc",
+        "degree_of_success",
+        "notes",
+        "created_at",
+    ],
+    ("-created_at", "-id"),
+    paths={
+        "turn": "turn_id",
+        "turn_number": "turn__turn_number",
+        "performed_by": "performed_by_id",
+        "performer_role": "performed_by__role",
+    },
+)
+
+LEADERSHIP = Resource(
+    "leadership",
+    LeadershipAssignment,
+    [
+        "id",
+        "role",
+        "character_name",
+        "is_pc",
+        "is_invested",
+        "is_vacant",
+        "downtime_fulfilled",
+    ],
+    ("id",),
+)
+
+SKILL = Resource(
+    "skill",
+    KingdomSkillProficiency,
+    ["id", "skill", "proficiency"],
+    ("id",),
+)
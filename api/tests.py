@@ -0,0 +1,358 @@
+import gzip
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from kingdoms.pagination import encode_cursor
+from kingdoms.testing import QueryBudgetMixin
+from turns.models import (
+    ActivityLog,
+    ActivityTrait,
+    DegreeOfSuccess,
+    KingdomTurn,
+)
+
+User = get_user_model()
+
+TEST_PASSWORD = "testpass123"  # nosec B105
+
+
+class ApiTestCase(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom", level=3)
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.player,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+        )
+        self.client.force_login(self.player)
+
+    def _url(self, name, **kwargs):
+        return reverse(f"api:{name}", kwargs={"pk": self.kingdom.pk, **kwargs})
+
+    def _get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return response, response.json()
+
+    def _play_turns(self, count, activities=2):
+        start = self.kingdom.turns.count()
+        for number in range(start + 1, start + count + 1):
+            turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=number)
+            for i in range(activities):
+                ActivityLog.objects.create(
+                    kingdom=self.kingdom,
+                    turn=turn,
+                    activity_name=f"Activity {number}.{i}",
+                    activity_trait=ActivityTrait.REGION,
+                    performed_by=self.kingdom.leadership_assignments.first(),
+                )
+
+
+class ApiAccessTests(ApiTestCase):
+    def test_anonymous_401(self):
+        self.client.logout()
+        response = self.client.get(self._url("kingdom_detail"))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"error": "Authentication required."})
+
+    def test_non_member_404(self):
+        other = Kingdom.objects.create(name="Other")
+        for name in ("kingdom_detail", "turn_list", "activity_list"):
+            with self.subTest(name):
+                url = reverse(f"api:{name}", kwargs={"pk": other.pk})
+                self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_read_only(self):
+        response = self.client.post(self._url("turn_list"), {})
+        self.assertEqual(response.status_code, 405)
+
+    def test_kingdom_list_only_members(self):
+        Kingdom.objects.create(name="Other")
+        _, body = self._get(reverse("api:kingdom_list"), fields="name")
+        self.assertEqual(
+            body,
+            {
+                "results": [{"id": self.kingdom.pk, "name": "Test Kingdom"}],
+                "next": None,
+            },
+        )
+
+
+class ApiFieldTests(ApiTestCase):
+    def test_kingdom_detail_hides_invite_code_and_versions(self):
+        _, body = self._get(self._url("kingdom_detail"))
+        self.assertEqual(body["level"], 3)
+        self.assertIn("claimed_hexes", body)
+        for field in ("invite_code", "version", "stats_version"):
+            self.assertNotIn(field, body)
+        response, _ = self._get(self._url("kingdom_detail"), fields="version")
+        self.assertEqual(response.status_code, 400)
+
+    def test_sparse_fieldset(self):
+        _, body = self._get(self._url("kingdom_detail"), fields="level,unrest")
+        self.assertEqual(body, {"id": self.kingdom.pk, "level": 3, "unrest": 0})
+
+    def test_unknown_field_400(self):
+        response, body = self._get(self._url("turn_list"), fields="turn_number,secret")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", body["error"])
+
+    def test_sparse_query_selects_only_requested_columns(self):
+        self._play_turns(1)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self._url("activity_list"), {"fields": "activity_name"})
+        sql = ctx.captured_queries[-1]["sql"]
+        self.assertIn('"activity_name"', sql)
+        self.assertNotIn('"notes"', sql)
+
+    def test_activity_related_fields(self):
+        self._play_turns(1, activities=1)
+        _, body = self._get(
+            self._url("activity_list"), fields="turn_number,performer_role"
+        )
+        [row] = body["results"]
+        self.assertEqual(row["turn_number"], 1)
+        self.assertEqual(
+            row["performer_role"],
+            self.kingdom.leadership_assignments.first().role,
+        )
+
+    def test_leadership_and_skills(self):
+        _, leadership = self._get(self._url("leadership_list"), fields="role")
+        _, skills = self._get(self._url("skill_list"), limit=200)
+        self.assertEqual(len(leadership["results"]), 8)
+        self.assertEqual(len(skills["results"]), 16)
+        self.assertEqual(set(skills["results"][0]), {"id", "skill", "proficiency"})
+
+
+class ApiPaginationTests(ApiTestCase):
+    def test_cursor_walks_every_row_once(self):
+        self._play_turns(5)
+        url = self._url("activity_list")
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, "fields": "activity_name"}
+            if cursor:
+                params["after"] = cursor
+            _, body = self._get(url, **params)
+            seen += [row["activity_name"] for row in body["results"]]
+            cursor = body["next"]
+            if cursor is None:
+                break
+        self.assertEqual(len(seen), 10)
+        self.assertEqual(seen[0], "Activity 5.1")
+        self.assertEqual(len(set(seen)), 10)
+
+    def test_turns_newest_first(self):
+        self._play_turns(3, activities=0)
+        _, body = self._get(self._url("turn_list"), fields="turn_number")
+        self.assertEqual([row["turn_number"] for row in body["results"]], [3, 2, 1])
+
+    def test_filter_activities_by_turn(self):
+        self._play_turns(2)
+        _, body = self._get(self._url("activity_list"), turn=1, fields="turn_number")
+        self.assertEqual([row["turn_number"] for row in body["results"]], [1, 1])
+
+    def test_bad_parameters_400(self):
+        url = self._url("activity_list")
+        for params in ({"limit": 0}, {"limit": "x"}, {"after": "!"}, {"turn": "x"}):
+            with self.subTest(params):
+                self.assertEqual(self.client.get(url, params).status_code, 400)
+
+    def test_mistyped_cursor_400(self):
+        self._play_turns(1)
+        cursors = {
+            "turn_list": [["three"], "x"],
+            "activity_list": ["not a date", 1],
+        }
+        for name, values in cursors.items():
+            with self.subTest(name):
+                response, body = self._get(self._url(name), after=encode_cursor(values))
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(body, {"error": "Invalid page cursor."})
+
+
+class ApiCachingTests(ApiTestCase):
+    def test_unchanged_kingdom_304(self):
+        url = self._url("turn_list")
+        etag = self.client.get(url)["ETag"]
+        # session, user, membership+kingdom
+        with self.assertNumQueries(3):
+            response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_write_changes_etag(self):
+        url = self._url("activity_list")
+        etag = self.client.get(url)["ETag"]
+        self._play_turns(1, activities=1)
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_kingdom_list_etag_from_body(self):
+        url = reverse("api:kingdom_list")
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_gzip(self):
+        response = self.client.get(
+            self._url("skill_list"), headers={"accept-encoding": "gzip"}
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        body = json.loads(gzip.decompress(response.content))
+        self.assertEqual(len(body["results"]), 16)
+
+
+class ApiQueryBudgetTests(ApiTestCase):
+    def test_kingdom_detail(self):
+        # session, user, membership+kingdom
+        self.assertQueryBudget(3, self._url("kingdom_detail"))
+
+    def test_collections_do_not_scale(self):
+        for name in ("turn_list", "activity_list"):
+            with self.subTest(name):
+                # session, user, membership+kingdom, rows
+                self.assertQueryBudget(4, self._url(name))
+                self.assertQueriesDoNotScale(
+                    self._url(name), lambda: self._play_turns(3)
+                )
+
+
+class ActivityBatchApiTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        self.url = self._url("activity_batch", turn_pk=self.turn.pk)
+        self.performer = self.kingdom.leadership_assignments.first()
+
+    def _item(self, **overrides):
+        return {
+            "activity_name": "Claim Hex",
+            "activity_trait": ActivityTrait.REGION,
+            "skill_used": "exploration",
+            "performed_by": self.performer.pk,
+            "roll_result": 12,
+            "total_modifier": 8,
+            "dc": 16,
+            **overrides,
+        }
+
+    def _post(self, items):
+        return self.client.post(
+            self.url, {"activities": items}, content_type="application/json"
+        )
+
+    def test_creates_batch(self):
+        version = self.kingdom.version
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self._post(
+                [self._item(), self._item(roll_result=1, dc=30, notes="Ouch")]
+            )
+        self.assertEqual(response.status_code, 201)
+        results = response.json()["results"]
+        self.assertEqual(
+            [result["degree_of_success"] for result in results],
+            [DegreeOfSuccess.SUCCESS, DegreeOfSuccess.CRITICAL_FAILURE],
+        )
+        activities = ActivityLog.objects.filter(turn=self.turn).order_by("pk")
+        self.assertEqual(
+            [activity.pk for activity in activities],
+            [result["id"] for result in results],
+        )
+        self.assertEqual(activities[1].notes, "Ouch")
+        self.assertEqual(activities[0].created_by, self.player)
+        self.assertEqual(activities[0].performed_by, self.performer)
+        self.turn.refresh_from_db()
+        self.assertEqual(self.turn.activities_logged, 2)
+        self.assertEqual(self.turn.region_count, 2)
+        self.assertEqual(self.turn.success_count, 1)
+        self.assertEqual(self.turn.critical_failure_count, 1)
+        self.kingdom.refresh_from_db()
+        self.assertGreater(self.kingdom.version, version)
+        # A live event per activity, and the activities-logged metric.
+        self.assertEqual(len(callbacks), 3)
+
+    def test_manual_degree_kept(self):
+        response = self._post([self._item(degree_of_success="critical_success")])
+        [result] = response.json()["results"]
+        self.assertEqual(result["degree_of_success"], "critical_success")
+
+    def test_invalid_item_saves_nothing(self):
+        other = Kingdom.objects.create(name="Other")
+        other.initialize_defaults()
+        response = self._post(
+            [
+                self._item(),
+                self._item(activity_trait="nonsense"),
+                self._item(performed_by=other.leadership_assignments.first().pk),
+                "not an object",
+            ]
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = [result["errors"] for result in response.json()["results"]]
+        self.assertEqual(errors[0], {})
+        self.assertEqual(list(errors[1]), ["activity_trait"])
+        self.assertEqual(list(errors[2]), ["performed_by"])
+        self.assertIn("__all__", errors[3])
+        self.assertFalse(ActivityLog.objects.exists())
+        self.turn.refresh_from_db()
+        self.assertEqual(self.turn.activities_logged, 0)
+
+    def test_bad_body_400(self):
+        for body in ("not json", "[]", '{"activities": []}', '{"activities": {}}'):
+            with self.subTest(body):
+                response = self.client.post(
+                    self.url, body, content_type="application/json"
+                )
+                self.assertEqual(response.status_code, 400)
+
+    def test_completed_turn(self):
+        self.turn.completed_at = timezone.now()
+        self.turn.save()
+        self.assertEqual(self._post([self._item()]).status_code, 403)
+        membership = KingdomMembership.objects.get(user=self.player)
+        membership.role = MembershipRole.GM
+        membership.save()
+        self.assertEqual(self._post([self._item()]).status_code, 201)
+
+    def test_other_kingdoms_turn_404(self):
+        other = Kingdom.objects.create(name="Other")
+        turn = KingdomTurn.objects.create(kingdom=other, turn_number=1)
+        url = self._url("activity_batch", turn_pk=turn.pk)
+        response = self.client.post(
+            url, {"activities": [self._item()]}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_not_allowed(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+    def test_queries_do_not_scale_with_batch_size(self):
+        self._post([self._item()])  # Warm the membership cache.
+        counts = []
+        for size in (1, 20):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self._post([self._item() for _ in range(size)])
+            self.assertEqual(response.status_code, 201)
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+        # session, user, turn, performers, savepoint, insert, tallies,
+        # version, release
+        self.assertLessEqual(counts[1], 9)
@@ -0,0 +1,34 @@
+from django.urls import path
+
+from .views import (
+    ActivityBatchApiView,
+    ActivityListApiView,
+    KingdomDetailApiView,
+    KingdomListApiView,
+    LeadershipListApiView,
+    SkillListApiView,
+    TurnListApiView,
+)
+
+app_name = "api"
+urlpatterns = [
+    path("kingdoms/", KingdomListApiView.as_view(), name="kingdom_list"),
+    path("kingdoms/<int:pk>/", KingdomDetailApiView.as_view(), name="kingdom_detail"),
+    path("kingdoms/<int:pk>/turns/", TurnListApiView.as_view(), name="turn_list"),
+    path(
+        "kingdoms/<int:pk>/activities/",
+        ActivityListApiView.as_view(),
+        name="activity_list",
+    ),
+    path(
+        "kingdoms/<int:pk>/leadership/",
+        LeadershipListApiView.as_view(),
+        name="leadership_list",
+    ),
+    path(
+        "kingdoms/<int:pk>/turns/<int:turn_pk>/activities/",
+        ActivityBatchApiView.as_view(),
+        name="activity_batch",
+    ),
+    path("kingdoms/<int:pk>/skills/", SkillListApiView.as_view(), name="skill_list"),
+]
@@ -0,0 +1,223 @@
+"""JSON API (v1) for kingdoms, turns, activities, leadership and skills.
+
+Endpoints use the site's session login and membership rules (401 when
+signed out, 404 for kingdoms the user isn't a member of). Query parameters:
+``fields`` (comma-separated sparse fieldset), ``limit`` (page size, at most
+``MAX_LIMIT``) and ``after`` (the previous page's ``next`` cursor).
+
+Kingdom-scoped responses carry an ETag built from ``Kingdom.version``, which
+every turn, activity, leadership and skill write bumps, so an unchanged poll
+is answered 304 after the membership lookup alone. Bodies are gzipped for
+clients that accept it.
+
+The one write endpoint logs a batch of activities on a turn. Being a session
+endpoint it needs the CSRF token in an ``X-CSRFToken`` header.
+"""
+
+import hashlib
+import json
+
+from django.core.exceptions import BadRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import quote_etag
+from django.views import View
+from django.views.decorators.gzip import gzip_page
+
+from kingdoms.models import Kingdom, MembershipRole
+from kingdoms.pagination import InvalidCursor, keyset_paginate
+from kingdoms.permissions import get_membership
+from turns.batch import MAX_BATCH_SIZE, BatchInvalid, submit_activities
+from turns.models import KingdomTurn
+
+from .resources import ACTIVITY, KINGDOM, LEADERSHIP, SKILL, TURN
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def _etag(*parts):
+    return quote_etag(hashlib.sha256(repr(parts).encode()).hexdigest()[:32])
+
+
+@method_decorator(gzip_page, name="dispatch")
+class ApiView(View):
+    """Base JSON endpoint: auth, errors, ETags and serialization."""
+
+    http_method_names = ["get", "head", "options"]
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Authentication required."}, status=401)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except BadRequest as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+        except Http404:
+            return JsonResponse({"error": "Not found."}, status=404)
+
+    def get_etag(self):
+        """ETag known before any work, or ``None`` to hash the body instead."""
+        return None
+
+    def get_payload(self):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        if etag is not None:
+            response = get_conditional_response(request, etag=etag)
+            if response is not None:
+                return self._finish(response, etag)
+        content = json.dumps(
+            self.get_payload(), cls=DjangoJSONEncoder, separators=(",", ":")
+        )
+        response = HttpResponse(content, content_type="application/json")
+        if etag is None:
+            etag = _etag(content)
+            response = get_conditional_response(request, etag=etag, response=response)
+        return self._finish(response, etag)
+
+    def _finish(self, response, etag):
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def fields(self, resource):
+        return resource.parse_fields(self.request.GET.get("fields"))
+
+    def paginate(self, resource, queryset):
+        """One page of ``queryset`` as ``{"results": [...], "next": cursor}``."""
+        limit = self.request.GET.get("limit", DEFAULT_LIMIT)
+        try:
+            limit = int(limit)
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_LIMIT:
+            raise BadRequest(f"limit must be between 1 and {MAX_LIMIT}.")
+        names = self.fields(resource)
+        try:
+            rows, next_cursor = keyset_paginate(
+                resource.values(queryset, names),
+                resource.ordering,
+                cursor=self.request.GET.get("after"),
+                per_page=limit,
+            )
+        except InvalidCursor:
+            raise BadRequest("Invalid page cursor.")
+        return {
+            "results": [resource.serialize(row, names) for row in rows],
+            "next": next_cursor,
+        }
+
+
+class KingdomListApiView(ApiView):
+    """The kingdoms the signed-in user is a member of."""
+
+    def get_payload(self):
+        kingdoms = Kingdom.objects.filter(
+            kingdom_memberships__user=self.request.user
+        ).order_by()
+        return self.paginate(KINGDOM, kingdoms)
+
+
+class KingdomApiView(ApiView):
+    """Endpoint scoped to one kingdom the user belongs to."""
+
+    def get_etag(self):
+        self.kingdom = get_membership(self.request, self.kwargs["pk"]).kingdom
+        return _etag(
+            self.kingdom.pk, self.kingdom.version, self.request.get_full_path()
+        )
+
+
+class KingdomDetailApiView(KingdomApiView):
+    def get_payload(self):
+        # Already loaded by the membership lookup; no further query.
+        return KINGDOM.serialize_instance(self.kingdom, self.fields(KINGDOM))
+
+
+class KingdomCollectionApiView(KingdomApiView):
+    """A paginated list of one of the kingdom's related rows."""
+
+    resource = None
+
+    def get_queryset(self):
+        return self.resource.model.objects.filter(kingdom=self.kingdom).order_by()
+
+    def get_payload(self):
+        return self.paginate(self.resource, self.get_queryset())
+
+
+class TurnListApiView(KingdomCollectionApiView):
+    resource = TURN
+
+
+class ActivityListApiView(KingdomCollectionApiView):
+    """Newest first; ``?turn=<turn number>`` narrows to one turn."""
+
+    resource = ACTIVITY
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        turn_number = self.request.GET.get("turn")
+        if turn_number is not None:
+            if not turn_number.isdigit():
+                raise BadRequest("turn must be a turn number.")
+            queryset = queryset.filter(turn__turn_number=int(turn_number))
+        return queryset
+
+
+class LeadershipListApiView(KingdomCollectionApiView):
+    resource = LEADERSHIP
+
+
+class SkillListApiView(KingdomCollectionApiView):
+    resource = SKILL
+
+
+class ActivityBatchApiView(ApiView):
+    """Log several activities on a turn in one request.
+
+    The body is ``{"activities": [{...}, ...]}`` with ``ActivityForm``
+    fields per item. Answers 201 with the new ids and degrees of success, or
+    400 with each item's errors and nothing saved.
+    """
+
+    http_method_names = ["post", "options"]
+
+    def post(self, request, *args, **kwargs):
+        membership = get_membership(request, self.kwargs["pk"])
+        turn = get_object_or_404(
+            KingdomTurn, pk=self.kwargs["turn_pk"], kingdom_id=membership.kingdom_id
+        )
+        if turn.is_complete and membership.role != MembershipRole.GM:
+            return JsonResponse(
+                {"error": "Cannot add activities to a completed turn."}, status=403
+            )
+        try:
+            items = json.loads(request.body)["activities"]
+        except (ValueError, TypeError, KeyError):
+            raise BadRequest('Expected a JSON body of {"activities": [...]}.')
+        if not isinstance(items, list) or not 1 <= len(items) <= MAX_BATCH_SIZE:
+            raise BadRequest(
+                f"activities must be a list of 1 to {MAX_BATCH_SIZE} activities."
+            )
+        try:
+            activities = submit_activities(turn, items, created_by=request.user)
+        except BatchInvalid as exc:
+            return JsonResponse(
+                {
+                    "error": "Some activities are invalid; none were saved.",
+                    "results": [{"errors": errors} for errors in exc.errors],
+                },
+                status=400,
+            )
+        results = [
+            {"id": activity.pk, "degree_of_success": activity.degree_of_success}
+            for activity in activities
+        ]
+        return JsonResponse({"results": results}, status=201)
@@ -54,9 +54,15 @@ INSTALLED_APPS = [
     "turns",
     "territory",
     "pages",
+    "api",
+    "profiler",
+    "metrics",
 ]
 
 MIDDLEWARE = [
+    # First, so their timings cover the rest; inert unless enabled in settings.
+    "profiler.middleware.ProfilingMiddleware",
+    "metrics.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -113,12 +119,71 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": env(
+            "DJANGO_CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": env("DJANGO_CACHE_LOCATION", default=""),
+    }
+}
+
+# Seconds each kind of cached kingdom data is kept:
+# - membership: a (user, kingdom) role lookup, deleted when the membership
+#   changes.
+# - stat sheet and simulation: keyed by Kingdom.stats_version, which only
+#   kingdom, skill, leadership and hex writes bump.
+# - fragment: a rendered dashboard section, keyed by Kingdom.version, which
+#   every write to the kingdom or its turns bumps.
+# Versioned entries are never read once superseded, so their timeout only
+# bounds how long the stale copies linger.
+KINGDOM_MEMBERSHIP_CACHE_TIMEOUT = env.int(
+    "KINGDOM_MEMBERSHIP_CACHE_TIMEOUT", default=300
+)
+KINGDOM_STAT_SHEET_CACHE_TIMEOUT = env.int(
+    "KINGDOM_STAT_SHEET_CACHE_TIMEOUT", default=3600
+)
+KINGDOM_SIMULATION_CACHE_TIMEOUT = env.int(
+    "KINGDOM_SIMULATION_CACHE_TIMEOUT", default=3600
+)
+KINGDOM_FRAGMENT_CACHE_TIMEOUT = env.int("KINGDOM_FRAGMENT_CACHE_TIMEOUT", default=3600)
+
+
+# Broker fanning live turn events out to open pages; the default reaches
+# streams served by the same process. Idle streams get a comment this often
+# (seconds) so proxies keep them open.
+KINGDOM_LIVE_BROKER = env("KINGDOM_LIVE_BROKER", default="turns.live.LocalBroker")
+KINGDOM_LIVE_KEEPALIVE = env.int("KINGDOM_LIVE_KEEPALIVE", default=15)
+
+
+# Opt-in request profiling: per-view timings in a Server-Timing header and a
+# rolling histogram of the last PROFILING_SAMPLE_SIZE requests per URL name,
+# shown to staff at /profiling/.
+PROFILING_ENABLED = env.bool("DJANGO_PROFILING", default=False)
+PROFILING_SAMPLE_SIZE = env.int("PROFILING_SAMPLE_SIZE", default=500)
+
+
+# Prometheus metrics at /metrics, off by default. With METRICS_TOKEN set,
+# scrapers must send it as a bearer token. Under several gunicorn workers,
+# export PROMETHEUS_MULTIPROC_DIR (an empty directory, cleared before each
+# start) so the scrape sums every worker's figures.
+METRICS_ENABLED = env.bool("DJANGO_METRICS", default=False)
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
 AUTH_PASSWORD_VALIDATORS = [
     {
-        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+        "NAME": (
+            "django.contrib.auth.password_validation."
+            "UserAttributeSimilarityValidator"
+        ),
     },
     {
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
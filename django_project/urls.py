@@ -24,6 +24,10 @@ urlpatterns = [
     # User Management
     path("accounts/", include("allauth.urls")),
     # Local Apps
-    path("kingdoms/", include("kingdoms.urls")),  # Includes leadership, skills, turns
+    # Includes leadership, skills, territory and turns
+    path("kingdoms/", include("kingdoms.urls")),
+    path("api/v1/", include("api.urls")),
+    path("profiling/", include("profiler.urls")),
+    path("metrics", include("metrics.urls")),
     path("", include("pages.urls")),
 ]
@@ -4,7 +4,7 @@ from leadership.models import LeadershipAssignment
 from skills.models import KingdomSkillProficiency
 from turns.models import KingdomTurn
 
-from .models import Kingdom, KingdomMembership
+from .models import Kingdom, KingdomMembership, KingdomSummary
 
 
 class LeadershipAssignmentInline(admin.TabularInline):
@@ -30,6 +30,7 @@ class KingdomTurnInline(admin.TabularInline):
 class KingdomAdmin(admin.ModelAdmin):
     list_display = ["name", "level", "unrest"]
     search_fields = ["name"]
+    readonly_fields = ["claimed_hexes"]
     inlines = [
         LeadershipAssignmentInline,
         KingdomSkillProficiencyInline,
@@ -41,3 +42,23 @@ class KingdomAdmin(admin.ModelAdmin):
 class KingdomMembershipAdmin(admin.ModelAdmin):
     list_display = ["user", "kingdom", "role"]
     list_filter = ["role"]
+
+
+@admin.register(KingdomSummary)
+class KingdomSummaryAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "level",
+        "size_category",
+        "resource_points",
+        "unrest",
+        "current_turn_number",
+        "member_count",
+    ]
+    search_fields = ["name"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
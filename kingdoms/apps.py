@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class KingdomsConfig(AppConfig):
     name = "kingdoms"
+
+    def ready(self):
+        from . import signals  # noqa: F401
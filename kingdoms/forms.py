@@ -86,7 +86,6 @@ class KingdomUpdateForm(forms.ModelForm):
             "level",
             "xp",
             "unrest",
-            "claimed_hexes",
             "fame_points",
             "fame_type",
             "resource_points",
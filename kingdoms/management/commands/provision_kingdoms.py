@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from kingdoms.models import Kingdom
+from kingdoms.provisioning import provision_kingdoms
+
+MAX_COUNT = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Create a batch of kingdoms run by one GM, e.g. one per table at a "
+        "convention, and list each kingdom's invite link path."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int)
+        parser.add_argument("--gm", required=True, help="Username of the GM.")
+        parser.add_argument(
+            "--name",
+            default="Kingdom {n}",
+            help=(
+                'Kingdom name; "{n}" is replaced by its number '
+                '(default "Kingdom {n}").'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        if not 1 <= count <= MAX_COUNT:
+            raise CommandError(f"count must be between 1 and {MAX_COUNT}.")
+        try:
+            gm = get_user_model().objects.get(username=options["gm"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"User {options['gm']!r} does not exist.")
+        names = [options["name"].replace("{n}", str(n)) for n in range(1, count + 1)]
+        if any(
+            len(name) > Kingdom._meta.get_field("name").max_length for name in names
+        ):
+            raise CommandError("--name is too long.")
+
+        kingdoms = provision_kingdoms([Kingdom(name=name) for name in names], gm)
+        for kingdom in kingdoms:
+            join = reverse("kingdoms:join", kwargs={"invite_code": kingdom.invite_code})
+            self.stdout.write(f"{kingdom.name}\t{join}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Provisioned {len(kingdoms)} kingdoms for {gm}.")
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0014_move_turns"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="kingdom",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
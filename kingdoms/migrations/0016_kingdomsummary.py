@@ -0,0 +1,104 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0015_kingdom_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KingdomSummary",
+            fields=[
+                (
+                    "kingdom",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="kingdoms.kingdom",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("level", models.PositiveSmallIntegerField(default=1)),
+                (
+                    "charter",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("conquest", "Conquest"),
+                            ("expansion", "Expansion"),
+                            ("exploration", "Exploration"),
+                            ("grant", "Grant"),
+                            ("open", "Open"),
+                        ],
+                        max_length=11,
+                    ),
+                ),
+                (
+                    "government",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("despotism", "Despotism"),
+                            ("feudalism", "Feudalism"),
+                            ("oligarchy", "Oligarchy"),
+                            ("republic", "Republic"),
+                            ("thaumocracy", "Thaumocracy"),
+                            ("yeomanry", "Yeomanry"),
+                        ],
+                        max_length=11,
+                    ),
+                ),
+                (
+                    "heartland",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("forest_swamp", "Forest or Swamp"),
+                            ("hill_plain", "Hill or Plain"),
+                            ("lake_river", "Lake or River"),
+                            ("mountain_ruins", "Mountain or Ruins"),
+                        ],
+                        max_length=15,
+                    ),
+                ),
+                ("culture_score", models.PositiveSmallIntegerField(default=10)),
+                ("economy_score", models.PositiveSmallIntegerField(default=10)),
+                ("loyalty_score", models.PositiveSmallIntegerField(default=10)),
+                ("stability_score", models.PositiveSmallIntegerField(default=10)),
+                ("claimed_hexes", models.PositiveSmallIntegerField(default=0)),
+                ("size_category", models.CharField(max_length=9)),
+                ("resource_points", models.PositiveIntegerField(default=0)),
+                ("unrest", models.PositiveSmallIntegerField(default=0)),
+                ("fame_points", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "fame_type",
+                    models.CharField(
+                        choices=[("fame", "Fame"), ("infamy", "Infamy")],
+                        default="fame",
+                        max_length=6,
+                    ),
+                ),
+                (
+                    "current_turn_number",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("member_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "kingdom summaries",
+                "ordering": ["name", "pk"],
+                "indexes": [
+                    models.Index(
+                        fields=["name", "kingdom"], name="kingdoms_ki_name_9cfde3_idx"
+                    )
+                ],
+            },
+        ),
+    ]
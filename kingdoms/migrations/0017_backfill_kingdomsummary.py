@@ -0,0 +1,66 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:55
+
+from django.db import migrations
+from django.db.models import Count, Max
+
+SIZE_CATEGORIES = [
+    (9, "Territory"),
+    (24, "Province"),
+    (49, "State"),
+    (99, "Country"),
+    (None, "Dominion"),
+]
+
+KINGDOM_FIELDS = [
+    "name",
+    "level",
+    "charter",
+    "government",
+    "heartland",
+    "culture_score",
+    "economy_score",
+    "loyalty_score",
+    "stability_score",
+    "claimed_hexes",
+    "resource_points",
+    "unrest",
+    "fame_points",
+    "fame_type",
+]
+
+
+def size_category(hex_count):
+    for max_hexes, label in SIZE_CATEGORIES:
+        if max_hexes is None or hex_count <= max_hexes:
+            return label
+
+
+def backfill_summaries(apps, schema_editor):
+    Kingdom = apps.get_model("kingdoms", "Kingdom")
+    KingdomSummary = apps.get_model("kingdoms", "KingdomSummary")
+    kingdoms = Kingdom.objects.annotate(
+        latest_turn=Max("turns__turn_number"),
+        num_members=Count("kingdom_memberships", distinct=True),
+    )
+    KingdomSummary.objects.bulk_create(
+        KingdomSummary(
+            kingdom_id=kingdom.pk,
+            size_category=size_category(kingdom.claimed_hexes),
+            current_turn_number=kingdom.latest_turn,
+            member_count=kingdom.num_members,
+            **{field: getattr(kingdom, field) for field in KINGDOM_FIELDS},
+        )
+        for kingdom in kingdoms
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0016_kingdomsummary"),
+        ("turns", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 02:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0017_backfill_kingdomsummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="kingdom",
+            name="stats_version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
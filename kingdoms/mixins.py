@@ -1,7 +1,14 @@
+import hashlib
+
+from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import Http404
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 
-from .models import Kingdom, KingdomMembership, MembershipRole
+from .models import MembershipRole
+from .permissions import get_membership
 
 
 class KingdomAccessMixin(LoginRequiredMixin):
@@ -10,18 +17,16 @@ class KingdomAccessMixin(LoginRequiredMixin):
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
             return self.handle_no_permission()
-        try:
-            self.kingdom = Kingdom.objects.get(pk=self.kwargs["pk"])
-        except Kingdom.DoesNotExist:
-            raise Http404
-        try:
-            self.membership = KingdomMembership.objects.get(
-                user=request.user, kingdom=self.kingdom
-            )
-        except KingdomMembership.DoesNotExist:
+        self.membership = get_membership(request, self.kwargs["pk"])
+        self.kingdom = self.membership.kingdom
+        if not self.has_kingdom_permission():
             raise Http404
         return super().dispatch(request, *args, **kwargs)
 
+    def has_kingdom_permission(self):
+        """Extra check run after membership is resolved. Members pass by default."""
+        return True
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["kingdom"] = self.kingdom
@@ -33,20 +38,43 @@ class KingdomAccessMixin(LoginRequiredMixin):
 class GMRequiredMixin(KingdomAccessMixin):
     """Verify user is a GM of the kingdom."""
 
-    def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            return self.handle_no_permission()
-        try:
-            self.kingdom = Kingdom.objects.get(pk=self.kwargs["pk"])
-        except Kingdom.DoesNotExist:
-            raise Http404
-        try:
-            self.membership = KingdomMembership.objects.get(
-                user=request.user, kingdom=self.kingdom
-            )
-        except KingdomMembership.DoesNotExist:
-            raise Http404
-        if self.membership.role != MembershipRole.GM:
-            raise Http404
-        # Skip KingdomAccessMixin.dispatch to avoid duplicate lookups
-        return LoginRequiredMixin.dispatch(self, request, *args, **kwargs)
+    def has_kingdom_permission(self):
+        return self.membership.role == MembershipRole.GM
+
+
+class ConditionalGetMixin:
+    """Answer ``If-None-Match`` with 304 while the kingdom version is unchanged.
+
+    Use after ``KingdomAccessMixin``. Every write shown on a kingdom page
+    bumps ``Kingdom.version``, so the ETag hashes that with the viewing user
+    and CSRF secret (both shape the markup) and ``get_etag_parts()``. A match
+    returns before ``get()`` builds any context. Pages with pending flash
+    messages always render, so the messages are shown and consumed.
+    """
+
+    def get_etag_parts(self):
+        return ()
+
+    def get_etag(self):
+        get_token(self.request)  # Settles the CSRF secret the forms will use.
+        parts = (
+            self.kingdom.pk,
+            self.kingdom.version,
+            self.request.user.pk,
+            self.request.META["CSRF_COOKIE"],
+            *self.get_etag_parts(),
+        )
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+        return quote_etag(digest)
+
+    def get(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        response = None
+        if not len(messages.get_messages(request)):
+            response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response.headers["ETag"] = etag
+        # Browsers revalidate every load; shared caches never store the page.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
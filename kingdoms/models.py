@@ -1,9 +1,12 @@
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import cached_property
 
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 
 from .constants import AbilityScore, KingdomSkill
 
@@ -91,6 +94,20 @@ SIZE_CATEGORIES = [
 ]
 
 
+def size_info(hex_count):
+    """Return (size category, storage limit, resource die) for a hex count."""
+    for max_hexes, label, storage, die in SIZE_CATEGORIES:
+        if max_hexes is None or hex_count <= max_hexes:
+            return label, storage, die
+    return SIZE_CATEGORIES[-1][1:]  # pragma: no cover
+
+
+# Kingdom ids whose version bump is held until the enclosing
+# Kingdom.batched_version_bumps() block exits, each mapped to whether its
+# stats version moves too; None outside one.
+_pending_version_bumps = ContextVar("pending_version_bumps", default=None)
+
+
 class Kingdom(models.Model):
     name = models.CharField(max_length=100)
     invite_code = models.UUIDField(default=uuid.uuid4, unique=True)
@@ -176,7 +193,7 @@ class Kingdom(models.Model):
     decay_threshold = models.PositiveSmallIntegerField(default=10)
     decay_penalty = models.PositiveSmallIntegerField(default=0)
 
-    # Size (manual until Phase 3 hex tracking)
+    # Size: a counter kept by territory.Hex claims; full saves leave it alone
     claimed_hexes = models.PositiveSmallIntegerField(default=0)
 
     # Commodity stockpiles
@@ -193,14 +210,94 @@ class Kingdom(models.Model):
         related_name="kingdoms",
     )
 
+    # Bumped on every write that changes derived stats or the dashboard; keys
+    # dashboard fragments and ETags
+    version = models.PositiveIntegerField(default=1, editable=False)
+    # Bumped only by writes that change derived stats (the kingdom itself, its
+    # skills, leadership and hexes), not turns or activities; keys cached stat
+    # sheets and turn simulations
+    stats_version = models.PositiveIntegerField(default=1, editable=False)
+
     class Meta:
         ordering = ["name"]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        created = self._state.adding
+        if not created:
+            # Incremented in the database, so concurrent saves or a stale
+            # instance can't write a version that was already handed out.
+            self.version = models.F("version") + 1
+            self.stats_version = models.F("stats_version") + 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                # claimed_hexes moves by F() updates from territory.Hex; a full
+                # save of an instance loaded earlier must not write it back.
+                update_fields = [
+                    field.attname
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.attname != "claimed_hexes"
+                ]
+            kwargs["update_fields"] = {*update_fields, "version", "stats_version"}
+        self.__dict__.pop("stat_sheet", None)
+        self.__dict__.pop("_size_info", None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if not created:
+                self.refresh_from_db(
+                    fields=["version", "stats_version", "claimed_hexes"]
+                )
+            KingdomSummary.sync(self, created=created)
+
+    @classmethod
+    def bump_version(cls, kingdom_id, stats=False):
+        """Invalidate cached fragments after a write to a related row.
+
+        With ``stats``, for rows that feed the stat sheet, ``stats_version``
+        is bumped too. Returns False if the bump was held for a
+        ``batched_version_bumps`` block rather than written.
+        """
+        pending = _pending_version_bumps.get()
+        if pending is not None:
+            pending[kingdom_id] = pending.get(kingdom_id, False) or stats
+            return False
+        updates = {"version": models.F("version") + 1}
+        if stats:
+            updates["stats_version"] = models.F("stats_version") + 1
+        cls.objects.filter(pk=kingdom_id).update(**updates)
+        return True
+
+    @classmethod
+    @contextmanager
+    def batched_version_bumps(cls):
+        """Bump each kingdom written to inside the block once, on exit.
+
+        For saves of many related rows at once, such as a formset, which would
+        otherwise bump the version once per row.
+        """
+        if _pending_version_bumps.get() is not None:
+            yield  # Already inside a batch; the outer block bumps.
+            return
+        pending = {}
+        token = _pending_version_bumps.set(pending)
+        try:
+            yield
+        finally:
+            _pending_version_bumps.reset(token)
+            for kingdom_id, stats in sorted(pending.items()):
+                cls.bump_version(kingdom_id, stats=stats)
+
     # --- Computed properties ---
 
+    @cached_property
+    def stat_sheet(self):
+        """Derived stats for this stats version; see ``kingdoms.stats``."""
+        from .stats import get_stat_sheet
+
+        return get_stat_sheet(self)
+
     @property
     def charter_boost(self):
         if self.charter:
@@ -302,16 +399,12 @@ class Kingdom(models.Model):
 
     @property
     def hex_count(self):
-        """Number of claimed hexes. Uses manual field until Phase 3 hex model."""
+        """Number of claimed hexes, from the counter ``territory.Hex`` maintains."""
         return self.claimed_hexes
 
     @cached_property
     def _size_info(self):
-        count = self.hex_count
-        for max_hexes, label, storage, die in SIZE_CATEGORIES:
-            if max_hexes is None or count <= max_hexes:
-                return label, storage, die
-        return SIZE_CATEGORIES[-1][1:]  # pragma: no cover
+        return size_info(self.hex_count)
 
     @property
     def size_category(self):
@@ -357,13 +450,11 @@ class Kingdom(models.Model):
 
     def initialize_defaults(self):
         """Create the 8 leadership slots and 16 skill proficiency records."""
-        from leadership.models import LeadershipAssignment, LeadershipRole
-        from skills.models import KingdomSkillProficiency
+        from .provisioning import create_default_slots
 
-        for role in LeadershipRole:
-            LeadershipAssignment.objects.get_or_create(kingdom=self, role=role)
-        for skill in KingdomSkill:
-            KingdomSkillProficiency.objects.get_or_create(kingdom=self, skill=skill)
+        create_default_slots([self])
+        # The bulk inserts skip the signal that retires cached stat sheets.
+        Kingdom.bump_version(self.pk, stats=True)
 
 
 class KingdomMembership(models.Model):
@@ -388,3 +479,129 @@ class KingdomMembership(models.Model):
 
     def __str__(self):
         return f"{self.user} - {self.kingdom} ({self.get_role_display()})"
+
+
+class KingdomSummary(models.Model):
+    """Narrow, denormalized copy of what the kingdom list shows.
+
+    ``Kingdom.save`` rewrites it in the same transaction; turn and membership
+    signals refresh the counts. ``rebuild`` recomputes a row from scratch.
+    """
+
+    kingdom = models.OneToOneField(
+        Kingdom,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="summary",
+    )
+    name = models.CharField(max_length=100)
+    level = models.PositiveSmallIntegerField(default=1)
+    charter = models.CharField(max_length=11, choices=Charter, blank=True)
+    government = models.CharField(max_length=11, choices=Government, blank=True)
+    heartland = models.CharField(max_length=15, choices=Heartland, blank=True)
+    culture_score = models.PositiveSmallIntegerField(default=10)
+    economy_score = models.PositiveSmallIntegerField(default=10)
+    loyalty_score = models.PositiveSmallIntegerField(default=10)
+    stability_score = models.PositiveSmallIntegerField(default=10)
+    claimed_hexes = models.PositiveSmallIntegerField(default=0)
+    size_category = models.CharField(max_length=9)
+    resource_points = models.PositiveIntegerField(default=0)
+    unrest = models.PositiveSmallIntegerField(default=0)
+    fame_points = models.PositiveSmallIntegerField(default=0)
+    fame_type = models.CharField(
+        max_length=6,
+        choices=FameInfamyType,
+        default=FameInfamyType.FAME,
+    )
+    current_turn_number = models.PositiveSmallIntegerField(null=True, blank=True)
+    member_count = models.PositiveIntegerField(default=0)
+
+    # Copied from Kingdom as-is; everything else is derived.
+    KINGDOM_FIELDS = [
+        "name",
+        "level",
+        "charter",
+        "government",
+        "heartland",
+        "culture_score",
+        "economy_score",
+        "loyalty_score",
+        "stability_score",
+        "claimed_hexes",
+        "resource_points",
+        "unrest",
+        "fame_points",
+        "fame_type",
+    ]
+
+    class Meta:
+        ordering = ["name", "pk"]
+        indexes = [
+            # Keyset pagination seeks on (name, pk).
+            models.Index(fields=["name", "kingdom"]),
+        ]
+        verbose_name_plural = "kingdom summaries"
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def fields_from(cls, kingdom):
+        fields = {name: getattr(kingdom, name) for name in cls.KINGDOM_FIELDS}
+        fields["size_category"] = kingdom.size_category
+        return fields
+
+    @classmethod
+    def sync(cls, kingdom, created=False):
+        """Write the kingdom's own fields, leaving turn and member counts alone."""
+        fields = cls.fields_from(kingdom)
+        if created or not cls.objects.filter(pk=kingdom.pk).update(**fields):
+            cls.objects.create(kingdom=kingdom, **fields)
+
+    @classmethod
+    def rebuild(cls, kingdom):
+        """Recompute every column, counts included."""
+        cls.objects.update_or_create(
+            kingdom=kingdom,
+            defaults={
+                **cls.fields_from(kingdom),
+                "current_turn_number": kingdom.turns.aggregate(
+                    number=models.Max("turn_number")
+                )["number"],
+                "member_count": kingdom.kingdom_memberships.count(),
+            },
+        )
+
+    @classmethod
+    def refresh_size(cls, kingdom_id):
+        claimed = (
+            Kingdom.objects.filter(pk=kingdom_id)
+            .values_list("claimed_hexes", flat=True)
+            .first()
+        )
+        if claimed is not None:
+            cls.objects.filter(pk=kingdom_id).update(
+                claimed_hexes=claimed, size_category=size_info(claimed)[0]
+            )
+
+    @classmethod
+    def refresh_turn_number(cls, kingdom_id):
+        from turns.models import KingdomTurn
+
+        latest = KingdomTurn.objects.filter(kingdom_id=kingdom_id).order_by(
+            "-turn_number"
+        )
+        cls.objects.filter(pk=kingdom_id).update(
+            current_turn_number=models.Subquery(latest.values("turn_number")[:1])
+        )
+
+    @classmethod
+    def refresh_member_count(cls, kingdom_id):
+        members = (
+            KingdomMembership.objects.filter(kingdom_id=kingdom_id)
+            .values("kingdom_id")
+            .annotate(count=models.Count("pk"))
+        )
+        cls.objects.filter(pk=kingdom_id).update(
+            member_count=Coalesce(models.Subquery(members.values("count")[:1]), 0)
+        )
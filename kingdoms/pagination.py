@@ -0,0 +1,114 @@
+"""Keyset ("seek") pagination for list views.
+
+Instead of ``OFFSET``, each page filters on the ordering key of the last row
+seen, so every page is one indexed range scan no matter how deep it is. The
+position travels as an opaque ``?after=`` cursor.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class InvalidCursor(Exception):
+    """A cursor that is malformed or doesn't fit the ordering it's used with."""
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # Keep full microsecond precision: positions are compared exactly.
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, cls=_CursorEncoder).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor("Invalid page cursor.")
+    if not isinstance(values, list):
+        raise InvalidCursor("Invalid page cursor.")
+    return values
+
+
+def clean_cursor_values(queryset, ordering, values):
+    """Coerce decoded cursor ``values`` to the types of ``ordering``'s fields.
+
+    Keys are model fields of ``queryset`` or its annotations, so a tampered
+    cursor fails here rather than as a database error.
+
+    Raises:
+        InvalidCursor: If there is a value too many or too few, or one its
+            field can't hold.
+    """
+    if len(values) != len(ordering):
+        raise InvalidCursor("Invalid page cursor.")
+    opts = queryset.model._meta
+    cleaned = []
+    for key, value in zip(ordering, values):
+        name = key.lstrip("-")
+        if name in queryset.query.annotations:
+            field = queryset.query.annotations[name].output_field
+        else:
+            field = opts.pk if name == "pk" else opts.get_field(name)
+        try:
+            value = field.to_python(value)
+        except (ValidationError, TypeError, ValueError):
+            raise InvalidCursor("Invalid page cursor.")
+        if value is None:
+            raise InvalidCursor("Invalid page cursor.")
+        cleaned.append(value)
+    return cleaned
+
+
+def keyset_filter(ordering, values):
+    """Q matching rows strictly after ``values`` in ``ordering``."""
+    condition = Q()
+    for i in reversed(range(len(ordering))):
+        field = ordering[i].lstrip("-")
+        lookup = "lt" if ordering[i].startswith("-") else "gt"
+        step = Q(**{f"{field}__{lookup}": values[i]})
+        if i < len(ordering) - 1:
+            step |= Q(**{field: values[i]}) & condition
+        condition = step
+    return condition
+
+
+def keyset_paginate(queryset, ordering, cursor=None, per_page=25):
+    """Return ``(rows, next_cursor)`` for the page following ``cursor``.
+
+    ``ordering`` must end in a unique field (usually the primary key) so
+    every row has a distinct position. ``queryset`` may yield model
+    instances or ``values()`` dicts that include the ordering keys.
+    ``next_cursor`` is ``None`` on the last page.
+
+    Raises:
+        InvalidCursor: If ``cursor`` is malformed or doesn't fit ``ordering``.
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        values = clean_cursor_values(queryset, ordering, decode_cursor(cursor))
+        queryset = queryset.filter(keyset_filter(ordering, values))
+    rows = list(queryset[: per_page + 1])
+    if len(rows) <= per_page:
+        return rows, None
+    rows = rows[:per_page]
+    last = rows[-1]
+    keys = [field.lstrip("-") for field in ordering]
+    if isinstance(last, dict):
+        next_cursor = encode_cursor([last[key] for key in keys])
+    else:
+        next_cursor = encode_cursor([getattr(last, key) for key in keys])
+    return rows, next_cursor
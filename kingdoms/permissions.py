@@ -0,0 +1,82 @@
+"""Kingdom permission resolution shared by the access mixins and views.
+
+Lookups go through two layers: a per-request memo, then Django's cache keyed
+on (user, kingdom). Cached memberships carry only their own fields; the
+kingdom loads lazily when a view touches ``membership.kingdom``, so a warm
+permission check costs no queries. ``kingdoms.signals`` keeps the cache in
+step with ``KingdomMembership`` writes.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import Http404
+
+from metrics.collectors import record_cache_lookup
+
+from .models import KingdomMembership
+
+# Attribute on the request holding memberships resolved during this request.
+_REQUEST_MEMO_ATTR = "_kingdom_memberships"
+
+_CACHED_FIELDS = ("id", "user_id", "kingdom_id", "role", "character_name")
+_NOT_A_MEMBER = "none"
+
+
+def membership_cache_key(user_id, kingdom_id):
+    return f"kingdoms:membership:{kingdom_id}:{user_id}"
+
+
+def _load_membership(user_id, kingdom_id):
+    key = membership_cache_key(user_id, kingdom_id)
+    cached = cache.get(key)
+    record_cache_lookup("membership", hit=cached is not None)
+    if cached == _NOT_A_MEMBER:
+        return None
+    if cached is not None:
+        return KingdomMembership.from_db(DEFAULT_DB_ALIAS, _CACHED_FIELDS, cached)
+
+    membership = (
+        KingdomMembership.objects.select_related("kingdom")
+        .filter(user_id=user_id, kingdom_id=kingdom_id)
+        .first()
+    )
+    if membership is None:
+        value = _NOT_A_MEMBER
+    else:
+        value = tuple(getattr(membership, field) for field in _CACHED_FIELDS)
+    cache.set(key, value, settings.KINGDOM_MEMBERSHIP_CACHE_TIMEOUT)
+    return membership
+
+
+def get_membership(request, kingdom_pk):
+    """Return the requesting user's membership for ``kingdom_pk``.
+
+    On a cache miss the membership, its kingdom and role come back from a
+    single joined query. Results are memoized on the request, so nested
+    mixins and views resolving the same kingdom never look it up twice.
+
+    Raises:
+        Http404: If the kingdom does not exist or the user is not a member.
+    """
+    memo = request.__dict__.setdefault(_REQUEST_MEMO_ATTR, {})
+    key = int(kingdom_pk)
+    if key not in memo:
+        memo[key] = _load_membership(request.user.pk, key)
+    membership = memo[key]
+    if membership is None:
+        raise Http404
+    return membership
+
+
+def invalidate_membership(user_id, kingdom_id):
+    """Drop the cached lookup for one (user, kingdom) pair."""
+    cache.delete(membership_cache_key(user_id, kingdom_id))
+
+
+def invalidate_kingdom_memberships(kingdom):
+    """Drop cached lookups for every current member of ``kingdom``."""
+    user_ids = kingdom.kingdom_memberships.values_list("user_id", flat=True)
+    cache.delete_many(
+        [membership_cache_key(user_id, kingdom.pk) for user_id in user_ids]
+    )
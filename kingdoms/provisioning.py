@@ -0,0 +1,82 @@
+"""Creating kingdoms with their default rows and GM.
+
+A new kingdom gets one leadership slot per role, one proficiency per skill,
+a GM membership and a list summary. ``provision_kingdoms`` writes any number
+of kingdoms with all of that in one transaction and a fixed handful of
+queries: a ``bulk_create`` per table instead of a ``save()`` per row. The
+bulk inserts skip ``Kingdom.save()`` and the membership signals, so the
+summary rows and membership cache are seen to here.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+
+from leadership.models import LeadershipAssignment, LeadershipRole
+from skills.models import KingdomSkillProficiency
+
+from .constants import KingdomSkill
+from .models import Kingdom, KingdomMembership, KingdomSummary, MembershipRole
+from .permissions import membership_cache_key
+
+BATCH_SIZE = 500
+
+
+def create_default_slots(kingdoms):
+    """Add any missing leadership slots and skill proficiencies to ``kingdoms``.
+
+    Existing rows are left alone, so this is safe to repeat.
+    """
+    LeadershipAssignment.objects.bulk_create(
+        [
+            LeadershipAssignment(kingdom=kingdom, role=role)
+            for kingdom in kingdoms
+            for role in LeadershipRole
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    KingdomSkillProficiency.objects.bulk_create(
+        [
+            KingdomSkillProficiency(kingdom=kingdom, skill=skill)
+            for kingdom in kingdoms
+            for skill in KingdomSkill
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def provision_kingdoms(kingdoms, gm):
+    """Save the unsaved ``kingdoms`` with their defaults and ``gm`` as their GM.
+
+    Returns the saved kingdoms.
+    """
+    with transaction.atomic():
+        kingdoms = Kingdom.objects.bulk_create(kingdoms, batch_size=BATCH_SIZE)
+        create_default_slots(kingdoms)
+        KingdomMembership.objects.bulk_create(
+            [
+                KingdomMembership(user=gm, kingdom=kingdom, role=MembershipRole.GM)
+                for kingdom in kingdoms
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        KingdomSummary.objects.bulk_create(
+            [
+                KingdomSummary(
+                    kingdom=kingdom,
+                    member_count=1,
+                    **KingdomSummary.fields_from(kingdom)
+                )
+                for kingdom in kingdoms
+            ],
+            batch_size=BATCH_SIZE,
+        )
+    # A lookup made before the kingdom existed may have cached "not a member".
+    cache.delete_many([membership_cache_key(gm.pk, kingdom.pk) for kingdom in kingdoms])
+    return kingdoms
+
+
+def provision_kingdom(kingdom, gm):
+    """``provision_kingdoms`` for a single kingdom; returns it saved."""
+    return provision_kingdoms([kingdom], gm)[0]
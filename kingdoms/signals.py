@@ -0,0 +1,69 @@
+"""Signal handlers keeping cached kingdom data in step with the database."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from leadership.models import LeadershipAssignment
+from skills.models import KingdomSkillProficiency
+from turns.models import ActivityLog, KingdomTurn
+
+from .models import Kingdom, KingdomMembership, KingdomSummary
+from .permissions import invalidate_membership
+
+# Related rows that feed the stat sheet; other writes leave it cached.
+STATS_SENDERS = (KingdomSkillProficiency, LeadershipAssignment)
+
+
+@receiver(post_save, sender=KingdomMembership)
+@receiver(post_delete, sender=KingdomMembership)
+def invalidate_cached_membership(sender, instance, **kwargs):
+    invalidate_membership(instance.user_id, instance.kingdom_id)
+
+
+@receiver(post_save, sender=KingdomMembership)
+@receiver(post_delete, sender=KingdomMembership)
+def refresh_summary_member_count(sender, instance, origin=None, **kwargs):
+    if kwargs.get("signal") is post_save and not kwargs.get("created"):
+        return  # Role and name edits don't change the count.
+    if isinstance(origin, Kingdom):
+        return
+    KingdomSummary.refresh_member_count(instance.kingdom_id)
+
+
+@receiver(post_save, sender=KingdomTurn)
+@receiver(post_delete, sender=KingdomTurn)
+def refresh_summary_turn_number(sender, instance, origin=None, **kwargs):
+    if kwargs.get("signal") is post_save and not kwargs.get("created"):
+        return
+    if isinstance(origin, Kingdom):
+        return
+    KingdomSummary.refresh_turn_number(instance.kingdom_id)
+
+
+@receiver(post_save, sender=KingdomSkillProficiency)
+@receiver(post_delete, sender=KingdomSkillProficiency)
+@receiver(post_save, sender=LeadershipAssignment)
+@receiver(post_delete, sender=LeadershipAssignment)
+@receiver(post_save, sender=KingdomMembership)
+@receiver(post_delete, sender=KingdomMembership)
+@receiver(post_save, sender=KingdomTurn)
+@receiver(post_delete, sender=KingdomTurn)
+@receiver(post_save, sender=ActivityLog)
+@receiver(post_delete, sender=ActivityLog)
+def bump_kingdom_version(sender, instance, origin=None, **kwargs):
+    """Retire cached stat sheets and dashboard fragments when their rows change."""
+    if isinstance(origin, Kingdom):
+        return  # The kingdom itself is being deleted.
+    if isinstance(origin, KingdomTurn) and origin is not instance:
+        return  # Deleted along with its turn, which bumps once.
+    stats = sender in STATS_SENDERS
+    bumped = Kingdom.bump_version(instance.kingdom_id, stats=stats)
+    if sender.kingdom.is_cached(instance):
+        kingdom = instance.kingdom
+        # Mirror the F() increments bump_version wrote to the row.
+        if bumped:
+            kingdom.version += 1
+        if stats:
+            if bumped:
+                kingdom.stats_version += 1
+            kingdom.__dict__.pop("stat_sheet", None)
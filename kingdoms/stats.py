@@ -0,0 +1,225 @@
+"""Kingdom stat sheet: every derived number for a kingdom, computed once.
+
+``Kingdom`` exposes its derived values (modifiers, control DC, size info) as
+properties that recompute on every access, and skill/leadership rows each
+reach back into the kingdom for their bonuses. ``KingdomStatSheet`` folds all
+of that into one immutable snapshot per stats version so views, forms and
+any API read plain attributes instead.
+
+Sheets are cached under ``(kingdom.pk, kingdom.stats_version)``;
+``Kingdom.save``, hex claims and the leadership/skill signal handlers bump
+it, so a cached sheet is never stale. Turn and activity writes don't, so
+logging a turn leaves the sheet cached.
+"""
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from metrics.collectors import record_cache_lookup
+
+from .constants import PROFICIENCY_BONUS, AbilityScore, KingdomSkill, Proficiency
+
+# Ruin category whose penalty applies to checks using each ability.
+RUIN_BY_ABILITY = {
+    AbilityScore.CULTURE: "corruption",
+    AbilityScore.ECONOMY: "crime",
+    AbilityScore.LOYALTY: "strife",
+    AbilityScore.STABILITY: "decay",
+}
+
+
+def proficiency_bonus(level, proficiency):
+    """Level plus rank bonus; untrained skills add nothing."""
+    bonus = PROFICIENCY_BONUS.get(proficiency, 0)
+    if bonus == 0:
+        return 0
+    return level + bonus
+
+
+def status_bonus(level):
+    """Status bonus an invested leader grants at the given kingdom level."""
+    if level >= 16:
+        return 3
+    if level >= 8:
+        return 2
+    return 1
+
+
+@dataclass(frozen=True, slots=True)
+class AbilityEffect:
+    source: str
+    type: str
+    free: bool
+
+
+@dataclass(frozen=True, slots=True)
+class AbilityLine:
+    ability: str
+    label: str
+    score: int
+    modifier: int
+    ruin: str
+    ruin_points: int
+    ruin_threshold: int
+    ruin_penalty: int
+    status_bonus: int
+    effects: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class SkillLine:
+    skill: str
+    label: str
+    ability: str
+    proficiency: str
+    proficiency_label: str
+    ability_modifier: int
+    proficiency_bonus: int
+    status_bonus: int
+    unrest_penalty: int
+    ruin_penalty: int
+    government_boosted: bool
+
+    @property
+    def total(self):
+        """Skill modifier: ability + proficiency + status bonus - penalties."""
+        return (
+            self.ability_modifier
+            + self.proficiency_bonus
+            + self.status_bonus
+            + self.unrest_penalty
+            - self.ruin_penalty
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class KingdomStatSheet:
+    kingdom_id: int
+    stats_version: int
+    level: int
+    abilities: tuple
+    skills: tuple
+    control_dc: int
+    size_category: str
+    size_modifier: int
+    commodity_storage_limit: int
+    resource_die_type: str
+    unrest_penalty: int
+
+    def ability(self, ability):
+        for line in self.abilities:
+            if line.ability == ability:
+                return line
+        raise KeyError(ability)
+
+    def skill(self, skill):
+        for line in self.skills:
+            if line.skill == skill:
+                return line
+        raise KeyError(skill)
+
+    def skills_for(self, ability):
+        return [line for line in self.skills if line.ability == ability]
+
+    @classmethod
+    def build(cls, kingdom, proficiencies=None, leadership=None):
+        """Compute a sheet from a kingdom and its skill and leadership rows.
+
+        Rows not passed in are loaded, one query each.
+        """
+        from leadership.models import ROLE_KEY_ABILITY
+        from skills.models import SKILL_KEY_ABILITY
+
+        if proficiencies is None:
+            proficiencies = kingdom.skill_proficiencies.all()
+        if leadership is None:
+            leadership = kingdom.leadership_assignments.all()
+
+        # Status bonuses don't stack, so one invested leader per ability is enough.
+        invested = {
+            ROLE_KEY_ABILITY[assignment.role]
+            for assignment in leadership
+            if assignment.is_invested and not assignment.is_vacant
+        }
+        leader_bonus = status_bonus(kingdom.level)
+
+        effects = kingdom.get_ability_effects()
+        abilities = []
+        for ability in AbilityScore:
+            ruin = RUIN_BY_ABILITY[ability]
+            abilities.append(
+                AbilityLine(
+                    ability=ability.value,
+                    label=ability.label,
+                    score=getattr(kingdom, f"{ability.value}_score"),
+                    modifier=kingdom.get_ability_modifier(ability.value),
+                    ruin=ruin,
+                    ruin_points=getattr(kingdom, f"{ruin}_points"),
+                    ruin_threshold=getattr(kingdom, f"{ruin}_threshold"),
+                    ruin_penalty=getattr(kingdom, f"{ruin}_penalty"),
+                    status_bonus=leader_bonus if ability in invested else 0,
+                    effects=tuple(
+                        AbilityEffect(**effect) for effect in effects[ability.label]
+                    ),
+                )
+            )
+        ability_lines = {line.ability: line for line in abilities}
+
+        unrest_penalty = kingdom.unrest_penalty
+        government_skills = kingdom.government_skill_boosts
+        proficiency_by_skill = {row.skill: row for row in proficiencies}
+        skills = []
+        for skill in KingdomSkill:
+            row = proficiency_by_skill.get(skill.value)
+            proficiency = Proficiency(row.proficiency if row else Proficiency.UNTRAINED)
+            line = ability_lines[SKILL_KEY_ABILITY[skill]]
+            skills.append(
+                SkillLine(
+                    skill=skill.value,
+                    label=skill.label,
+                    ability=line.ability,
+                    proficiency=proficiency.value,
+                    proficiency_label=proficiency.label,
+                    ability_modifier=line.modifier,
+                    proficiency_bonus=proficiency_bonus(kingdom.level, proficiency),
+                    status_bonus=line.status_bonus,
+                    unrest_penalty=unrest_penalty,
+                    ruin_penalty=line.ruin_penalty,
+                    government_boosted=skill.value in government_skills,
+                )
+            )
+
+        return cls(
+            kingdom_id=kingdom.pk,
+            stats_version=kingdom.stats_version,
+            level=kingdom.level,
+            abilities=tuple(abilities),
+            skills=tuple(skills),
+            control_dc=kingdom.control_dc,
+            size_category=kingdom.size_category,
+            size_modifier=kingdom.size_modifier,
+            commodity_storage_limit=kingdom.commodity_storage_limit,
+            resource_die_type=kingdom.resource_die_type,
+            unrest_penalty=unrest_penalty,
+        )
+
+
+def stat_sheet_cache_key(kingdom_id, stats_version):
+    return f"kingdoms:statsheet:{kingdom_id}:{stats_version}"
+
+
+def get_stat_sheet(kingdom, proficiencies=None, leadership=None):
+    """Return the cached stat sheet for the kingdom's current stats version.
+
+    ``proficiencies`` and ``leadership`` let callers that already loaded those
+    rows skip the queries a cache miss would otherwise run.
+    """
+    key = stat_sheet_cache_key(kingdom.pk, kingdom.stats_version)
+    sheet = cache.get(key)
+    record_cache_lookup("stat_sheet", hit=sheet is not None)
+    if sheet is None:
+        sheet = KingdomStatSheet.build(kingdom, proficiencies, leadership)
+        cache.set(key, sheet, settings.KINGDOM_STAT_SHEET_CACHE_TIMEOUT)
+    return sheet
@@ -0,0 +1,47 @@
+"""Test helpers shared by the kingdom-related apps."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """Assertions that pin the number of SQL queries a view may issue.
+
+    Mix into a ``TestCase``. ``assertQueryBudget`` fails when a request runs
+    more queries than its budget; ``assertQueriesDoNotScale`` fails when adding
+    rows (roles, skills, turns, activities) changes the query count at all.
+    """
+
+    def _capture(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(url, data or {})
+        return response, ctx.captured_queries
+
+    def _format_queries(self, queries):
+        return "\n".join(
+            f"{i}. {query['sql']}" for i, query in enumerate(queries, start=1)
+        )
+
+    def assertQueryBudget(self, budget, url, method="get", data=None, status=200):
+        """Request ``url`` and assert it runs at most ``budget`` queries."""
+        response, queries = self._capture(method, url, data)
+        self.assertEqual(response.status_code, status)
+        self.assertLessEqual(
+            len(queries),
+            budget,
+            f"{method.upper()} {url} ran {len(queries)} queries "
+            f"(budget {budget}):\n{self._format_queries(queries)}",
+        )
+        return response
+
+    def assertQueriesDoNotScale(self, url, grow, method="get", data=None):
+        """Assert the query count for ``url`` is unchanged after ``grow()``."""
+        _, before = self._capture(method, url, data)
+        grow()
+        _, after = self._capture(method, url, data)
+        self.assertEqual(
+            len(before),
+            len(after),
+            f"{method.upper()} {url} went from {len(before)} to {len(after)} "
+            f"queries as data grew:\n{self._format_queries(after)}",
+        )
@@ -1,8 +1,19 @@
+import io
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db.models import Max
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 
-from .models import Kingdom, KingdomMembership, MembershipRole
+from .models import Kingdom, KingdomMembership, KingdomSummary, MembershipRole
+from .pagination import encode_cursor
+from .permissions import get_membership, membership_cache_key
+from .provisioning import provision_kingdom, provision_kingdoms
+from .stats import KingdomStatSheet, get_stat_sheet, stat_sheet_cache_key
+from .testing import QueryBudgetMixin
 
 User = get_user_model()
 
@@ -105,8 +116,59 @@ class KingdomModelTests(TestCase):
         self.assertEqual(self.kingdom.skill_proficiencies.count(), 16)
 
 
+class ProvisioningTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm", email="gm@example.com", password=TEST_PASSWORD
+        )
+
+    def test_provision_kingdom(self):
+        kingdom = provision_kingdom(Kingdom(name="Stolen Lands"), self.gm)
+        self.assertIsNotNone(kingdom.pk)
+        self.assertEqual(kingdom.leadership_assignments.count(), 8)
+        self.assertEqual(kingdom.skill_proficiencies.count(), 16)
+        membership = kingdom.kingdom_memberships.get()
+        self.assertEqual((membership.user, membership.role), (self.gm, "gm"))
+        summary = KingdomSummary.objects.get(pk=kingdom.pk)
+        self.assertEqual((summary.name, summary.member_count), ("Stolen Lands", 1))
+
+    def test_query_count_does_not_grow_with_kingdoms(self):
+        with self.assertNumQueries(7):
+            provision_kingdoms([Kingdom(name="Solo")], self.gm)
+        with self.assertNumQueries(7):
+            kingdoms = provision_kingdoms(
+                [Kingdom(name=f"Table {n}") for n in range(10)], self.gm
+            )
+        self.assertEqual(len(kingdoms), 10)
+        self.assertEqual(KingdomMembership.objects.filter(user=self.gm).count(), 11)
+
+    def test_clears_cached_non_membership(self):
+        self.client.force_login(self.gm)
+        next_pk = (Kingdom.objects.aggregate(pk=Max("pk"))["pk"] or 0) + 1
+        url = reverse("kingdoms:kingdom_detail", kwargs={"pk": next_pk})
+        self.assertEqual(self.client.get(url).status_code, 404)
+        kingdom = provision_kingdom(Kingdom(name="Fresh"), self.gm)
+        self.assertEqual(kingdom.pk, next_pk)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command(
+            "provision_kingdoms", "3", "--gm=gm", "--name=Table {n}", stdout=out
+        )
+        self.assertEqual(
+            list(Kingdom.objects.order_by("pk").values_list("name", flat=True)),
+            ["Table 1", "Table 2", "Table 3"],
+        )
+        self.assertIn("/join/", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("provision_kingdoms", "3", "--gm=nobody", stdout=out)
+
+
 class KingdomMembershipTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
@@ -136,6 +198,7 @@ class KingdomMembershipTests(TestCase):
 
 class KingdomListViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
@@ -167,8 +230,143 @@ class KingdomListViewTests(TestCase):
         self.assertNotContains(response, "Other Kingdom")
 
 
+class KingdomListPaginationTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password=TEST_PASSWORD,
+        )
+        for i in range(30):
+            kingdom = Kingdom.objects.create(name=f"Kingdom {i:02d}")
+            KingdomMembership.objects.create(
+                user=self.user, kingdom=kingdom, role=MembershipRole.GM
+            )
+        self.client.force_login(self.user)
+        self.url = reverse("kingdoms:kingdom_list")
+
+    def test_pages_follow_cursor(self):
+        first = self.client.get(self.url)
+        names = [k.name for k in first.context["kingdoms"]]
+        self.assertEqual(names[0], "Kingdom 00")
+        self.assertEqual(len(names), 24)
+
+        second = self.client.get(self.url, {"after": first.context["next_cursor"]})
+        names = [k.name for k in second.context["kingdoms"]]
+        self.assertEqual(names, [f"Kingdom {i}" for i in range(24, 30)])
+        self.assertIsNone(second.context["next_cursor"])
+
+    def test_duplicate_names_are_not_skipped(self):
+        for _ in range(30):
+            kingdom = Kingdom.objects.create(name="Kingdom 23")
+            KingdomMembership.objects.create(
+                user=self.user, kingdom=kingdom, role=MembershipRole.PLAYER
+            )
+        seen = []
+        cursor = None
+        while True:
+            params = {"after": cursor} if cursor else {}
+            response = self.client.get(self.url, params)
+            seen += [k.pk for k in response.context["kingdoms"]]
+            cursor = response.context["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(len(seen), 60)
+        self.assertEqual(len(set(seen)), 60)
+
+    def test_deep_page_stays_within_budget(self):
+        first = self.client.get(self.url)
+        self.assertQueryBudget(3, f"{self.url}?after={first.context['next_cursor']}")
+
+    def test_invalid_cursor_404(self):
+        response = self.client.get(self.url, {"after": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_mistyped_cursor_404(self):
+        # Well-formed cursors whose values don't fit the (name, pk) ordering.
+        for values in (["Alpha", "one"], ["Alpha", None], ["Alpha", [1]]):
+            with self.subTest(values=values):
+                response = self.client.get(self.url, {"after": encode_cursor(values)})
+                self.assertEqual(response.status_code, 404)
+
+
+class KingdomSummaryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+
+    def test_created_with_kingdom(self):
+        summary = self.kingdom.summary
+        self.assertEqual(summary.name, "Test Kingdom")
+        self.assertEqual(summary.size_category, "Territory")
+        self.assertEqual(summary.member_count, 0)
+        self.assertIsNone(summary.current_turn_number)
+
+    def test_kingdom_save_updates_summary(self):
+        self.kingdom.unrest = 4
+        self.kingdom.save()
+        summary = KingdomSummary.objects.get(pk=self.kingdom.pk)
+        self.assertEqual(summary.unrest, 4)
+
+    def test_stale_save_keeps_hex_count(self):
+        from territory.hexgrid import claim_hex
+
+        stale = Kingdom.objects.get(pk=self.kingdom.pk)
+        for q in range(10):
+            claim_hex(self.kingdom, q, 0)
+        stale.unrest = 4
+        stale.save()
+        self.assertEqual(stale.claimed_hexes, 10)
+        self.assertEqual(Kingdom.objects.get(pk=self.kingdom.pk).claimed_hexes, 10)
+        summary = KingdomSummary.objects.get(pk=self.kingdom.pk)
+        self.assertEqual((summary.unrest, summary.size_category), (4, "Province"))
+
+    def test_member_count_follows_memberships(self):
+        membership = KingdomMembership.objects.create(
+            user=self.user, kingdom=self.kingdom, role=MembershipRole.GM
+        )
+        self.assertEqual(KingdomSummary.objects.get(pk=self.kingdom.pk).member_count, 1)
+        membership.delete()
+        self.assertEqual(KingdomSummary.objects.get(pk=self.kingdom.pk).member_count, 0)
+
+    def test_turn_number_follows_turns(self):
+        from turns.models import KingdomTurn
+
+        KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        latest = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=2)
+        summary = KingdomSummary.objects.get(pk=self.kingdom.pk)
+        self.assertEqual(summary.current_turn_number, 2)
+        latest.delete()
+        summary.refresh_from_db()
+        self.assertEqual(summary.current_turn_number, 1)
+
+    def test_hex_claims_update_size(self):
+        from territory.hexgrid import claim_hex
+
+        for q in range(10):
+            claim_hex(self.kingdom, q, 0)
+        summary = KingdomSummary.objects.get(pk=self.kingdom.pk)
+        self.assertEqual(summary.claimed_hexes, 10)
+        self.assertEqual(summary.size_category, "Province")
+
+    def test_rebuild(self):
+        KingdomMembership.objects.create(
+            user=self.user, kingdom=self.kingdom, role=MembershipRole.GM
+        )
+        KingdomSummary.objects.all().delete()
+        KingdomSummary.rebuild(self.kingdom)
+        self.assertEqual(KingdomSummary.objects.get(pk=self.kingdom.pk).member_count, 1)
+
+
 class KingdomCreateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username="testuser",
             email="test@example.com",
@@ -215,6 +413,7 @@ class KingdomCreateViewTests(TestCase):
 
 class KingdomDetailViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -270,6 +469,7 @@ class KingdomDetailViewTests(TestCase):
 
 class KingdomUpdateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -316,7 +516,6 @@ class KingdomUpdateViewTests(TestCase):
             "level": 3,
             "xp": 500,
             "unrest": 2,
-            "claimed_hexes": 5,
             "fame_points": 1,
             "fame_type": "fame",
             "resource_points": 50,
@@ -353,6 +552,7 @@ class KingdomUpdateViewTests(TestCase):
 
 class MemberManageViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -422,6 +622,7 @@ class MemberManageViewTests(TestCase):
 
 class JoinKingdomViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username="newplayer",
             email="newplayer@example.com",
@@ -483,6 +684,7 @@ class JoinKingdomViewTests(TestCase):
 
 class RegenerateInviteViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -522,6 +724,7 @@ class RegenerateInviteViewTests(TestCase):
 
 class KingdomDeleteViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -571,6 +774,7 @@ class KingdomDeleteViewTests(TestCase):
 
 class UpdateCharacterNameViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username="player",
             email="player@example.com",
@@ -615,6 +819,7 @@ class KingdomAccessMixinTests(TestCase):
     """Direct tests for KingdomAccessMixin behavior."""
 
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -690,6 +895,7 @@ class GMRequiredMixinTests(TestCase):
     """Direct tests for GMRequiredMixin behavior."""
 
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -749,3 +955,588 @@ class GMRequiredMixinTests(TestCase):
         self.client.force_login(self.gm)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
+
+
+class GetMembershipTests(TestCase):
+    """Tests for the shared permission-resolution helper."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.membership = KingdomMembership.objects.create(
+            user=self.user,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+
+    def test_single_query_with_kingdom_joined(self):
+        with self.assertNumQueries(1):
+            membership = get_membership(self.request, self.kingdom.pk)
+            self.assertEqual(membership.kingdom.name, "Test Kingdom")
+        self.assertEqual(membership, self.membership)
+
+    def test_memoized_per_request(self):
+        get_membership(self.request, self.kingdom.pk)
+        with self.assertNumQueries(0):
+            get_membership(self.request, self.kingdom.pk)
+
+    def test_non_member_raises_404_and_is_memoized(self):
+        outsider = User.objects.create_user(
+            username="outsider",
+            email="outsider@example.com",
+            password=TEST_PASSWORD,
+        )
+        request = RequestFactory().get("/")
+        request.user = outsider
+        with self.assertRaises(Http404):
+            get_membership(request, self.kingdom.pk)
+        with self.assertNumQueries(0), self.assertRaises(Http404):
+            get_membership(request, self.kingdom.pk)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class MembershipCacheTests(TestCase):
+    """Membership lookups are cached per (user, kingdom) and invalidated on writes."""
+
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.player_membership = KingdomMembership.objects.create(
+            user=self.player,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+            character_name="Linzi",
+        )
+
+    def _request(self, user):
+        request = RequestFactory().get("/")
+        request.user = user
+        return request
+
+    def test_warm_lookup_costs_no_queries(self):
+        get_membership(self._request(self.player), self.kingdom.pk)
+        with self.assertNumQueries(0):
+            membership = get_membership(self._request(self.player), self.kingdom.pk)
+        self.assertEqual(membership.pk, self.player_membership.pk)
+        self.assertEqual(membership.role, MembershipRole.PLAYER)
+        self.assertEqual(membership.character_name, "Linzi")
+
+    def test_cached_membership_loads_kingdom_lazily(self):
+        get_membership(self._request(self.player), self.kingdom.pk)
+        membership = get_membership(self._request(self.player), self.kingdom.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(membership.kingdom, self.kingdom)
+
+    def test_non_member_is_cached(self):
+        outsider = User.objects.create_user(
+            username="outsider",
+            email="outsider@example.com",
+            password=TEST_PASSWORD,
+        )
+        with self.assertRaises(Http404):
+            get_membership(self._request(outsider), self.kingdom.pk)
+        with self.assertNumQueries(0), self.assertRaises(Http404):
+            get_membership(self._request(outsider), self.kingdom.pk)
+
+    def test_save_invalidates(self):
+        get_membership(self._request(self.player), self.kingdom.pk)
+        self.player_membership.role = MembershipRole.GM
+        self.player_membership.save()
+        membership = get_membership(self._request(self.player), self.kingdom.pk)
+        self.assertEqual(membership.role, MembershipRole.GM)
+
+    def test_delete_invalidates(self):
+        get_membership(self._request(self.player), self.kingdom.pk)
+        self.player_membership.delete()
+        with self.assertRaises(Http404):
+            get_membership(self._request(self.player), self.kingdom.pk)
+
+    def test_join_invalidates_cached_non_membership(self):
+        joiner = User.objects.create_user(
+            username="joiner",
+            email="joiner@example.com",
+            password=TEST_PASSWORD,
+        )
+        with self.assertRaises(Http404):
+            get_membership(self._request(joiner), self.kingdom.pk)
+        self.client.force_login(joiner)
+        self.client.get(
+            reverse("kingdoms:join", kwargs={"invite_code": self.kingdom.invite_code})
+        )
+        membership = get_membership(self._request(joiner), self.kingdom.pk)
+        self.assertEqual(membership.role, MembershipRole.PLAYER)
+
+    def test_member_removal_revokes_access(self):
+        self.client.force_login(self.player)
+        detail_url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        self.assertEqual(self.client.get(detail_url).status_code, 200)
+        self.client.force_login(self.gm)
+        self.client.post(
+            reverse("kingdoms:member_manage", kwargs={"pk": self.kingdom.pk}),
+            {"membership_id": self.player_membership.pk},
+        )
+        self.client.force_login(self.player)
+        self.assertEqual(self.client.get(detail_url).status_code, 404)
+
+    def test_regenerate_invite_invalidates_members(self):
+        get_membership(self._request(self.player), self.kingdom.pk)
+        self.client.force_login(self.gm)
+        self.client.post(
+            reverse("kingdoms:regenerate_invite", kwargs={"pk": self.kingdom.pk})
+        )
+        self.assertIsNone(
+            cache.get(membership_cache_key(self.player.pk, self.kingdom.pk))
+        )
+
+
+class KingdomStatSheetTests(TestCase):
+    def setUp(self):
+        self.kingdom = Kingdom.objects.create(
+            name="Test Kingdom",
+            level=8,
+            government="despotism",
+            loyalty_score=14,
+            unrest=5,
+            strife_penalty=1,
+            claimed_hexes=30,
+        )
+        self.kingdom.initialize_defaults()
+        self.kingdom.refresh_from_db()
+
+    def test_matches_kingdom_properties(self):
+        sheet = KingdomStatSheet.build(self.kingdom)
+        self.assertEqual(sheet.control_dc, self.kingdom.control_dc)
+        self.assertEqual(sheet.size_category, self.kingdom.size_category)
+        self.assertEqual(
+            sheet.commodity_storage_limit, self.kingdom.commodity_storage_limit
+        )
+        self.assertEqual(sheet.unrest_penalty, -2)
+        self.assertEqual(sheet.ability("loyalty").modifier, 2)
+
+    def test_skill_total(self):
+        self.kingdom.skill_proficiencies.filter(skill="politics").update(
+            proficiency="trained"
+        )
+        leader = self.kingdom.leadership_assignments.get(role="ruler")
+        leader.is_invested = True
+        leader.is_vacant = False
+        leader.save()
+
+        line = KingdomStatSheet.build(self.kingdom).skill("politics")
+        # Loyalty +2, trained 8 + 2, invested ruler +2, unrest -2, strife -1
+        self.assertEqual(line.proficiency_bonus, 10)
+        self.assertEqual(line.status_bonus, 2)
+        self.assertEqual(line.total, 11)
+
+    def test_vacant_leader_grants_no_status_bonus(self):
+        self.kingdom.leadership_assignments.filter(role="ruler").update(
+            is_invested=True, is_vacant=True
+        )
+        sheet = KingdomStatSheet.build(self.kingdom)
+        self.assertEqual(sheet.ability("loyalty").status_bonus, 0)
+
+    def test_government_skills_flagged(self):
+        sheet = KingdomStatSheet.build(self.kingdom)
+        boosted = {line.skill for line in sheet.skills if line.government_boosted}
+        self.assertEqual(boosted, self.kingdom.government_skill_boosts)
+
+    def test_save_bumps_version(self):
+        version = self.kingdom.version
+        self.kingdom.save(update_fields=["unrest"])
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.version, version + 1)
+
+    def test_stale_instance_does_not_reuse_version(self):
+        version = self.kingdom.version
+        stale = Kingdom.objects.get(pk=self.kingdom.pk)
+        self.kingdom.save()
+        stale.save()
+        self.assertEqual(stale.version, version + 2)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.version, version + 2)
+
+    def test_related_writes_bump_version(self):
+        version = self.kingdom.version
+        stats_version = self.kingdom.stats_version
+        skill = self.kingdom.skill_proficiencies.get(skill="arts")
+        skill.proficiency = "expert"
+        skill.save()
+        self.assertEqual(self.kingdom.version, version + 1)
+        self.assertEqual(self.kingdom.stats_version, stats_version + 1)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.version, version + 1)
+        self.assertEqual(self.kingdom.stats_version, stats_version + 1)
+
+    def test_turn_writes_keep_stats_version(self):
+        from turns.models import ActivityLog, ActivityTrait, KingdomTurn
+
+        stats_version = self.kingdom.stats_version
+        turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=turn,
+            activity_name="Claim Hex",
+            activity_trait=ActivityTrait.REGION,
+        )
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.stats_version, stats_version)
+
+    def test_batched_version_bumps_once_per_kingdom(self):
+        version = self.kingdom.version
+        stats_version = self.kingdom.stats_version
+        with self.assertNumQueries(5):
+            with Kingdom.batched_version_bumps():
+                for skill in self.kingdom.skill_proficiencies.filter(
+                    skill__in=["arts", "trade", "magic"]
+                ):
+                    skill.proficiency = "trained"
+                    skill.save()
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.version, version + 1)
+        self.assertEqual(self.kingdom.stats_version, stats_version + 1)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class StatSheetCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        self.kingdom.refresh_from_db()
+
+    def test_cached_by_stats_version(self):
+        get_stat_sheet(self.kingdom)
+        self.assertIsNotNone(
+            cache.get(stat_sheet_cache_key(self.kingdom.pk, self.kingdom.stats_version))
+        )
+        with self.assertNumQueries(0):
+            get_stat_sheet(self.kingdom)
+
+    def test_turn_write_keeps_cached_sheet(self):
+        from turns.models import KingdomTurn
+
+        get_stat_sheet(self.kingdom)
+        KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        self.kingdom.refresh_from_db()
+        with self.assertNumQueries(0):
+            get_stat_sheet(self.kingdom)
+
+    def test_related_write_retires_cached_sheet(self):
+        self.assertEqual(get_stat_sheet(self.kingdom).skill("arts").total, 0)
+        skill = self.kingdom.skill_proficiencies.get(skill="arts")
+        skill.proficiency = "trained"
+        skill.save()
+        self.kingdom.refresh_from_db()
+        self.assertEqual(get_stat_sheet(self.kingdom).skill("arts").total, 3)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class DetailFragmentCacheTests(TestCase):
+    """Dashboard sections are cached per kingdom version and retired by writes."""
+
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        self.membership = KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+            character_name="Jamandi",
+        )
+        self.url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        self.client.force_login(self.gm)
+
+    def _ruler(self):
+        from leadership.models import LeadershipRole
+
+        return self.kingdom.leadership_assignments.get(role=LeadershipRole.RULER)
+
+    def test_warm_render_skips_section_queries(self):
+        self.client.get(self.url)
+        # session, user, kingdom; stat sheet, membership and fragments cached
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertContains(response, "Ruler")
+
+    def test_leadership_write_retires_fragment(self):
+        self.client.get(self.url)
+        ruler = self._ruler()
+        ruler.character_name = "Kesten Garess"
+        ruler.is_pc = False
+        ruler.is_vacant = False
+        ruler.save()
+        self.assertContains(self.client.get(self.url), "Kesten Garess")
+
+    def test_membership_write_retires_fragment(self):
+        ruler = self._ruler()
+        ruler.user = self.gm
+        ruler.is_vacant = False
+        ruler.save()
+        self.assertContains(self.client.get(self.url), "Jamandi")
+        self.membership.character_name = "Tristian"
+        self.membership.save()
+        self.assertContains(self.client.get(self.url), "Tristian")
+
+    def test_turn_and_activity_writes_retire_fragment(self):
+        from turns.models import ActivityLog, ActivityTrait, KingdomTurn
+
+        self.assertContains(self.client.get(self.url), "No turns recorded yet.")
+        turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        response = self.client.get(self.url)
+        self.assertNotContains(response, "No turns recorded yet.")
+        self.assertNotContains(response, 'fa-check"></i>1')
+        ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=turn,
+            activity_name="Claim Hex",
+            activity_trait=ActivityTrait.REGION,
+            degree_of_success="success",
+        )
+        self.assertContains(self.client.get(self.url), 'fa-check"></i>1')
+
+    def test_turn_delete_bumps_once(self):
+        from turns.models import ActivityLog, ActivityTrait, KingdomTurn
+
+        turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        for _ in range(3):
+            ActivityLog.objects.create(
+                kingdom=self.kingdom,
+                turn=turn,
+                activity_name="Claim Hex",
+                activity_trait=ActivityTrait.REGION,
+            )
+        before = Kingdom.objects.get(pk=self.kingdom.pk).version
+        turn.delete()
+        self.assertEqual(Kingdom.objects.get(pk=self.kingdom.pk).version, before + 1)
+
+    def test_turns_fragment_varies_by_role(self):
+        player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        KingdomMembership.objects.create(
+            user=player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        self.assertContains(self.client.get(self.url), 'Click "New Turn"')
+        self.client.force_login(player)
+        self.assertNotContains(self.client.get(self.url), 'Click "New Turn"')
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        self.client.force_login(self.gm)
+
+    def test_sends_etag(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_matching_etag_304_before_context(self):
+        etag = self.client.get(self.url)["ETag"]
+        # session, user, membership+kingdom
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_kingdom_write_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.kingdom.unrest = 3
+        self.kingdom.save()
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_differs_per_user(self):
+        etag = self.client.get(self.url)["ETag"]
+        player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        KingdomMembership.objects.create(
+            user=player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        gm_etag = self.client.get(self.url)["ETag"]
+        self.assertNotEqual(gm_etag, etag)  # The membership write bumped it.
+        self.client.force_login(player)
+        self.assertNotEqual(self.client.get(self.url)["ETag"], gm_etag)
+
+    def test_pending_messages_render(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.client.get(
+            reverse("kingdoms:join", kwargs={"invite_code": self.kingdom.invite_code})
+        )
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertContains(response, "You are already a member")
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+
+class KingdomQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """Pin the query count of every kingdoms view.
+
+    Budgets count session + user lookups. The detail view must also stay
+    flat as leadership, memberships and turns grow.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.player_membership = KingdomMembership.objects.create(
+            user=self.player,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+        )
+        self.client.force_login(self.gm)
+
+    def _url(self, name, **kwargs):
+        return reverse(f"kingdoms:{name}", kwargs={"pk": self.kingdom.pk, **kwargs})
+
+    def _add_turns_and_leaders(self):
+        from turns.models import ActivityLog, ActivityTrait, KingdomTurn
+
+        start = self.kingdom.turns.count()
+        for number in range(start + 1, start + 6):
+            turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=number)
+            for _ in range(3):
+                ActivityLog.objects.create(
+                    kingdom=self.kingdom,
+                    turn=turn,
+                    activity_name="Claim Hex",
+                    activity_trait=ActivityTrait.REGION,
+                )
+        self.kingdom.leadership_assignments.update(
+            user=self.player, is_pc=True, is_vacant=False, is_invested=True
+        )
+        # update() skips the signal that retires the cached stat sheet.
+        Kingdom.bump_version(self.kingdom.pk, stats=True)
+
+    def test_kingdom_list(self):
+        self.assertQueryBudget(3, reverse("kingdoms:kingdom_list"))
+
+    def test_kingdom_create_get(self):
+        self.assertQueryBudget(2, reverse("kingdoms:kingdom_create"))
+
+    def test_kingdom_create_post(self):
+        self.assertQueryBudget(
+            9,
+            reverse("kingdoms:kingdom_create"),
+            method="post",
+            data={"name": "New Kingdom", "fame_type": "fame"},
+            status=302,
+        )
+
+    def test_kingdom_detail(self):
+        self._add_turns_and_leaders()
+        self.assertQueryBudget(7, self._url("kingdom_detail"))
+
+    def test_kingdom_detail_does_not_scale(self):
+        self.assertQueriesDoNotScale(
+            self._url("kingdom_detail"), self._add_turns_and_leaders
+        )
+
+    def test_kingdom_update_get(self):
+        self.assertQueryBudget(3, self._url("kingdom_update"))
+
+    def test_kingdom_delete_get(self):
+        self.assertQueryBudget(3, self._url("kingdom_delete"))
+
+    def test_member_manage_get(self):
+        self.assertQueryBudget(4, self._url("member_manage"))
+
+    def test_member_manage_post(self):
+        self.assertQueryBudget(
+            8,
+            self._url("member_manage"),
+            method="post",
+            data={"membership_id": self.player_membership.pk},
+            status=302,
+        )
+
+    def test_regenerate_invite_post(self):
+        self.assertQueryBudget(
+            9, self._url("regenerate_invite"), method="post", status=302
+        )
+
+    def test_update_character_name_post(self):
+        self.assertQueryBudget(
+            5,
+            self._url("update_character_name"),
+            method="post",
+            data={"character_name": "Aragorn"},
+            status=302,
+        )
+
+    def test_join(self):
+        self.client.force_login(self.player)
+        self.assertQueryBudget(
+            4,
+            reverse("kingdoms:join", kwargs={"invite_code": self.kingdom.invite_code}),
+            status=302,
+        )
@@ -1,7 +1,7 @@
 """
 Root URL configuration for all kingdom-related apps.
 
-Mounts kingdoms, leadership, skills, and turns under the /kingdoms/ prefix.
+Mounts kingdoms, leadership, skills, territory and turns under the /kingdoms/ prefix.
 """
 
 from django.urls import include, path
@@ -10,5 +10,6 @@ urlpatterns = [
     path("", include(("kingdoms.urls_core", "kingdoms"))),
     path("", include(("leadership.urls", "leadership"))),
     path("", include(("skills.urls", "skills"))),
+    path("", include(("territory.urls", "territory"))),
     path("", include(("turns.urls", "turns"))),
 ]
@@ -1,29 +1,53 @@
 import uuid
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.views import View
 from django.views.generic import CreateView, DetailView, ListView, UpdateView
 from django.views.generic.base import TemplateView
 
-from kingdoms.constants import AbilityScore
-from skills.models import SKILL_KEY_ABILITY
-
 from .forms import CharacterNameForm, KingdomCreateForm, KingdomUpdateForm
-from .mixins import GMRequiredMixin, KingdomAccessMixin
-from .models import Kingdom, KingdomMembership, MembershipRole
+from .mixins import ConditionalGetMixin, GMRequiredMixin, KingdomAccessMixin
+from .models import Kingdom, KingdomMembership, KingdomSummary, MembershipRole
+from .pagination import InvalidCursor, keyset_paginate
+from .permissions import invalidate_kingdom_memberships
+from .provisioning import provision_kingdom
+from .stats import get_stat_sheet
 from .url_helpers import kingdom_url
 
 
 class KingdomListView(LoginRequiredMixin, ListView):
-    model = Kingdom
+    """List the user's kingdoms from the denormalized summary table."""
+
+    model = KingdomSummary
     template_name = "kingdoms/kingdom_list.html"
     context_object_name = "kingdoms"
+    per_page = 24
 
     def get_queryset(self):
-        return Kingdom.objects.filter(members=self.request.user)
+        summaries = KingdomSummary.objects.filter(
+            kingdom__kingdom_memberships__user=self.request.user
+        )
+        try:
+            rows, self.next_cursor = keyset_paginate(
+                summaries,
+                ("name", "pk"),
+                cursor=self.request.GET.get("after"),
+                per_page=self.per_page,
+            )
+        except InvalidCursor:
+            raise Http404("Invalid page cursor.")
+        return rows
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["next_cursor"] = self.next_cursor
+        context["is_first_page"] = not self.request.GET.get("after")
+        return context
 
 
 class KingdomCreateView(LoginRequiredMixin, CreateView):
@@ -32,57 +56,46 @@ class KingdomCreateView(LoginRequiredMixin, CreateView):
     template_name = "kingdoms/kingdom_form.html"
 
     def form_valid(self, form):
-        self.object = form.save()
-        self.object.initialize_defaults()
-        KingdomMembership.objects.create(
-            user=self.request.user,
-            kingdom=self.object,
-            role=MembershipRole.GM,
-        )
+        self.object = provision_kingdom(form.save(commit=False), self.request.user)
         return redirect(self.get_success_url())
 
     def get_success_url(self):
         return kingdom_url("kingdom_detail", self.object.pk)
 
 
-class KingdomDetailView(KingdomAccessMixin, DetailView):
+class KingdomDetailView(KingdomAccessMixin, ConditionalGetMixin, DetailView):
     model = Kingdom
     template_name = "kingdoms/kingdom_detail.html"
     context_object_name = "kingdom"
 
+    def get_object(self, queryset=None):
+        # Reuse the instance loaded by KingdomAccessMixin; related rows fetched
+        # through it share this object instead of re-querying the kingdom.
+        return self.kingdom
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         kingdom = self.object
-        context["leadership"] = kingdom.leadership_assignments.all()
-        context["skills"] = kingdom.skill_proficiencies.all()
-        context["memberships"] = kingdom.kingdom_memberships.select_related(
-            "user"
-        ).all()
-
-        # Group skills and effects by ability for display
-        ability_effects = kingdom.get_ability_effects()
-        gov_skills = kingdom.government_skill_boosts
-        abilities_data = {}
-        for ability in AbilityScore:
-            skills_for_ability = [
-                s
-                for s in context["skills"]
-                if SKILL_KEY_ABILITY.get(s.skill) == ability
-            ]
-            for s in skills_for_ability:
-                s.government_boosted = s.skill in gov_skills
-            abilities_data[ability.label] = {
-                "skills": skills_for_ability,
-                "effects": ability_effects.get(ability.label, []),
-            }
-        context["abilities_data"] = abilities_data
+        # Leadership and turns are lazy querysets, evaluated only when their
+        # fragments render; warm fragments are keyed on the kingdom version.
+        context["fragment_cache_timeout"] = settings.KINGDOM_FRAGMENT_CACHE_TIMEOUT
+        context["leadership"] = kingdom.leadership_assignments.with_display_names()
+
+        # Skill and leadership rows only load when the sheet isn't cached; the
+        # leadership queryset is shared with the template either way.
+        sheet = get_stat_sheet(
+            kingdom,
+            proficiencies=kingdom.skill_proficiencies.all(),
+            leadership=context["leadership"],
+        )
+        context["stat_sheet"] = sheet
+        context["abilities_data"] = [
+            (ability, sheet.skills_for(ability.ability)) for ability in sheet.abilities
+        ]
         context["character_name_form"] = CharacterNameForm(instance=self.membership)
 
         # Recent turns
         context["turns"] = kingdom.turns.all()[:5]
-        context["current_turn"] = kingdom.turns.filter(
-            completed_at__isnull=True
-        ).first()
         return context
 
 
@@ -91,6 +104,9 @@ class KingdomUpdateView(GMRequiredMixin, UpdateView):
     form_class = KingdomUpdateForm
     template_name = "kingdoms/kingdom_update.html"
 
+    def get_object(self, queryset=None):
+        return self.kingdom
+
     def get_success_url(self):
         return kingdom_url("kingdom_detail", self.object.pk)
 
@@ -129,10 +145,11 @@ class KingdomMemberManageView(GMRequiredMixin, TemplateView):
             pk=membership_id,
             kingdom=self.kingdom,
         )
-        if membership.user == request.user:
+        if membership.user_id == request.user.pk:
             messages.error(request, "You cannot remove yourself.")
         else:
             membership.delete()
+            invalidate_kingdom_memberships(self.kingdom)
             messages.success(request, "Member removed.")
         return redirect(
             reverse(
@@ -170,6 +187,7 @@ class RegenerateInviteView(GMRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         self.kingdom.invite_code = uuid.uuid4()
         self.kingdom.save(update_fields=["invite_code"])
+        invalidate_kingdom_memberships(self.kingdom)
         messages.success(request, "Invite link regenerated. Old links are now invalid.")
         return redirect(
             reverse(
@@ -9,6 +9,15 @@ from .models import LeadershipAssignment
 User = get_user_model()
 
 
+def _member_names(kingdom):
+    """Map user id to membership character name for a kingdom."""
+    return dict(
+        KingdomMembership.objects.filter(kingdom=kingdom).values_list(
+            "user_id", "character_name"
+        )
+    )
+
+
 class LeadershipAssignmentForm(forms.ModelForm):
     class Meta:
         model = LeadershipAssignment
@@ -21,7 +30,7 @@ class LeadershipAssignmentForm(forms.ModelForm):
             "user",
         ]
 
-    def __init__(self, *args, kingdom=None, **kwargs):
+    def __init__(self, *args, kingdom=None, member_names=None, **kwargs):
         super().__init__(*args, **kwargs)
         if kingdom is not None:
             self.fields["user"].queryset = User.objects.filter(kingdoms=kingdom)
@@ -33,11 +42,9 @@ class LeadershipAssignmentForm(forms.ModelForm):
             self.instance.kingdom if self.instance.pk else None
         )
         if kingdom_for_label:
-            names = dict(
-                KingdomMembership.objects.filter(kingdom=kingdom_for_label).values_list(
-                    "user_id", "character_name"
-                )
-            )
+            names = member_names
+            if names is None:
+                names = _member_names(kingdom_for_label)
             self.fields["user"].label_from_instance = lambda u: (
                 f"{names.get(u.pk, '')} ({u.email})" if names.get(u.pk) else u.email
             )
@@ -55,11 +62,14 @@ class LeadershipFormSetBase(
 ):
     def __init__(self, *args, kingdom=None, **kwargs):
         self.kingdom = kingdom
+        # Looked up once and shared by every form in the set.
+        self.member_names = _member_names(kingdom) if kingdom is not None else None
         super().__init__(*args, **kwargs)
 
     def get_form_kwargs(self, index):
         kwargs = super().get_form_kwargs(index)
         kwargs["kingdom"] = self.kingdom
+        kwargs["member_names"] = self.member_names
         return kwargs
 
 
@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.db import models
 
+from kingdoms import stats
 from kingdoms.constants import AbilityScore
 
 
@@ -27,6 +28,24 @@ ROLE_KEY_ABILITY = {
 }
 
 
+class LeadershipAssignmentQuerySet(models.QuerySet):
+    def with_display_names(self):
+        """Annotate each row with its PC's membership character name.
+
+        Lets ``display_name`` resolve without a query per assignment.
+        """
+        from kingdoms.models import KingdomMembership
+
+        return self.annotate(
+            member_character_name=models.Subquery(
+                KingdomMembership.objects.filter(
+                    kingdom=models.OuterRef("kingdom"),
+                    user=models.OuterRef("user"),
+                ).values("character_name")[:1]
+            )
+        )
+
+
 class LeadershipAssignment(models.Model):
     kingdom = models.ForeignKey(
         "kingdoms.Kingdom",
@@ -47,6 +66,8 @@ class LeadershipAssignment(models.Model):
         related_name="leadership_assignments",
     )
 
+    objects = LeadershipAssignmentQuerySet.as_manager()
+
     class Meta:
         unique_together = [("kingdom", "role")]
         ordering = ["role"]
@@ -68,18 +89,19 @@ class LeadershipAssignment(models.Model):
         """Investment status bonus based on kingdom level."""
         if not self.is_invested or self.is_vacant:
             return 0
-        level = self.kingdom.level
-        if level >= 16:
-            return 3
-        if level >= 8:
-            return 2
-        return 1
+        return stats.status_bonus(self.kingdom.level)
 
     @property
     def display_name(self):
         """Character name for display: PC membership name or NPC character_name."""
-        if self.is_pc and self.user:
-            membership = self.kingdom.kingdom_memberships.filter(user=self.user).first()
+        if self.is_pc and self.user_id:
+            if hasattr(self, "member_character_name"):
+                if self.member_character_name is not None:
+                    return self.member_character_name
+                return self.character_name
+            membership = self.kingdom.kingdom_memberships.filter(
+                user_id=self.user_id
+            ).first()
             if membership:
                 return membership.character_name
         return self.character_name
@@ -1,8 +1,10 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 
 from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from kingdoms.testing import QueryBudgetMixin
 
 from .models import LeadershipAssignment, LeadershipRole
 
@@ -13,6 +15,7 @@ TEST_PASSWORD = "testpass123"  # nosec B105
 
 class LeadershipAssignmentTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.kingdom = Kingdom.objects.create(name="Test Kingdom")
         self.assignment = LeadershipAssignment.objects.create(
             kingdom=self.kingdom,
@@ -56,9 +59,54 @@ class LeadershipAssignmentTests(TestCase):
         self.assignment.is_vacant = True
         self.assertEqual(self.assignment.status_bonus, 0)
 
+    def test_display_name_uses_membership_character_name(self):
+        user = User.objects.create_user(
+            username="pc", email="pc@example.com", password=TEST_PASSWORD
+        )
+        KingdomMembership.objects.create(
+            user=user,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+            character_name="Kesten",
+        )
+        self.assignment.user = user
+        self.assignment.character_name = "Ignored"
+        self.assignment.save()
+        self.assertEqual(self.assignment.display_name, "Kesten")
+
+    def test_with_display_names_avoids_per_row_queries(self):
+        user = User.objects.create_user(
+            username="pc", email="pc@example.com", password=TEST_PASSWORD
+        )
+        KingdomMembership.objects.create(
+            user=user,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+            character_name="Kesten",
+        )
+        self.assignment.user = user
+        self.assignment.save()
+        with self.assertNumQueries(1):
+            names = [
+                a.display_name
+                for a in LeadershipAssignment.objects.with_display_names()
+            ]
+        self.assertEqual(names, ["Kesten"])
+
+    def test_with_display_names_falls_back_without_membership(self):
+        user = User.objects.create_user(
+            username="npc", email="npc@example.com", password=TEST_PASSWORD
+        )
+        self.assignment.user = user
+        self.assignment.character_name = "Jubilost"
+        self.assignment.save()
+        assignment = LeadershipAssignment.objects.with_display_names().get()
+        self.assertEqual(assignment.display_name, "Jubilost")
+
 
 class LeadershipUpdateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -164,3 +212,48 @@ class LeadershipUpdateViewTests(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
         self.assertIn("/accounts/login/", response.url)
+
+
+class LeadershipQueryBudgetTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.url = reverse(
+            "leadership:leadership_update", kwargs={"pk": self.kingdom.pk}
+        )
+        self.client.force_login(self.gm)
+
+    def test_leadership_update_get(self):
+        # session, user, membership+kingdom, member names, assignments,
+        # then one user <select> per role form (8 fixed roles)
+        self.assertQueryBudget(13, self.url)
+
+    def test_leadership_update_post(self):
+        data = {
+            "form-TOTAL_FORMS": "8",
+            "form-INITIAL_FORMS": "8",
+            "form-MIN_NUM_FORMS": "0",
+            "form-MAX_NUM_FORMS": "8",
+        }
+        for i, assignment in enumerate(self.kingdom.leadership_assignments.all()):
+            data.update(
+                {
+                    f"form-{i}-id": assignment.pk,
+                    f"form-{i}-character_name": "",
+                    f"form-{i}-is_vacant": "on",
+                    f"form-{i}-user": "",
+                }
+            )
+        # 5 setup queries, one pk validation and one UPDATE per role form
+        self.assertQueryBudget(22, self.url, method="post", data=data, status=302)
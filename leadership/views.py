@@ -4,6 +4,7 @@ from django.urls import reverse
 from django.views.generic.base import TemplateView
 
 from kingdoms.mixins import GMRequiredMixin
+from kingdoms.models import Kingdom
 
 from .forms import LeadershipFormSet
 
@@ -26,7 +27,8 @@ class LeadershipUpdateView(GMRequiredMixin, TemplateView):
             kingdom=self.kingdom,
         )
         if formset.is_valid():
-            formset.save()
+            with Kingdom.batched_version_bumps():
+                formset.save()
             messages.success(request, "Leadership roles updated.")
             return redirect(
                 reverse(
@@ -0,0 +1,71 @@
+"""Prometheus metrics for the kingdom and turn workload.
+
+Request and query figures come from ``metrics.middleware``; the domain code
+counts activities, completed turns and cache lookups as they happen. With
+``PROMETHEUS_MULTIPROC_DIR`` set in the environment, ``prometheus_client``
+keeps every worker's values in files there and ``/metrics`` sums them, so
+one scrape covers all gunicorn workers.
+"""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from prometheus_client import Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+
+# Kingdoms with an activity logged this recently count as active.
+ACTIVE_WINDOW = timedelta(days=30)
+
+REQUESTS = Counter(
+    "kingdom_http_requests",
+    "Requests handled, by URL name, method and status.",
+    ["view", "method", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "kingdom_http_request_duration_seconds",
+    "Time to build each response, by URL name.",
+    ["view"],
+)
+QUERY_LATENCY = Histogram(
+    "kingdom_db_query_duration_seconds",
+    "Latency of SQL queries run while handling requests.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+ACTIVITIES_LOGGED = Counter(
+    "kingdom_activities_logged", "Activities logged, by form, batch or import."
+)
+TURNS_COMPLETED = Counter("kingdom_turns_completed", "Turns marked complete.")
+CACHE_LOOKUPS = Counter(
+    "kingdom_cache_lookups",
+    "Lookups in the membership, stat sheet and simulation caches.",
+    ["cache", "result"],
+)
+
+
+def count_on_commit(counter, amount=1):
+    """Increment ``counter`` once the current transaction commits."""
+    transaction.on_commit(lambda: counter.inc(amount))
+
+
+def record_cache_lookup(cache, hit):
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class ActiveKingdomsCollector:
+    """Reads the active kingdom count from the database at scrape time."""
+
+    def collect(self):
+        from turns.models import ActivityLog
+
+        active = (
+            ActivityLog.objects.filter(created_at__gte=timezone.now() - ACTIVE_WINDOW)
+            .values("kingdom_id")
+            .distinct()
+            .count()
+        )
+        yield GaugeMetricFamily(
+            "kingdom_active_kingdoms",
+            f"Kingdoms with an activity logged in the last {ACTIVE_WINDOW.days} days.",
+            value=active,
+        )
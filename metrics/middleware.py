@@ -0,0 +1,40 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .collectors import QUERY_LATENCY, REQUEST_LATENCY, REQUESTS
+
+
+def _observe_query(execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        QUERY_LATENCY.observe(time.perf_counter() - start)
+
+
+class MetricsMiddleware:
+    """Count and time requests by URL name; inert unless ``METRICS_ENABLED``.
+
+    Unresolved paths are left out so scanners can't grow the label set.
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_observe_query))
+            response = self.get_response(request)
+        match = request.resolver_match
+        if match is not None and match.view_name:
+            REQUEST_LATENCY.labels(match.view_name).observe(time.perf_counter() - start)
+            REQUESTS.labels(match.view_name, request.method, response.status_code).inc()
+        return response
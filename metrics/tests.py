@@ -0,0 +1,163 @@
+import os
+import tempfile
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from prometheus_client import REGISTRY
+
+from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from turns.models import ActivityLog, ActivityTrait, KingdomTurn
+
+User = get_user_model()
+
+TEST_PASSWORD = "testpass123"  # nosec B105
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        self.turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+
+    def _log(self):
+        return ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=self.turn,
+            activity_name="Claim Hex",
+            activity_trait=ActivityTrait.REGION,
+        )
+
+
+@override_settings(METRICS_ENABLED=True, METRICS_TOKEN="")
+class MetricsEndpointTests(MetricsTestCase):
+    url = reverse("metrics:metrics")
+
+    def test_text_format(self):
+        self._log()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertContains(response, "kingdom_active_kingdoms 1.0")
+        self.assertContains(response, "# TYPE kingdom_activities_logged_total counter")
+
+    def test_active_kingdoms_window(self):
+        ActivityLog.objects.filter(pk=self._log().pk).update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+        self.assertContains(self.client.get(self.url), "kingdom_active_kingdoms 0.0")
+
+    @override_settings(METRICS_TOKEN="s3cret")  # nosec B106
+    def test_token(self):
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        response = self.client.get(self.url, headers={"authorization": "Bearer wrong"})
+        self.assertEqual(response.status_code, 401)
+        response = self.client.get(self.url, headers={"authorization": "Bearer s3cret"})
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled_404(self):
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_multiprocess_mode_reads_worker_files(self):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": directory}),
+        ):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        # No worker has written to the empty directory yet.
+        self.assertNotContains(response, "kingdom_http_requests_total{")
+        self.assertContains(response, "kingdom_active_kingdoms")
+
+
+@override_settings(METRICS_ENABLED=True)
+class MetricsMiddlewareTests(MetricsTestCase):
+    def test_counts_requests_by_view(self):
+        self.client.force_login(self.player)
+        url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        labels = {"view": "kingdoms:kingdom_detail", "method": "GET", "status": "200"}
+        requests = sample("kingdom_http_requests_total", **labels)
+        timed = sample(
+            "kingdom_http_request_duration_seconds_count",
+            view="kingdoms:kingdom_detail",
+        )
+        queries = sample("kingdom_db_query_duration_seconds_count")
+        self.client.get(url)
+        self.assertEqual(sample("kingdom_http_requests_total", **labels), requests + 1)
+        self.assertEqual(
+            sample(
+                "kingdom_http_request_duration_seconds_count",
+                view="kingdoms:kingdom_detail",
+            ),
+            timed + 1,
+        )
+        self.assertGreater(sample("kingdom_db_query_duration_seconds_count"), queries)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled(self):
+        queries = sample("kingdom_db_query_duration_seconds_count")
+        self.client.get(reverse("home"))
+        self.assertEqual(sample("kingdom_db_query_duration_seconds_count"), queries)
+
+
+class WorkloadCounterTests(MetricsTestCase):
+    def test_activities_counted_on_commit(self):
+        before = sample("kingdom_activities_logged_total")
+        with self.captureOnCommitCallbacks(execute=True):
+            activity = self._log()
+        with self.captureOnCommitCallbacks(execute=True):
+            activity.notes = "Edited"
+            activity.save()
+        self.assertEqual(sample("kingdom_activities_logged_total"), before + 1)
+
+    def test_rolled_back_activity_not_counted(self):
+        before = sample("kingdom_activities_logged_total")
+        with self.captureOnCommitCallbacks(execute=False):
+            self._log()
+        self.assertEqual(sample("kingdom_activities_logged_total"), before)
+
+    def test_turn_completion_counted(self):
+        before = sample("kingdom_turns_completed_total")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.turn.complete_turn()
+        self.assertEqual(sample("kingdom_turns_completed_total"), before + 1)
+
+    @override_settings(CACHES=LOCMEM)
+    def test_cache_lookups(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client.force_login(self.player)
+        url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+
+        def lookups(result):
+            return sample(
+                "kingdom_cache_lookups_total", cache="membership", result=result
+            )
+
+        hits, misses = lookups("hit"), lookups("miss")
+        self.client.get(url)
+        self.client.get(url)
+        self.assertEqual(lookups("miss"), misses + 1)
+        self.assertEqual(lookups("hit"), hits + 1)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import MetricsView
+
+app_name = "metrics"
+urlpatterns = [
+    path("", MetricsView.as_view(), name="metrics"),
+]
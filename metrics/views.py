@@ -0,0 +1,48 @@
+import hmac
+import os
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views import View
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from .collectors import ActiveKingdomsCollector
+
+
+def _worker_registry():
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return registry
+
+
+_database_registry = CollectorRegistry()
+_database_registry.register(ActiveKingdomsCollector())
+
+
+class MetricsView(View):
+    """Prometheus text-format scrape endpoint.
+
+    Answers 404 unless ``METRICS_ENABLED``. When ``METRICS_TOKEN`` is set,
+    scrapers must send it as a bearer token.
+    """
+
+    http_method_names = ["get"]
+
+    def get(self, request):
+        if not settings.METRICS_ENABLED:
+            raise Http404
+        if settings.METRICS_TOKEN:
+            expected = f"Bearer {settings.METRICS_TOKEN}"
+            supplied = request.headers.get("Authorization", "")
+            if not hmac.compare_digest(supplied.encode(), expected.encode()):
+                return HttpResponse("Unauthorized\n", status=401)
+        body = generate_latest(_worker_registry()) + generate_latest(_database_registry)
+        return HttpResponse(body, content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,191 @@
+"""Request benchmarks over a synthetic campaign; run with ``manage.py benchmark``.
+
+Each scenario sends unmeasured warm-up requests, then timed ones, and reports
+latency percentiles and throughput. ``ClientTarget`` drives the app in
+process through Django's test client; ``HttpTarget`` sends real HTTP to a
+running server such as a local gunicorn. Results are plain dicts, written
+as JSON and compared with a baseline file by ``compare``.
+"""
+
+import statistics
+import string
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.test import Client
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from turns.models import ActivityTrait
+
+from .stats import percentile
+
+# Metrics compared against the baseline, and whether higher is better.
+COMPARED_METRICS = {"p95_ms": False, "throughput_rps": True}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    path: str
+    method: str = "GET"
+    data: dict = field(default_factory=dict)
+    status: int = 200
+
+
+def scenarios(kingdom, turn):
+    """The benchmarked requests, made as the GM of ``kingdom``."""
+    kingdom_kwargs = {"pk": kingdom.pk}
+    turn_kwargs = {"pk": kingdom.pk, "turn_pk": turn.pk}
+    return [
+        Scenario("kingdom_list", reverse("kingdoms:kingdom_list")),
+        Scenario(
+            "kingdom_detail", reverse("kingdoms:kingdom_detail", kwargs=kingdom_kwargs)
+        ),
+        Scenario("turn_detail", reverse("turns:turn_detail", kwargs=turn_kwargs)),
+        Scenario(
+            "activity_create",
+            reverse("turns:activity_create", kwargs=turn_kwargs),
+            method="POST",
+            data={
+                "activity_name": "Benchmark",
+                "activity_trait": ActivityTrait.REGION,
+                "roll_result": "12",
+                "total_modifier": "8",
+                "dc": "16",
+            },
+            status=302,
+        ),
+        Scenario(
+            "leadership_formset",
+            reverse("leadership:leadership_update", kwargs=kingdom_kwargs),
+        ),
+    ]
+
+
+class ClientTarget:
+    """In-process requests through Django's test client."""
+
+    name = "client"
+    concurrency = 1  # Keeps every request on this thread's connection.
+
+    def __init__(self, user):
+        self.client = Client()
+        self.client.force_login(user)
+
+    def request(self, scenario):
+        send = getattr(self.client, scenario.method.lower())
+        return send(scenario.path, scenario.data, secure=True).status_code
+
+
+class HttpTarget:
+    """Requests over HTTP to ``base_url``, logged in as ``user``.
+
+    The session is created in this process's database, which the server must
+    share. Requests claim HTTPS through ``SECURE_PROXY_SSL_HEADER`` so a
+    production-configured server answers them directly.
+    """
+
+    def __init__(self, base_url, user, concurrency=1):
+        self.name = base_url
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.client = Client()
+        self.client.force_login(user)
+        csrf_token = get_random_string(32, string.ascii_letters + string.digits)
+        host = urllib.parse.urlsplit(self.base_url).netloc
+        self.headers = {
+            "Cookie": (
+                f"{settings.SESSION_COOKIE_NAME}="
+                f"{self.client.cookies[settings.SESSION_COOKIE_NAME].value}; "
+                f"{settings.CSRF_COOKIE_NAME}={csrf_token}"
+            ),
+            "X-CSRFToken": csrf_token,
+            "Origin": f"https://{host}",
+            "X-Forwarded-Proto": "https",
+        }
+
+    def close(self):
+        """Delete the session created for the run."""
+        self.client.logout()
+
+    def request(self, scenario):
+        body = None
+        if scenario.method == "POST":
+            body = urllib.parse.urlencode(scenario.data).encode()
+        request = urllib.request.Request(
+            self.base_url + scenario.path,
+            data=body,
+            headers=self.headers,
+            method=scenario.method,
+        )
+        opener = urllib.request.build_opener(_NoRedirect)
+        try:
+            with opener.open(request) as response:  # nosec B310
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None  # Report the redirect itself, as the test client does.
+
+
+def run_scenario(target, scenario, requests, warmup=0):
+    """Time ``requests`` calls of ``scenario`` after ``warmup`` untimed ones."""
+    for _ in range(warmup):
+        target.request(scenario)
+
+    def timed(_):
+        start = time.perf_counter()
+        status = target.request(scenario)
+        return time.perf_counter() - start, status
+
+    started = time.perf_counter()
+    if target.concurrency == 1:
+        outcomes = [timed(i) for i in range(requests)]
+    else:
+        with ThreadPoolExecutor(max_workers=target.concurrency) as pool:
+            outcomes = list(pool.map(timed, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(seconds * 1000 for seconds, _ in outcomes)
+    return {
+        "requests": requests,
+        "errors": sum(status != scenario.status for _, status in outcomes),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "throughput_rps": round(requests / elapsed, 1),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Regressions of ``results`` against ``baseline``.
+
+    A scenario regresses when a compared metric is worse than its baseline
+    value by more than ``threshold`` (a fraction). Returns ``(scenario,
+    metric, baseline value, current value)`` tuples.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = before[metric], current[metric]
+            if higher_is_better:
+                worse = new < old * (1 - threshold)
+            else:
+                worse = new > old * (1 + threshold)
+            if worse:
+                regressions.append((name, metric, old, new))
+    return regressions
@@ -0,0 +1,197 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_databases, teardown_databases
+
+from kingdoms.models import Kingdom
+from profiler.benchmark import (
+    ClientTarget,
+    HttpTarget,
+    compare,
+    run_scenario,
+    scenarios,
+)
+from turns.synthetic import generate_campaign
+
+BASELINE = Path(__file__).resolve().parents[2] / "baseline.json"
+
+# Start of the usernames and kingdom names of the synthetic rows a run writes.
+PREFIX = "benchmark"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the main kingdom views over synthetic data and compare with "
+        "a baseline. The default target runs in process against a throwaway "
+        "test database; pass a URL and --allow-writes to load a running server "
+        "instead. With DEBUG off, run collectstatic first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            default="client",
+            help='"client" (default) or a server URL such as http://127.0.0.1:8000.',
+        )
+        parser.add_argument("--kingdoms", type=int, default=5)
+        parser.add_argument("--members", type=int, default=4)
+        parser.add_argument(
+            "--turns", type=int, default=12, help="Average turns per kingdom."
+        )
+        parser.add_argument(
+            "--activities", type=int, default=10, help="Average activities per turn."
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--requests", type=int, default=100, help="Timed requests per view."
+        )
+        parser.add_argument("--warmup", type=int, default=10)
+        parser.add_argument(
+            "--concurrency", type=int, default=1, help="HTTP targets only."
+        )
+        parser.add_argument(
+            "--allow-writes",
+            action="store_true",
+            help=(
+                "Let an HTTP target write synthetic rows to the configured "
+                "database; they are deleted again afterwards."
+            ),
+        )
+        parser.add_argument("--output", help="Write the results here as JSON.")
+        parser.add_argument(
+            "--baseline",
+            default=str(BASELINE),
+            help="Results to compare against (default: the committed baseline).",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Fraction by which p95 or throughput may worsen (default 0.25).",
+        )
+
+    def handle(self, *args, **options):
+        for option in ("kingdoms", "members", "turns", "requests", "concurrency"):
+            if options[option] < 1:
+                raise CommandError(f"--{option} must be at least 1.")
+        dataset = {
+            key: options[key]
+            for key in ("kingdoms", "members", "turns", "activities", "seed")
+        }
+        if options["target"] == "client":
+            results = self._run_client(dataset, options)
+        else:
+            results = self._run_http(dataset, options)
+
+        self._report(results)
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(results, indent=2) + "\n")
+            self.stdout.write(f"Results written to {options['output']}.")
+        self._compare(results, options)
+
+    def _run_client(self, dataset, options):
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            campaign = generate_campaign(**dataset, prefix=PREFIX)
+            # The test client sends Host: testserver.
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+            ):
+                return self._run(
+                    ClientTarget(campaign.gms[0]), campaign, dataset, options
+                )
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _run_http(self, dataset, options):
+        if not options["allow_writes"]:
+            raise CommandError(
+                "An HTTP target writes synthetic rows to the configured database "
+                f"({settings.DATABASES['default']['NAME']}); pass --allow-writes "
+                "to run against it."
+            )
+        if get_user_model().objects.filter(username__startswith=f"{PREFIX}-").exists():
+            raise CommandError(
+                f'Users named "{PREFIX}-..." already exist, perhaps from an '
+                "interrupted run; remove them first."
+            )
+        # Holds the campaign as it grows, so a failed run still cleans up the
+        # kingdoms finished before the failure.
+        generated = []
+        try:
+            campaign = generate_campaign(
+                **dataset, prefix=PREFIX, progress=generated.append
+            )
+            target = HttpTarget(
+                options["target"], campaign.gms[0], options["concurrency"]
+            )
+            try:
+                return self._run(target, campaign, dataset, options)
+            finally:
+                target.close()
+        finally:
+            if generated:
+                self._remove_campaign(generated[-1])
+
+    def _remove_campaign(self, campaign):
+        """Delete the rows ``campaign`` created, and nothing else."""
+        Kingdom.objects.filter(pk__in=[k.pk for k in campaign.kingdoms]).delete()
+        get_user_model().objects.filter(pk__in=[u.pk for u in campaign.users]).delete()
+
+    def _run(self, target, campaign, dataset, options):
+        kingdom = campaign.kingdoms[0]
+        turn = kingdom.turns.order_by("-turn_number").first()
+        results = {
+            "target": target.name,
+            "dataset": dataset,
+            "concurrency": target.concurrency,
+            "scenarios": {},
+        }
+        for scenario in scenarios(kingdom, turn):
+            self.stdout.write(f"Benchmarking {scenario.name}...")
+            results["scenarios"][scenario.name] = run_scenario(
+                target, scenario, options["requests"], options["warmup"]
+            )
+        return results
+
+    def _report(self, results):
+        self.stdout.write(
+            f"\n{'view':<20} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'req/s':>8} {'errors':>7}"
+        )
+        for name, line in results["scenarios"].items():
+            row = (
+                f"{name:<20} {line['p50_ms']:>8.1f} {line['p95_ms']:>8.1f} "
+                f"{line['p99_ms']:>8.1f} {line['throughput_rps']:>8.1f} "
+                f"{line['errors']:>7}"
+            )
+            self.stdout.write(self.style.ERROR(row) if line["errors"] else row)
+
+    def _compare(self, results, options):
+        path = Path(options["baseline"])
+        if not path.exists():
+            self.stdout.write(f"No baseline at {path}; nothing to compare.")
+            return
+        baseline = json.loads(path.read_text())
+        for key in ("target", "dataset", "concurrency"):
+            if baseline.get(key) != results[key]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Baseline {key} differs ({baseline.get(key)!r}); "
+                        "figures may not be comparable."
+                    )
+                )
+        regressions = compare(results, baseline, options["threshold"])
+        for name, metric, old, new in regressions:
+            self.stdout.write(
+                self.style.ERROR(f"REGRESSION {name} {metric}: {old} -> {new}")
+            )
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} regression(s) beyond "
+                f"{options['threshold']:.0%} of {path}."
+            )
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {path}."))
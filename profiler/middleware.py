@@ -0,0 +1,88 @@
+"""Opt-in request profiling; enable with ``DJANGO_PROFILING=True``.
+
+Each request's wall time, SQL query count and time, and template render time
+go out in a ``Server-Timing`` header (shown in the browser's network panel)
+and into ``profiler.stats`` under the resolved URL name, e.g.
+``kingdoms:kingdom_detail``. Render time covers ``TemplateResponse``
+rendering, which includes any queries the template triggers.
+"""
+
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from . import stats
+
+
+def _ms(seconds):
+    return seconds * 1000
+
+
+class RequestProfile:
+    """Measurements for one request, fed by a database execute wrapper."""
+
+    def __init__(self):
+        self.queries = Counter()  # fingerprint -> times run
+        self.sql_time = 0.0
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.queries[stats.fingerprint(sql)] += 1
+
+    def duplicates(self):
+        return tuple((sql, count) for sql, count in self.queries.items() if count > 1)
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = request._profile = RequestProfile()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile))
+            response = self.get_response(request)
+        wall_time = time.perf_counter() - start
+
+        sample = stats.Sample(
+            wall_ms=_ms(wall_time),
+            queries=profile.queries.total(),
+            sql_ms=_ms(profile.sql_time),
+            render_ms=_ms(profile.render_time),
+            duplicates=profile.duplicates(),
+        )
+        response.headers["Server-Timing"] = ", ".join(
+            [
+                f"total;dur={sample.wall_ms:.1f}",
+                f'sql;dur={sample.sql_ms:.1f};desc="{sample.queries} queries, '
+                f'{len(sample.duplicates)} duplicated"',
+                f"render;dur={sample.render_ms:.1f}",
+            ]
+        )
+        match = request.resolver_match
+        if match is not None and match.view_name:
+            stats.record(match.view_name, sample)
+        return response
+
+    def process_template_response(self, request, response):
+        # Listed first in MIDDLEWARE, this runs last, just before rendering.
+        start = time.perf_counter()
+
+        def finished(response):
+            request._profile.render_time += time.perf_counter() - start
+
+        response.add_post_render_callback(finished)
+        return response
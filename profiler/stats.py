@@ -0,0 +1,105 @@
+"""Rolling per-view request statistics kept in process memory.
+
+Each URL name keeps its last ``PROFILING_SAMPLE_SIZE`` requests. Summaries
+give wall-time percentiles, a wall-time histogram and averages for the other
+measures, plus the query fingerprints most often run more than once in a
+request (the usual sign of an N+1). Every worker process keeps its own
+figures, and they reset on restart.
+"""
+
+import re
+import statistics
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+
+from django.conf import settings
+
+# Upper bounds (ms) of the wall-time histogram buckets; the last is open.
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000)
+
+_NUMBER = re.compile(r"\b\d+\b")
+_PARAM_LIST = re.compile(r"\(\?(?:, \?)+\)")
+
+
+def fingerprint(sql):
+    """``sql`` with literals and parameter lists collapsed to placeholders."""
+    sql = _NUMBER.sub("?", sql.replace("%s", "?"))
+    return _PARAM_LIST.sub("(...)", sql)
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    wall_ms: float
+    queries: int
+    sql_ms: float
+    render_ms: float
+    duplicates: tuple  # ((fingerprint, times run), ...)
+
+
+@dataclass
+class ViewSummary:
+    view_name: str
+    requests: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    avg_queries: float
+    avg_sql_ms: float
+    avg_render_ms: float
+    histogram: list  # [(bucket label, count), ...]
+    duplicates: list  # [(fingerprint, requests it was duplicated in), ...]
+
+
+_lock = threading.Lock()
+_samples = {}  # view name -> deque of Sample
+
+
+def record(view_name, sample):
+    with _lock:
+        if view_name not in _samples:
+            _samples[view_name] = deque(maxlen=settings.PROFILING_SAMPLE_SIZE)
+        _samples[view_name].append(sample)
+
+
+def reset():
+    with _lock:
+        _samples.clear()
+
+
+def percentile(values, fraction):
+    """Nearest-rank ``fraction`` percentile of sorted ``values``."""
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def _histogram(walls):
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for wall in walls:
+        counts[sum(wall > bound for bound in BUCKETS_MS)] += 1
+    labels = [f"≤{bound} ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]} ms"]
+    return list(zip(labels, counts))
+
+
+def summarize(view_name, samples):
+    walls = sorted(sample.wall_ms for sample in samples)
+    duplicates = Counter(query for sample in samples for query, _ in sample.duplicates)
+    return ViewSummary(
+        view_name=view_name,
+        requests=len(samples),
+        p50_ms=percentile(walls, 0.5),
+        p95_ms=percentile(walls, 0.95),
+        max_ms=walls[-1],
+        avg_queries=statistics.fmean(sample.queries for sample in samples),
+        avg_sql_ms=statistics.fmean(sample.sql_ms for sample in samples),
+        avg_render_ms=statistics.fmean(sample.render_ms for sample in samples),
+        histogram=_histogram(walls),
+        duplicates=duplicates.most_common(5),
+    )
+
+
+def summaries():
+    """A ``ViewSummary`` per recorded URL name, slowest p95 first."""
+    with _lock:
+        snapshot = {name: list(samples) for name, samples in _samples.items()}
+    result = [summarize(name, samples) for name, samples in snapshot.items()]
+    return sorted(result, key=lambda summary: summary.p95_ms, reverse=True)
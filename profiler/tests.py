@@ -0,0 +1,225 @@
+import io
+import urllib.error
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from turns.synthetic import generate_campaign
+
+from . import stats
+from .benchmark import ClientTarget, compare, run_scenario, scenarios
+from .middleware import RequestProfile
+
+User = get_user_model()
+
+TEST_PASSWORD = "testpass123"  # nosec B105
+
+
+def _sample(wall_ms, duplicates=()):
+    return stats.Sample(
+        wall_ms=wall_ms, queries=2, sql_ms=1.0, render_ms=3.0, duplicates=duplicates
+    )
+
+
+class StatsTests(TestCase):
+    def test_fingerprint_collapses_literals_and_lists(self):
+        self.assertEqual(
+            stats.fingerprint(
+                'SELECT "a" FROM "t" WHERE "id" IN (%s, %s, %s) LIMIT 21'
+            ),
+            'SELECT "a" FROM "t" WHERE "id" IN (...) LIMIT ?',
+        )
+        self.assertEqual(
+            stats.fingerprint('SELECT 1 FROM "t" WHERE "id" = %s'),
+            'SELECT ? FROM "t" WHERE "id" = ?',
+        )
+
+    def test_request_profile_counts_duplicates(self):
+        profile = RequestProfile()
+
+        def execute(sql, params, many, context):
+            return None
+
+        for sql in ("SELECT %s", "SELECT %s", "SELECT 1 FROM t"):
+            profile(execute, sql, None, False, {})
+        self.assertEqual(profile.queries.total(), 3)
+        self.assertEqual(profile.duplicates(), (("SELECT ?", 2),))
+
+    def test_summarize(self):
+        samples = [_sample(float(ms)) for ms in range(1, 101)]
+        samples[-1] = _sample(2000.0, duplicates=(("SELECT ?", 3),))
+        summary = stats.summarize("kingdoms:kingdom_detail", samples)
+        self.assertEqual(summary.requests, 100)
+        self.assertEqual(summary.p50_ms, 51)
+        self.assertEqual(summary.p95_ms, 96)
+        self.assertEqual(summary.max_ms, 2000)
+        self.assertEqual(summary.avg_queries, 2)
+        self.assertEqual(summary.duplicates, [("SELECT ?", 1)])
+        counts = dict(summary.histogram)
+        self.assertEqual(counts["≤10 ms"], 10)
+        self.assertEqual(counts["≤100 ms"], 49)  # 51-99
+        self.assertEqual(counts[">1000 ms"], 1)
+        self.assertEqual(sum(counts.values()), 100)
+
+    @override_settings(PROFILING_SAMPLE_SIZE=3)
+    def test_window_keeps_latest_samples(self):
+        self.addCleanup(stats.reset)
+        for ms in (1000, 1, 2, 3):
+            stats.record("home", _sample(ms))
+        [summary] = stats.summaries()
+        self.assertEqual((summary.requests, summary.max_ms), (3, 3))
+
+
+@override_settings(PROFILING_ENABLED=True)
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        stats.reset()
+        self.addCleanup(stats.reset)
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        self.client.force_login(self.player)
+
+    def _summary(self, view_name):
+        return {summary.view_name: summary for summary in stats.summaries()}[view_name]
+
+    def test_server_timing_header(self):
+        url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r"^total;dur=[\d.]+, sql;dur=[\d.]+;desc=")
+        self.assertIn(f'desc="{len(ctx.captured_queries)} queries', timing)
+        self.assertRegex(timing, r"render;dur=[\d.]+$")
+
+    def test_records_by_url_name(self):
+        url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        self.client.get(url)
+        self.client.get(url)
+        summary = self._summary("kingdoms:kingdom_detail")
+        self.assertEqual(summary.requests, 2)
+        self.assertGreater(summary.avg_queries, 0)
+        self.assertGreater(summary.avg_render_ms, 0)
+
+    def test_unresolved_path_not_recorded(self):
+        response = self.client.get("/no-such-page/")
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("Server-Timing", response)
+        self.assertEqual(stats.summaries(), [])
+
+    @override_settings(PROFILING_ENABLED=False)
+    def test_disabled(self):
+        response = self.client.get(reverse("home"))
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(stats.summaries(), [])
+
+
+@override_settings(PROFILING_ENABLED=True)
+class ProfileReportViewTests(TestCase):
+    def setUp(self):
+        stats.reset()
+        self.addCleanup(stats.reset)
+        self.url = reverse("profiler:report")
+        self.staff = User.objects.create_user(
+            username="staff",
+            email="staff@example.com",
+            password=TEST_PASSWORD,
+            is_staff=True,
+        )
+
+    def test_staff_sees_recorded_views(self):
+        stats.record("turns:turn_detail", _sample(12.0, (("SELECT ?", 4),)))
+        self.client.force_login(self.staff)
+        response = self.client.get(self.url)
+        self.assertContains(response, "turns:turn_detail")
+        self.assertContains(response, "SELECT ?")
+
+    def test_non_staff_404(self):
+        user = User.objects.create_user(
+            username="player", email="player@example.com", password=TEST_PASSWORD
+        )
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_anonymous_redirected_to_login(self):
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+
+class BenchmarkTests(TestCase):
+    def _results(self, p95_ms, throughput_rps):
+        return {
+            "scenarios": {
+                "turn_detail": {"p95_ms": p95_ms, "throughput_rps": throughput_rps}
+            }
+        }
+
+    def test_compare_flags_slower_p95_and_lower_throughput(self):
+        baseline = self._results(10.0, 100.0)
+        self.assertEqual(compare(self._results(12.0, 80.0), baseline, 0.25), [])
+        self.assertEqual(
+            compare(self._results(13.0, 70.0), baseline, 0.25),
+            [
+                ("turn_detail", "p95_ms", 10.0, 13.0),
+                ("turn_detail", "throughput_rps", 100.0, 70.0),
+            ],
+        )
+
+    def test_compare_skips_scenarios_missing_from_baseline(self):
+        self.assertEqual(compare(self._results(99.0, 1.0), {"scenarios": {}}, 0.1), [])
+
+    def test_scenarios_run_clean_against_synthetic_campaign(self):
+        campaign = generate_campaign(kingdoms=2, members=3, turns=3, activities=4)
+        kingdom = campaign.kingdoms[0]
+        turn = kingdom.turns.order_by("-turn_number").first()
+        target = ClientTarget(campaign.gms[0])
+        for scenario in scenarios(kingdom, turn):
+            with self.subTest(scenario.name):
+                result = run_scenario(target, scenario, requests=3, warmup=1)
+                self.assertEqual(result["errors"], 0)
+                self.assertEqual(result["requests"], 3)
+                self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+                self.assertGreater(result["throughput_rps"], 0)
+
+    def _benchmark_http(self, *args):
+        call_command(
+            "benchmark",
+            "--target",
+            "http://127.0.0.1:9",  # Nothing listens on the discard port.
+            "--kingdoms=2",
+            "--turns=1",
+            "--activities=1",
+            "--requests=1",
+            "--warmup=0",
+            *args,
+            stdout=io.StringIO(),
+        )
+
+    def test_http_target_needs_allow_writes(self):
+        with self.assertRaisesMessage(CommandError, "--allow-writes"):
+            self._benchmark_http()
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(Kingdom.objects.exists())
+
+    def test_http_run_deletes_only_its_own_rows(self):
+        bystander = User.objects.create_user(username="benchmarker")
+        kingdom = Kingdom.objects.create(name="Benchmark Kingdom 1")
+        with self.assertRaises(urllib.error.URLError):
+            self._benchmark_http("--allow-writes")
+        self.assertQuerySetEqual(User.objects.all(), [bystander])
+        self.assertQuerySetEqual(Kingdom.objects.all(), [kingdom])
+        self.assertFalse(Session.objects.exists())
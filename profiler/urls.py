@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import ProfileReportView
+
+app_name = "profiler"
+urlpatterns = [
+    path("", ProfileReportView.as_view(), name="report"),
+]
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.views.generic import TemplateView
+
+from . import stats
+
+
+class ProfileReportView(LoginRequiredMixin, TemplateView):
+    """Staff-only table of the rolling per-view request statistics."""
+
+    template_name = "profiler/profile_report.html"
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.user.is_authenticated and not request.user.is_staff:
+            raise Http404
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["enabled"] = settings.PROFILING_ENABLED
+        context["sample_size"] = settings.PROFILING_SAMPLE_SIZE
+        context["summaries"] = stats.summaries()
+        return context
@@ -1,11 +1,7 @@
 from django.db import models
 
-from kingdoms.constants import (
-    PROFICIENCY_BONUS,
-    AbilityScore,
-    KingdomSkill,
-    Proficiency,
-)
+from kingdoms import stats
+from kingdoms.constants import AbilityScore, KingdomSkill, Proficiency
 
 SKILL_KEY_ABILITY = {
     KingdomSkill.AGRICULTURE: AbilityScore.LOYALTY,
@@ -55,7 +51,6 @@ class KingdomSkillProficiency(models.Model):
 
     @property
     def proficiency_bonus(self):
-        bonus = PROFICIENCY_BONUS.get(self.proficiency, 0)
-        if bonus == 0:
+        if self.proficiency == Proficiency.UNTRAINED:
             return 0
-        return self.kingdom.level + bonus
+        return stats.proficiency_bonus(self.kingdom.level, self.proficiency)
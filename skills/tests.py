@@ -1,9 +1,11 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 
 from kingdoms.constants import KingdomSkill, Proficiency
 from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from kingdoms.testing import QueryBudgetMixin
 
 from .models import KingdomSkillProficiency
 
@@ -48,6 +50,7 @@ class KingdomSkillProficiencyTests(TestCase):
 
 class SkillsUpdateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -156,3 +159,43 @@ class SkillsUpdateViewTests(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
         self.assertIn("/accounts/login/", response.url)
+
+
+class SkillsQueryBudgetTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.url = reverse("skills:skills_update", kwargs={"pk": self.kingdom.pk})
+        self.client.force_login(self.gm)
+
+    def test_skills_update_get(self):
+        # session, user, membership+kingdom, skills
+        self.assertQueryBudget(5, self.url)
+
+    def test_skills_update_post(self):
+        data = {
+            "form-TOTAL_FORMS": "16",
+            "form-INITIAL_FORMS": "16",
+            "form-MIN_NUM_FORMS": "0",
+            "form-MAX_NUM_FORMS": "1000",
+        }
+        for i, skill in enumerate(self.kingdom.skill_proficiencies.all()):
+            data.update(
+                {
+                    f"form-{i}-id": skill.pk,
+                    f"form-{i}-proficiency": Proficiency.TRAINED,
+                }
+            )
+        # 4 setup queries, one pk validation and one UPDATE per skill form
+        self.assertQueryBudget(37, self.url, method="post", data=data, status=302)
@@ -4,6 +4,8 @@ from django.urls import reverse
 from django.views.generic.base import TemplateView
 
 from kingdoms.mixins import GMRequiredMixin
+from kingdoms.models import Kingdom
+from kingdoms.stats import get_stat_sheet
 
 from .forms import SkillProficiencyFormSet
 
@@ -17,9 +19,14 @@ class SkillsUpdateView(GMRequiredMixin, TemplateView):
             context["formset"] = SkillProficiencyFormSet(
                 queryset=self.kingdom.skill_proficiencies.all()
             )
-        gov_skills = self.kingdom.government_skill_boosts
-        for form in context["formset"]:
-            form.government_boosted = form.instance.skill in gov_skills
+        formset = context["formset"]
+        sheet = get_stat_sheet(self.kingdom, proficiencies=formset.get_queryset())
+        skill_lines = {line.skill: line for line in sheet.skills}
+        for form in formset:
+            form.skill_line = skill_lines.get(form.instance.skill)
+            form.government_boosted = bool(
+                form.skill_line and form.skill_line.government_boosted
+            )
         return context
 
     def post(self, request, *args, **kwargs):
@@ -28,7 +35,8 @@ class SkillsUpdateView(GMRequiredMixin, TemplateView):
             queryset=self.kingdom.skill_proficiencies.all(),
         )
         if formset.is_valid():
-            formset.save()
+            with Kingdom.batched_version_bumps():
+                formset.save()
             messages.success(request, "Skill proficiencies updated.")
             return redirect(
                 reverse(
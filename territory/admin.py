@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from .models import Hex, Settlement, SettlementStructure, WorkSite
+
+
+class WorkSiteInline(admin.StackedInline):
+    model = WorkSite
+    extra = 0
+
+
+class SettlementStructureInline(admin.TabularInline):
+    model = SettlementStructure
+    extra = 0
+
+
+@admin.register(Hex)
+class HexAdmin(admin.ModelAdmin):
+    list_display = ["kingdom", "q", "r", "terrain_type", "status"]
+    list_filter = ["kingdom", "status", "terrain_type"]
+    inlines = [WorkSiteInline]
+
+
+@admin.register(Settlement)
+class SettlementAdmin(admin.ModelAdmin):
+    list_display = ["name", "kingdom", "settlement_type", "is_capital"]
+    list_filter = ["kingdom", "settlement_type"]
+    inlines = [SettlementStructureInline]
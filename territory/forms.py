@@ -0,0 +1,10 @@
+from django import forms
+
+from .models import Hex
+
+
+class HexClaimForm(forms.ModelForm):
+    class Meta:
+        model = Hex
+        fields = ["q", "r", "terrain_type", "resource"]
+        labels = {"q": "Column (q)", "r": "Row (r)"}
@@ -0,0 +1,154 @@
+"""In-memory index over a kingdom's claimed hexes.
+
+Neighbor, radius and contiguity questions are answered from a set of axial
+coordinates loaded in one query, instead of a query per hex.
+"""
+
+from collections import deque
+
+from django.core.exceptions import ValidationError
+
+from .models import Hex, HexStatus
+
+# Axial offsets of the six neighbors of a hex.
+DIRECTIONS = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
+
+def neighbors(coords):
+    q, r = coords
+    return [(q + dq, r + dr) for dq, dr in DIRECTIONS]
+
+
+def distance(a, b):
+    dq = a[0] - b[0]
+    dr = a[1] - b[1]
+    return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
+
+
+def within(coords, radius):
+    """Every coordinate at most ``radius`` hexes from ``coords``, itself included."""
+    q, r = coords
+    return [
+        (q + dq, r + dr)
+        for dq in range(-radius, radius + 1)
+        for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1)
+    ]
+
+
+class HexGrid:
+    """Set of claimed (q, r) coordinates with hex-grid queries."""
+
+    def __init__(self, coords=()):
+        self._coords = set(coords)
+
+    @classmethod
+    def for_kingdom(cls, kingdom):
+        return cls(
+            Hex.objects.filter(kingdom=kingdom, status=HexStatus.CLAIMED).values_list(
+                "q", "r"
+            )
+        )
+
+    def __contains__(self, coords):
+        return tuple(coords) in self._coords
+
+    def __len__(self):
+        return len(self._coords)
+
+    def __iter__(self):
+        return iter(self._coords)
+
+    def add(self, coords):
+        self._coords.add(tuple(coords))
+
+    def discard(self, coords):
+        self._coords.discard(tuple(coords))
+
+    def adjacent(self, coords):
+        """Claimed neighbors of ``coords``."""
+        return [n for n in neighbors(coords) if n in self._coords]
+
+    def in_radius(self, coords, radius):
+        """Claimed hexes within ``radius`` of ``coords``."""
+        return [c for c in within(coords, radius) if c in self._coords]
+
+    def influenced_by(self, settlement):
+        """Claimed hexes a settlement's influence covers.
+
+        A capital covers the whole kingdom regardless of its radius.
+        """
+        if settlement.is_capital:
+            return set(self._coords)
+        origin = (settlement.hex.q, settlement.hex.r)
+        return set(self.in_radius(origin, settlement.influence_radius))
+
+    def is_contiguous(self):
+        if not self._coords:
+            return True
+        start = next(iter(self._coords))
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for n in self.adjacent(queue.popleft()):
+                if n not in seen:
+                    seen.add(n)
+                    queue.append(n)
+        return len(seen) == len(self._coords)
+
+    def can_claim(self, coords):
+        """A kingdom's first hex can go anywhere; later ones must border it."""
+        if coords in self:
+            return False
+        return not self._coords or bool(self.adjacent(coords))
+
+
+def claim_hex(kingdom, q, r, grid=None, **fields):
+    """Claim hex (q, r) for ``kingdom``, creating it if it isn't mapped yet.
+
+    Pass ``grid`` when claiming several hexes in a row to reuse one index.
+
+    Raises:
+        ValidationError: If the hex is already claimed or not adjacent to
+            the kingdom's territory.
+    """
+    if grid is None:
+        grid = HexGrid.for_kingdom(kingdom)
+    if (q, r) in grid:
+        raise ValidationError(f"Hex ({q}, {r}) is already claimed.")
+    if not grid.can_claim((q, r)):
+        raise ValidationError(
+            f"Hex ({q}, {r}) must border the kingdom's claimed territory."
+        )
+    hex_, created = Hex.objects.get_or_create(
+        kingdom=kingdom,
+        q=q,
+        r=r,
+        defaults={**fields, "status": HexStatus.CLAIMED},
+    )
+    if not created:
+        hex_.status = HexStatus.CLAIMED
+        hex_.save()
+    grid.add((q, r))
+    return hex_
+
+
+def release_hex(kingdom, hex_, grid=None):
+    """Give up a claimed hex, leaving it reconnoitered.
+
+    Raises:
+        ValidationError: If the hex isn't claimed or releasing it would
+            split the kingdom's territory in two.
+    """
+    if grid is None:
+        grid = HexGrid.for_kingdom(kingdom)
+    if hex_.coords not in grid:
+        raise ValidationError(f"Hex {hex_} is not claimed.")
+    grid.discard(hex_.coords)
+    if not grid.is_contiguous():
+        grid.add(hex_.coords)
+        raise ValidationError(
+            f"Releasing hex {hex_} would split the kingdom's territory."
+        )
+    hex_.status = HexStatus.RECONNOITERED
+    hex_.save()
+    return hex_
@@ -0,0 +1,208 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("kingdoms", "0015_kingdom_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Hex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("q", models.SmallIntegerField()),
+                ("r", models.SmallIntegerField()),
+                (
+                    "terrain_type",
+                    models.CharField(
+                        choices=[
+                            ("plains", "Plains"),
+                            ("forest", "Forest"),
+                            ("hills", "Hills"),
+                            ("mountains", "Mountains"),
+                            ("swamp", "Swamp"),
+                            ("lake", "Lake"),
+                        ],
+                        default="plains",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("unexplored", "Unexplored"),
+                            ("reconnoitered", "Reconnoitered"),
+                            ("claimed", "Claimed"),
+                            ("lost", "Lost"),
+                        ],
+                        default="unexplored",
+                        max_length=13,
+                    ),
+                ),
+                ("has_road", models.BooleanField(default=False)),
+                ("has_bridge", models.BooleanField(default=False)),
+                ("is_farmland", models.BooleanField(default=False)),
+                ("is_landmark", models.BooleanField(default=False)),
+                ("is_refuge", models.BooleanField(default=False)),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[
+                            ("none", "None"),
+                            ("lumber", "Lumber Resource"),
+                            ("ore", "Ore Resource"),
+                            ("stone", "Stone Resource"),
+                        ],
+                        default="none",
+                        max_length=6,
+                    ),
+                ),
+                ("notes", models.TextField(blank=True)),
+                (
+                    "kingdom",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="hexes",
+                        to="kingdoms.kingdom",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "hexes",
+                "ordering": ["kingdom", "q", "r"],
+                "unique_together": {("kingdom", "q", "r")},
+            },
+        ),
+        migrations.CreateModel(
+            name="Settlement",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                (
+                    "settlement_type",
+                    models.CharField(
+                        choices=[
+                            ("village", "Village"),
+                            ("town", "Town"),
+                            ("city", "City"),
+                            ("metropolis", "Metropolis"),
+                        ],
+                        default="village",
+                        max_length=10,
+                    ),
+                ),
+                ("is_capital", models.BooleanField(default=False)),
+                ("level", models.PositiveSmallIntegerField(default=1)),
+                ("consumption", models.PositiveSmallIntegerField(default=1)),
+                ("water_borders", models.JSONField(blank=True, default=list)),
+                ("notes", models.TextField(blank=True)),
+                (
+                    "hex",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="settlement",
+                        to="territory.hex",
+                    ),
+                ),
+                (
+                    "kingdom",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="settlements",
+                        to="kingdoms.kingdom",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="SettlementStructure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("structure_name", models.CharField(max_length=100)),
+                ("lots_occupied", models.PositiveSmallIntegerField(default=1)),
+                (
+                    "block_number",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("is_residential", models.BooleanField(default=False)),
+                ("is_infrastructure", models.BooleanField(default=False)),
+                ("notes", models.TextField(blank=True)),
+                (
+                    "settlement",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="structures",
+                        to="territory.settlement",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="WorkSite",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "site_type",
+                    models.CharField(
+                        choices=[
+                            ("lumber_camp", "Lumber Camp"),
+                            ("mine", "Mine"),
+                            ("quarry", "Quarry"),
+                        ],
+                        max_length=11,
+                    ),
+                ),
+                (
+                    "hex",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="work_site",
+                        to="territory.hex",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 6.0.2 on 2026-10-17 03:10
+
+from collections import deque
+
+from django.db import migrations
+from django.db.models import Count, F, Q
+
+# Axial offsets of the six neighbors of a hex.
+DIRECTIONS = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
+SIZE_CATEGORIES = [
+    (9, "Territory"),
+    (24, "Province"),
+    (49, "State"),
+    (99, "Country"),
+    (None, "Dominion"),
+]
+
+
+def size_category(hex_count):
+    for max_hexes, label in SIZE_CATEGORIES:
+        if max_hexes is None or hex_count <= max_hexes:
+            return label
+
+
+def fill_territory(claimed, count):
+    """``count`` new coordinates growing contiguously out from ``claimed``.
+
+    Breadth-first from the claimed hexes, or from (0, 0) for a kingdom with
+    none, so the new hexes sit next to the kingdom rather than anywhere.
+    """
+    new = []
+    seen = set(claimed)
+    queue = deque(sorted(claimed))
+    if not queue:
+        seen.add((0, 0))
+        queue.append((0, 0))
+        new.append((0, 0))
+    while queue and len(new) < count:
+        q, r = queue.popleft()
+        for dq, dr in DIRECTIONS:
+            coords = (q + dq, r + dr)
+            if coords in seen:
+                continue
+            seen.add(coords)
+            queue.append(coords)
+            new.append(coords)
+            if len(new) == count:
+                break
+    return new[:count]
+
+
+def backfill_hexes(apps, schema_editor):
+    """Give every kingdom one claimed Hex row per hex its counter records.
+
+    Before the territory app, GMs typed ``claimed_hexes`` in by hand, so no
+    rows stand behind it. Counters that came out below the row count are
+    raised to match.
+    """
+    Hex = apps.get_model("territory", "Hex")
+    Kingdom = apps.get_model("kingdoms", "Kingdom")
+    KingdomSummary = apps.get_model("kingdoms", "KingdomSummary")
+    kingdoms = Kingdom.objects.annotate(
+        claimed_rows=Count("hexes", filter=Q(hexes__status="claimed"))
+    ).exclude(claimed_hexes=F("claimed_rows"))
+    for kingdom in kingdoms:
+        if kingdom.claimed_rows > kingdom.claimed_hexes:
+            count = kingdom.claimed_rows
+            Kingdom.objects.filter(pk=kingdom.pk).update(
+                claimed_hexes=count,
+                version=F("version") + 1,
+                stats_version=F("stats_version") + 1,
+            )
+            KingdomSummary.objects.filter(kingdom_id=kingdom.pk).update(
+                claimed_hexes=count, size_category=size_category(count)
+            )
+            continue
+        statuses = {
+            (q, r): status
+            for q, r, status in Hex.objects.filter(kingdom_id=kingdom.pk).values_list(
+                "q", "r", "status"
+            )
+        }
+        claimed = {coords for coords, status in statuses.items() if status == "claimed"}
+        new = fill_territory(claimed, kingdom.claimed_hexes - len(claimed))
+        # Mapped but unclaimed hexes are claimed in place; the rest are created.
+        for q, r in new:
+            if (q, r) in statuses:
+                Hex.objects.filter(kingdom_id=kingdom.pk, q=q, r=r).update(
+                    status="claimed"
+                )
+        Hex.objects.bulk_create(
+            Hex(kingdom_id=kingdom.pk, q=q, r=r, status="claimed")
+            for q, r in new
+            if (q, r) not in statuses
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0018_kingdom_stats_version"),
+        ("territory", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_hexes, migrations.RunPython.noop),
+    ]
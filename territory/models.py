@@ -1 +1,225 @@
 """Territory models for Phase 3: Hex, WorkSite, Settlement, SettlementStructure."""
+
+from django.db import models, transaction
+
+
+class TerrainType(models.TextChoices):
+    PLAINS = "plains", "Plains"
+    FOREST = "forest", "Forest"
+    HILLS = "hills", "Hills"
+    MOUNTAINS = "mountains", "Mountains"
+    SWAMP = "swamp", "Swamp"
+    LAKE = "lake", "Lake"
+
+
+class HexStatus(models.TextChoices):
+    UNEXPLORED = "unexplored", "Unexplored"
+    RECONNOITERED = "reconnoitered", "Reconnoitered"
+    CLAIMED = "claimed", "Claimed"
+    LOST = "lost", "Lost"
+
+
+class HexResource(models.TextChoices):
+    NONE = "none", "None"
+    LUMBER = "lumber", "Lumber Resource"
+    ORE = "ore", "Ore Resource"
+    STONE = "stone", "Stone Resource"
+
+
+class WorkSiteType(models.TextChoices):
+    LUMBER_CAMP = "lumber_camp", "Lumber Camp"
+    MINE = "mine", "Mine"
+    QUARRY = "quarry", "Quarry"
+
+
+class SettlementType(models.TextChoices):
+    VILLAGE = "village", "Village"
+    TOWN = "town", "Town"
+    CITY = "city", "City"
+    METROPOLIS = "metropolis", "Metropolis"
+
+
+# Hexes (beyond its own) a settlement's influence reaches.
+INFLUENCE_RADIUS = {
+    SettlementType.VILLAGE: 0,
+    SettlementType.TOWN: 1,
+    SettlementType.CITY: 2,
+    SettlementType.METROPOLIS: 3,
+}
+
+
+class Hex(models.Model):
+    """One map hex, addressed by axial coordinates (q, r).
+
+    Claiming or releasing a hex through ``save``/``delete`` keeps
+    ``Kingdom.claimed_hexes`` in step, so size lookups never count rows.
+    Queryset ``update()``/``delete()`` bypass the counter.
+    """
+
+    kingdom = models.ForeignKey(
+        "kingdoms.Kingdom",
+        on_delete=models.CASCADE,
+        related_name="hexes",
+    )
+    q = models.SmallIntegerField()
+    r = models.SmallIntegerField()
+    terrain_type = models.CharField(
+        max_length=9,
+        choices=TerrainType,
+        default=TerrainType.PLAINS,
+    )
+    status = models.CharField(
+        max_length=13,
+        choices=HexStatus,
+        default=HexStatus.UNEXPLORED,
+    )
+
+    # Terrain features (typically one per hex)
+    has_road = models.BooleanField(default=False)
+    has_bridge = models.BooleanField(default=False)
+    is_farmland = models.BooleanField(default=False)
+    is_landmark = models.BooleanField(default=False)
+    is_refuge = models.BooleanField(default=False)
+    resource = models.CharField(
+        max_length=6,
+        choices=HexResource,
+        default=HexResource.NONE,
+    )
+
+    notes = models.TextField(blank=True)
+
+    class Meta:
+        # The unique index on (kingdom, q, r) doubles as the map lookup index.
+        unique_together = [("kingdom", "q", "r")]
+        ordering = ["kingdom", "q", "r"]
+        verbose_name_plural = "hexes"
+
+    def __str__(self):
+        return f"({self.q}, {self.r})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_claimed = instance.__dict__.get("status") == HexStatus.CLAIMED
+        return instance
+
+    @property
+    def coords(self):
+        return (self.q, self.r)
+
+    @property
+    def is_claimed(self):
+        return self.status == HexStatus.CLAIMED
+
+    def save(self, *args, **kwargs):
+        was_claimed = getattr(self, "_loaded_claimed", False)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self._adjust_claimed_count(self.is_claimed - was_claimed)
+        self._loaded_claimed = self.is_claimed
+
+    def delete(self, *args, **kwargs):
+        was_claimed = getattr(self, "_loaded_claimed", False)
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self._adjust_claimed_count(-was_claimed)
+        self._loaded_claimed = False
+        return result
+
+    def _adjust_claimed_count(self, delta):
+        if not delta:
+            return
+        from kingdoms.models import Kingdom, KingdomSummary
+
+        # Size feeds the control DC, so the stats version moves too.
+        Kingdom.objects.filter(pk=self.kingdom_id).update(
+            claimed_hexes=models.F("claimed_hexes") + delta,
+            version=models.F("version") + 1,
+            stats_version=models.F("stats_version") + 1,
+        )
+        KingdomSummary.refresh_size(self.kingdom_id)
+        if Hex.kingdom.is_cached(self):
+            kingdom = self.kingdom
+            kingdom.claimed_hexes += delta
+            kingdom.version += 1
+            kingdom.stats_version += 1
+            kingdom.__dict__.pop("_size_info", None)
+            kingdom.__dict__.pop("stat_sheet", None)
+
+
+class WorkSite(models.Model):
+    hex = models.OneToOneField(
+        Hex,
+        on_delete=models.CASCADE,
+        related_name="work_site",
+    )
+    site_type = models.CharField(max_length=11, choices=WorkSiteType)
+
+    def __str__(self):
+        return f"{self.get_site_type_display()} at {self.hex}"
+
+    @property
+    def production(self):
+        """Commodities per turn: 2 on a hex with the matching resource, else 1."""
+        matching = {
+            WorkSiteType.LUMBER_CAMP: HexResource.LUMBER,
+            WorkSiteType.MINE: HexResource.ORE,
+            WorkSiteType.QUARRY: HexResource.STONE,
+        }
+        return 2 if self.hex.resource == matching[self.site_type] else 1
+
+
+class Settlement(models.Model):
+    kingdom = models.ForeignKey(
+        "kingdoms.Kingdom",
+        on_delete=models.CASCADE,
+        related_name="settlements",
+    )
+    hex = models.OneToOneField(
+        Hex,
+        on_delete=models.CASCADE,
+        related_name="settlement",
+    )
+    name = models.CharField(max_length=100)
+    settlement_type = models.CharField(
+        max_length=10,
+        choices=SettlementType,
+        default=SettlementType.VILLAGE,
+    )
+    is_capital = models.BooleanField(default=False)
+
+    # Computed from blocks/lots - but may be overridden by GM
+    level = models.PositiveSmallIntegerField(default=1)
+    consumption = models.PositiveSmallIntegerField(default=1)
+
+    # Border tracking, e.g. ["north", "east"]
+    water_borders = models.JSONField(default=list, blank=True)
+
+    notes = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def influence_radius(self):
+        return INFLUENCE_RADIUS[self.settlement_type]
+
+
+class SettlementStructure(models.Model):
+    settlement = models.ForeignKey(
+        Settlement,
+        on_delete=models.CASCADE,
+        related_name="structures",
+    )
+    structure_name = models.CharField(max_length=100)
+    lots_occupied = models.PositiveSmallIntegerField(default=1)
+    block_number = models.PositiveSmallIntegerField(null=True, blank=True)
+    is_residential = models.BooleanField(default=False)
+    is_infrastructure = models.BooleanField(default=False)
+    notes = models.TextField(blank=True)
+
+    def __str__(self):
+        return self.structure_name
@@ -0,0 +1,261 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.urls import reverse
+
+from kingdoms.models import Kingdom, KingdomMembership, KingdomSummary, MembershipRole
+
+from .hexgrid import HexGrid, claim_hex, distance, release_hex, within
+from .models import (
+    Hex,
+    HexResource,
+    HexStatus,
+    Settlement,
+    SettlementType,
+    WorkSite,
+    WorkSiteType,
+)
+
+User = get_user_model()
+
+TEST_PASSWORD = "testpass123"  # nosec B105
+
+
+class HexGridTests(TestCase):
+    def test_distance(self):
+        self.assertEqual(distance((0, 0), (0, 0)), 0)
+        self.assertEqual(distance((0, 0), (1, -1)), 1)
+        self.assertEqual(distance((0, 0), (2, 1)), 3)
+
+    def test_within_counts(self):
+        # 1 + 6 + 12 + 18 hexes out to radius 3
+        self.assertEqual(len(within((4, -2), 3)), 37)
+        self.assertTrue(all(distance((4, -2), c) <= 3 for c in within((4, -2), 3)))
+
+    def test_adjacent(self):
+        grid = HexGrid([(0, 0), (1, 0), (3, 3)])
+        self.assertEqual(grid.adjacent((0, 0)), [(1, 0)])
+
+    def test_contiguity(self):
+        self.assertTrue(HexGrid([(0, 0), (1, 0), (1, -1)]).is_contiguous())
+        self.assertFalse(HexGrid([(0, 0), (2, 0)]).is_contiguous())
+        self.assertTrue(HexGrid().is_contiguous())
+
+    def test_can_claim(self):
+        self.assertTrue(HexGrid().can_claim((5, 5)))
+        grid = HexGrid([(0, 0)])
+        self.assertTrue(grid.can_claim((0, 1)))
+        self.assertFalse(grid.can_claim((0, 2)))
+        self.assertFalse(grid.can_claim((0, 0)))
+
+
+class HexClaimTests(TestCase):
+    def setUp(self):
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+
+    def test_claim_maintains_counter(self):
+        grid = HexGrid.for_kingdom(self.kingdom)
+        for q in range(12):
+            claim_hex(self.kingdom, q, 0, grid=grid)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 12)
+        self.assertEqual(self.kingdom.size_category, "Province")
+
+    def test_claim_updates_loaded_kingdom(self):
+        hex_ = Hex(kingdom=self.kingdom, q=0, r=0, status=HexStatus.CLAIMED)
+        hex_.save()
+        self.assertEqual(self.kingdom.hex_count, 1)
+
+    def test_claim_rejects_non_adjacent(self):
+        claim_hex(self.kingdom, 0, 0)
+        with self.assertRaises(ValidationError):
+            claim_hex(self.kingdom, 3, 0)
+        with self.assertRaises(ValidationError):
+            claim_hex(self.kingdom, 0, 0)
+
+    def test_claiming_reconnoitered_hex(self):
+        claim_hex(self.kingdom, 0, 0)
+        Hex.objects.create(
+            kingdom=self.kingdom, q=1, r=0, status=HexStatus.RECONNOITERED
+        )
+        claim_hex(self.kingdom, 1, 0)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 2)
+        self.assertEqual(self.kingdom.hexes.count(), 2)
+
+    def test_losing_and_deleting_hexes(self):
+        first = claim_hex(self.kingdom, 0, 0)
+        second = claim_hex(self.kingdom, 1, 0)
+        first.status = HexStatus.LOST
+        first.save()
+        second.delete()
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 0)
+
+    def test_claim_bumps_kingdom_version(self):
+        version = self.kingdom.version
+        stats_version = self.kingdom.stats_version
+        claim_hex(self.kingdom, 0, 0)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.version, version + 1)
+        self.assertEqual(self.kingdom.stats_version, stats_version + 1)
+
+    def test_grid_loads_in_one_query(self):
+        for q in range(5):
+            claim_hex(self.kingdom, q, 0)
+        with self.assertNumQueries(1):
+            grid = HexGrid.for_kingdom(self.kingdom)
+            self.assertTrue(grid.is_contiguous())
+            self.assertEqual(len(grid.in_radius((0, 0), 2)), 3)
+
+    def test_release_leaves_hex_reconnoitered(self):
+        claim_hex(self.kingdom, 0, 0)
+        edge = claim_hex(self.kingdom, 1, 0)
+        release_hex(self.kingdom, edge)
+        edge.refresh_from_db()
+        self.assertEqual(edge.status, HexStatus.RECONNOITERED)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 1)
+
+    def test_release_rejects_splitting_territory(self):
+        grid = HexGrid.for_kingdom(self.kingdom)
+        for q in range(3):
+            claim_hex(self.kingdom, q, 0, grid=grid)
+        middle = Hex.objects.get(kingdom=self.kingdom, q=1, r=0)
+        with self.assertRaises(ValidationError):
+            release_hex(self.kingdom, middle, grid=grid)
+        self.assertIn((1, 0), grid)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 3)
+
+
+class TerritoryViewTests(TestCase):
+    def setUp(self):
+        self.gm = User.objects.create_user(
+            username="gm", email="gm@example.com", password=TEST_PASSWORD
+        )
+        self.player = User.objects.create_user(
+            username="player", email="player@example.com", password=TEST_PASSWORD
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=self.gm, kingdom=self.kingdom, role=MembershipRole.GM
+        )
+        KingdomMembership.objects.create(
+            user=self.player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        self.url = reverse("territory:territory", kwargs={"pk": self.kingdom.pk})
+        self.client.login(username="gm", password=TEST_PASSWORD)
+
+    def _claim(self, q, r):
+        return self.client.post(
+            self.url, {"q": q, "r": r, "terrain_type": "forest", "resource": "none"}
+        )
+
+    def test_gm_claims_hexes(self):
+        self.assertRedirects(self._claim(0, 0), self.url)
+        self.assertRedirects(self._claim(1, 0), self.url)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 2)
+        response = self.client.get(self.url)
+        self.assertContains(response, "(1, 0)")
+        self.assertContains(response, "Forest")
+
+    def test_claim_not_bordering_territory_shows_error(self):
+        self._claim(0, 0)
+        response = self._claim(3, 0)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "must border")
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 1)
+
+    def test_gm_releases_hex(self):
+        self._claim(0, 0)
+        hex_ = Hex.objects.get(kingdom=self.kingdom)
+        release_url = reverse(
+            "territory:hex_release",
+            kwargs={"pk": self.kingdom.pk, "hex_pk": hex_.pk},
+        )
+        self.assertRedirects(self.client.post(release_url), self.url)
+        self.kingdom.refresh_from_db()
+        self.assertEqual(self.kingdom.claimed_hexes, 0)
+
+    def test_release_of_other_kingdoms_hex_is_404(self):
+        other = Kingdom.objects.create(name="Other Kingdom")
+        hex_ = claim_hex(other, 0, 0)
+        release_url = reverse(
+            "territory:hex_release",
+            kwargs={"pk": self.kingdom.pk, "hex_pk": hex_.pk},
+        )
+        self.assertEqual(self.client.post(release_url).status_code, 404)
+
+    def test_player_cannot_manage_territory(self):
+        self.client.login(username="player", password=TEST_PASSWORD)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.assertEqual(self._claim(0, 0).status_code, 404)
+
+
+class BackfillHexesMigrationTests(TestCase):
+    backfill = staticmethod(
+        import_module("territory.migrations.0002_backfill_claimed_hexes").backfill_hexes
+    )
+
+    def test_creates_contiguous_hexes_for_manual_counter(self):
+        kingdom = Kingdom.objects.create(name="Test Kingdom")
+        claim_hex(kingdom, 5, 5)
+        Kingdom.objects.filter(pk=kingdom.pk).update(claimed_hexes=12)
+        self.backfill(apps, None)
+        grid = HexGrid.for_kingdom(kingdom)
+        self.assertEqual(len(grid), 12)
+        self.assertIn((5, 5), grid)
+        self.assertTrue(grid.is_contiguous())
+
+    def test_raises_counter_below_row_count(self):
+        kingdom = Kingdom.objects.create(name="Test Kingdom")
+        # bulk_create skips Hex.save(), so the counter stays at 0.
+        Hex.objects.bulk_create(
+            Hex(kingdom=kingdom, q=q, r=0, status=HexStatus.CLAIMED) for q in range(12)
+        )
+        self.backfill(apps, None)
+        kingdom.refresh_from_db()
+        self.assertEqual(kingdom.claimed_hexes, 12)
+        self.assertEqual(
+            KingdomSummary.objects.get(kingdom=kingdom).size_category, "Province"
+        )
+
+
+class SettlementTests(TestCase):
+    def setUp(self):
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.grid = HexGrid.for_kingdom(self.kingdom)
+        for q in range(-3, 4):
+            claim_hex(self.kingdom, q, 0, grid=self.grid)
+        self.center = Hex.objects.get(kingdom=self.kingdom, q=0, r=0)
+
+    def test_influence_radius(self):
+        town = Settlement.objects.create(
+            kingdom=self.kingdom,
+            hex=self.center,
+            name="Tuskwater",
+            settlement_type=SettlementType.TOWN,
+        )
+        self.assertEqual(self.grid.influenced_by(town), {(-1, 0), (0, 0), (1, 0)})
+
+    def test_capital_influences_whole_kingdom(self):
+        capital = Settlement.objects.create(
+            kingdom=self.kingdom, hex=self.center, name="Capital", is_capital=True
+        )
+        self.assertEqual(len(self.grid.influenced_by(capital)), 7)
+
+
+class WorkSiteTests(TestCase):
+    def test_production_doubles_on_matching_resource(self):
+        kingdom = Kingdom.objects.create(name="Test Kingdom")
+        hex_ = claim_hex(kingdom, 0, 0, resource=HexResource.ORE)
+        mine = WorkSite.objects.create(hex=hex_, site_type=WorkSiteType.MINE)
+        self.assertEqual(mine.production, 2)
+        mine.site_type = WorkSiteType.QUARRY
+        self.assertEqual(mine.production, 1)
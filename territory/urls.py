@@ -0,0 +1,17 @@
+from django.urls import path
+
+from .views import HexReleaseView, TerritoryView
+
+app_name = "territory"
+urlpatterns = [
+    path(
+        "<int:pk>/territory/",
+        TerritoryView.as_view(),
+        name="territory",
+    ),
+    path(
+        "<int:pk>/territory/<int:hex_pk>/release/",
+        HexReleaseView.as_view(),
+        name="hex_release",
+    ),
+]
@@ -0,0 +1,49 @@
+from django.contrib import messages
+from django.core.exceptions import ValidationError
+from django.shortcuts import get_object_or_404, redirect
+from django.urls import reverse
+from django.views import View
+from django.views.generic.base import TemplateView
+
+from kingdoms.mixins import GMRequiredMixin
+
+from .forms import HexClaimForm
+from .hexgrid import claim_hex, release_hex
+from .models import Hex, HexStatus
+
+
+class TerritoryView(GMRequiredMixin, TemplateView):
+    template_name = "kingdoms/territory.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if "form" not in kwargs:
+            context["form"] = HexClaimForm()
+        context["hexes"] = self.kingdom.hexes.filter(status=HexStatus.CLAIMED)
+        return context
+
+    def post(self, request, *args, **kwargs):
+        form = HexClaimForm(request.POST)
+        if form.is_valid():
+            try:
+                hex_ = claim_hex(self.kingdom, **form.cleaned_data)
+            except ValidationError as exc:
+                form.add_error(None, exc)
+            else:
+                messages.success(request, f"Hex {hex_} claimed.")
+                return redirect(
+                    reverse("territory:territory", kwargs={"pk": self.kingdom.pk})
+                )
+        return self.render_to_response(self.get_context_data(form=form))
+
+
+class HexReleaseView(GMRequiredMixin, View):
+    def post(self, request, *args, **kwargs):
+        hex_ = get_object_or_404(Hex, pk=self.kwargs["hex_pk"], kingdom=self.kingdom)
+        try:
+            release_hex(self.kingdom, hex_)
+        except ValidationError as exc:
+            messages.error(request, exc.messages[0])
+        else:
+            messages.success(request, f"Hex {hex_} released.")
+        return redirect(reverse("territory:territory", kwargs={"pk": self.kingdom.pk}))
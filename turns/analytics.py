@@ -0,0 +1,192 @@
+"""Campaign analytics read from per-turn rollup tables.
+
+Completing a turn (``KingdomTurn.complete_turn``) writes that turn's rollups:
+one ``TurnRollup`` with the kingdom's XP, RP, unrest and ruin at the end of
+the turn, and one ``ActivityRollup`` per skill, leadership role and trait
+with its outcome counts. Re-completing a turn replaces its rows. The
+dashboard sums the rollups instead of scanning ``ActivityLog``, so a page
+load is two small queries however many activities the campaign has.
+
+Activities edited on a turn after it completed are picked up the next time
+that turn's rollups are refreshed, or by ``manage.py rebuild_analytics``.
+"""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from kingdoms.constants import KingdomSkill
+from leadership.models import LeadershipRole
+
+from .models import (
+    ActivityRollup,
+    ActivityTrait,
+    DegreeOfSuccess,
+    KingdomTurn,
+    RollupDimension,
+    TurnRollup,
+)
+from .snapshots import state_at, unflatten
+
+OUTCOME_FIELDS = {
+    DegreeOfSuccess.CRITICAL_SUCCESS: "critical_successes",
+    DegreeOfSuccess.SUCCESS: "successes",
+    DegreeOfSuccess.FAILURE: "failures",
+    DegreeOfSuccess.CRITICAL_FAILURE: "critical_failures",
+}
+COUNT_FIELDS = ["logged", "attempts", *OUTCOME_FIELDS.values()]
+
+# Kingdom fields recorded on each TurnRollup.
+KINGDOM_FIGURES = [
+    "level",
+    "xp",
+    "unrest",
+    "corruption_points",
+    "crime_points",
+    "strife_points",
+    "decay_points",
+]
+
+KEY_LABELS = {
+    RollupDimension.SKILL: KingdomSkill,
+    RollupDimension.ROLE: LeadershipRole,
+    RollupDimension.TRAIT: ActivityTrait,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RateLine:
+    key: str
+    label: str
+    logged: int
+    attempts: int
+    critical_successes: int
+    successes: int
+    failures: int
+    critical_failures: int
+
+    @property
+    def success_rate(self):
+        """Percent of rolled attempts that succeeded, or ``None`` if none."""
+        if not self.attempts:
+            return None
+        return 100 * (self.critical_successes + self.successes) / self.attempts
+
+
+@dataclass(frozen=True, slots=True)
+class Dashboard:
+    rates: dict  # dimension -> [RateLine], most attempted first
+    turns: list  # TurnRollup rows in turn order
+
+
+def refresh_rollups(turn, kingdom_state=None):
+    """Rewrite ``turn``'s rollup rows from its current activities.
+
+    ``kingdom_state`` maps kingdom field names to their values at the end of
+    the turn. It defaults to ``turn.kingdom`` as it stands, which is right
+    for a turn being completed now.
+    """
+    if kingdom_state is None:
+        kingdom_state = {name: getattr(turn.kingdom, name) for name in KINGDOM_FIGURES}
+    TurnRollup.objects.filter(turn=turn).delete()
+    TurnRollup.objects.create(
+        kingdom_id=turn.kingdom_id,
+        turn=turn,
+        turn_number=turn.turn_number,
+        xp_gained=turn.xp_gained,
+        starting_rp=turn.starting_rp,
+        ending_rp=turn.ending_rp,
+        rp_converted_to_xp=turn.rp_converted_to_xp,
+        **{name: kingdom_state[name] for name in KINGDOM_FIGURES},
+    )
+
+    # One GROUP BY over every combination, folded into each dimension here.
+    groups = (
+        turn.activities.order_by()
+        .values("skill_used", "performed_by__role", "activity_trait")
+        .annotate(
+            logged=Count("pk"),
+            **{
+                field: Count("pk", filter=Q(degree_of_success=degree))
+                for degree, field in OUTCOME_FIELDS.items()
+            },
+        )
+    )
+    tallies = defaultdict(Counter)
+    for group in groups:
+        keys = {
+            RollupDimension.SKILL: group["skill_used"],
+            RollupDimension.ROLE: group["performed_by__role"],
+            RollupDimension.TRAIT: group["activity_trait"],
+        }
+        for dimension, key in keys.items():
+            if not key:
+                continue
+            tally = tallies[dimension, key]
+            tally["logged"] += group["logged"]
+            for field in OUTCOME_FIELDS.values():
+                tally[field] += group[field]
+                tally["attempts"] += group[field]
+
+    ActivityRollup.objects.filter(turn=turn).delete()
+    ActivityRollup.objects.bulk_create(
+        ActivityRollup(
+            kingdom_id=turn.kingdom_id,
+            turn=turn,
+            dimension=dimension,
+            key=key,
+            **{field: tally[field] for field in COUNT_FIELDS},
+        )
+        for (dimension, key), tally in tallies.items()
+    )
+
+
+def rebuild_rollups(turns=None):
+    """Refresh the rollups of every completed turn in ``turns``.
+
+    End-of-turn kingdom figures come from each turn's snapshot, falling back
+    to the kingdom's current state for turns completed without one. Returns
+    how many turns were refreshed.
+    """
+    turns = KingdomTurn.objects.all() if turns is None else turns
+    turns = turns.filter(completed_at__isnull=False).select_related("kingdom")
+    count = 0
+    with transaction.atomic():
+        for turn in turns:
+            state = state_at(turn.kingdom_id, turn.turn_number)
+            kingdom_state = None
+            if state is not None:
+                kingdom_state = unflatten(state)["kingdom"]
+            refresh_rollups(turn, kingdom_state)
+            count += 1
+    return count
+
+
+def load_dashboard(kingdom):
+    """Read the kingdom's analytics from its rollup rows."""
+    rates = {dimension: [] for dimension in RollupDimension}
+    totals = (
+        ActivityRollup.objects.filter(kingdom=kingdom)
+        .order_by()
+        .values("dimension", "key")
+        .annotate(**{field: Sum(field) for field in COUNT_FIELDS})
+    )
+    for row in totals:
+        labels = KEY_LABELS[row["dimension"]]
+        try:
+            label = labels(row["key"]).label
+        except ValueError:
+            label = row["key"]
+        rates[row["dimension"]].append(
+            RateLine(
+                key=row["key"],
+                label=label,
+                **{field: row[field] for field in COUNT_FIELDS},
+            )
+        )
+    for lines in rates.values():
+        lines.sort(key=lambda line: (-line.attempts, -line.logged, line.label))
+    turns = list(TurnRollup.objects.filter(kingdom=kingdom).order_by("turn_number"))
+    return Dashboard(rates=rates, turns=turns)
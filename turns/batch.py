@@ -0,0 +1,111 @@
+"""Batched activity submission.
+
+A batch of activities for one turn is validated with the ``ActivityForm``
+rules, given degrees of success in one pass, and written with a single
+``bulk_create``, so logging a whole phase costs a handful of queries however
+many activities it holds. Batches are all or nothing.
+"""
+
+from collections import Counter
+
+from django.db import models, transaction
+
+from kingdoms.models import Kingdom
+from leadership.models import LeadershipAssignment
+from metrics.collectors import ACTIVITIES_LOGGED, count_on_commit
+
+from .degrees import populate_degrees
+from .forms import ActivityForm
+from .importer import ActivityImportForm
+from .live import LiveEvent, publish_on_commit
+from .models import ActivityLog, KingdomTurn, tally_fields
+
+MAX_BATCH_SIZE = 100
+
+
+class BatchInvalid(Exception):
+    """At least one activity failed validation; nothing was written.
+
+    ``errors`` has one ``{field: [messages]}`` dict per submitted item, empty
+    for the valid ones.
+    """
+
+    def __init__(self, errors):
+        super().__init__("Invalid activities.")
+        self.errors = errors
+
+
+def _form_data(item):
+    return {key: ("" if value is None else value) for key, value in item.items()}
+
+
+def submit_activities(turn, items, created_by=None):
+    """Validate ``items`` (dicts of ``ActivityForm`` fields) and log them on ``turn``.
+
+    ``performed_by`` is a leadership assignment id of the turn's kingdom,
+    checked against one lookup of the kingdom's assignments rather than a
+    query per item. Returns the created activities in submission order.
+
+    Raises:
+        BatchInvalid: If any item is invalid.
+    """
+    performers = {
+        str(pk): pk
+        for pk in LeadershipAssignment.objects.filter(
+            kingdom_id=turn.kingdom_id
+        ).values_list("pk", flat=True)
+    }
+    invalid_choice = ActivityForm.base_fields["performed_by"].error_messages[
+        "invalid_choice"
+    ]
+    activities = []
+    errors = []
+    for item in items:
+        if not isinstance(item, dict):
+            errors.append({"__all__": ["Expected a JSON object."]})
+            continue
+        form = ActivityImportForm(data=_form_data(item))
+        item_errors = {field: list(messages) for field, messages in form.errors.items()}
+        performed_by = item.get("performed_by") or None
+        if performed_by is not None:
+            performed_by = performers.get(str(performed_by))
+            if performed_by is None:
+                item_errors["performed_by"] = [invalid_choice]
+        errors.append(item_errors)
+        if not item_errors:
+            activity = form.instance
+            activity.kingdom_id = turn.kingdom_id
+            activity.turn = turn
+            activity.performed_by_id = performed_by
+            activity.created_by = created_by
+            activities.append(activity)
+    if any(errors):
+        raise BatchInvalid(errors)
+    populate_degrees(activities)
+
+    with transaction.atomic():
+        ActivityLog.objects.bulk_create(activities)
+        # bulk_create skips ActivityLog.save() and the post_save handlers, so
+        # apply their tally, version and live-page updates once for the batch.
+        deltas = Counter(
+            field
+            for activity in activities
+            for field in tally_fields(
+                activity.activity_trait, activity.degree_of_success
+            )
+        )
+        KingdomTurn.objects.filter(pk=turn.pk).update(
+            **{field: models.F(field) + delta for field, delta in deltas.items()}
+        )
+        Kingdom.bump_version(turn.kingdom_id)
+        count_on_commit(ACTIVITIES_LOGGED, len(activities))
+        for activity in activities:
+            publish_on_commit(
+                LiveEvent(
+                    type="activity.created",
+                    kingdom=turn.kingdom_id,
+                    turn=turn.pk,
+                    activity=activity.pk,
+                )
+            )
+    return activities
@@ -0,0 +1,135 @@
+"""Batch degree-of-success evaluation.
+
+Computes the same result as ``ActivityLog.calculate_degree_of_success`` for
+whole columns of rolls at once. Degrees are ranked 0 (critical failure) to 3
+(critical success); the total against the DC gives the base rank and a
+natural 20 or 1 moves it one step, clamped to the ends. NumPy, a project
+dependency, vectorizes the work; on an install without it a pure-Python loop
+gives identical results.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised where NumPy is absent
+    np = None
+
+from .models import DegreeOfSuccess
+
+# Index is the rank.
+DEGREES = (
+    DegreeOfSuccess.CRITICAL_FAILURE,
+    DegreeOfSuccess.FAILURE,
+    DegreeOfSuccess.SUCCESS,
+    DegreeOfSuccess.CRITICAL_SUCCESS,
+)
+
+
+def degree_rank(roll, modifier, dc):
+    """Rank of one check, or ``None`` if any input is missing."""
+    if roll is None or modifier is None or dc is None:
+        return None
+    total = roll + modifier
+    rank = 1 + (total >= dc) + (total >= dc + 10) - (total <= dc - 10)
+    if roll == 20:
+        rank += 1
+    elif roll == 1:
+        rank -= 1
+    return min(max(rank, 0), 3)
+
+
+# A check's odds depend only on how far the DC sits above the modifier. At or
+# below MIN_GAP every face's total is a critical success, and at or above
+# MAX_GAP a critical failure, before the natural 1/20 step; wider gaps change
+# nothing, so the table covers every (modifier, DC) pair.
+MIN_GAP = -9
+MAX_GAP = 30
+
+# ODDS_TABLE[gap - MIN_GAP] is the percent chance of each rank.
+ODDS_TABLE = tuple(
+    tuple(
+        5 * [degree_rank(face, 0, gap) for face in range(1, 21)].count(rank)
+        for rank in range(len(DEGREES))
+    )
+    for gap in range(MIN_GAP, MAX_GAP + 1)
+)
+
+
+def degree_odds(modifier, dc):
+    """Exact percent chance of each degree rank, critical failure first."""
+    gap = min(max(dc - modifier, MIN_GAP), MAX_GAP)
+    return ODDS_TABLE[gap - MIN_GAP]
+
+
+def _python_degrees(rolls, modifiers, dcs):
+    degrees = []
+    for roll, modifier, dc in zip(rolls, modifiers, dcs, strict=True):
+        rank = degree_rank(roll, modifier, dc)
+        degrees.append("" if rank is None else DEGREES[rank])
+    return degrees
+
+
+def _numpy_column(values):
+    missing = np.fromiter((value is None for value in values), dtype=bool)
+    column = np.fromiter(
+        (0 if value is None else value for value in values), dtype=np.int64
+    )
+    return column, missing
+
+
+def _numpy_degrees(rolls, modifiers, dcs):
+    if not len(rolls) == len(modifiers) == len(dcs):
+        raise ValueError("rolls, modifiers and dcs must be the same length.")
+    roll, roll_missing = _numpy_column(rolls)
+    modifier, modifier_missing = _numpy_column(modifiers)
+    dc, dc_missing = _numpy_column(dcs)
+    total = roll + modifier
+    rank = (
+        1
+        + (total >= dc).astype(np.int64)
+        + (total >= dc + 10)
+        - (total <= dc - 10)
+        + (roll == 20)
+        - (roll == 1)
+    )
+    rank = np.clip(rank, 0, 3)
+    # Shift by one so missing inputs land on the leading "".
+    rank = np.where(roll_missing | modifier_missing | dc_missing, -1, rank) + 1
+    return np.array(["", *DEGREES], dtype=object)[rank].tolist()
+
+
+def evaluate_degrees(rolls, modifiers, dcs, use_numpy=None):
+    """Degree of success for each ``(roll, modifier, dc)`` triple.
+
+    Inputs are equal-length sequences; ``None`` anywhere in a triple yields
+    ``""``, as the model method does. ``use_numpy`` forces or disables the
+    NumPy path (default: use it when available).
+    """
+    rolls, modifiers, dcs = list(rolls), list(modifiers), list(dcs)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _numpy_degrees(rolls, modifiers, dcs)
+    return _python_degrees(rolls, modifiers, dcs)
+
+
+def populate_degrees(activities, overwrite=False):
+    """Fill ``degree_of_success`` on ``activities`` in one batch.
+
+    Only blank degrees are filled unless ``overwrite`` is set, matching
+    ``ActivityLog.auto_populate_degree_of_success``. Rows without full roll
+    data keep their current degree. Returns the activities that changed.
+    """
+    activities = list(activities)
+    degrees = evaluate_degrees(
+        [activity.roll_result for activity in activities],
+        [activity.total_modifier for activity in activities],
+        [activity.dc for activity in activities],
+    )
+    changed = []
+    for activity, degree in zip(activities, degrees):
+        if not degree or degree == activity.degree_of_success:
+            continue
+        if overwrite or not activity.degree_of_success:
+            activity.degree_of_success = degree
+            changed.append(activity)
+    return changed
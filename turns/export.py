@@ -0,0 +1,212 @@
+"""Streaming campaign export as JSON Lines or CSV.
+
+Rows are read with ``.iterator()`` and written one line at a time, so memory
+use stays flat however long the campaign. Under ASGI, ``aiter_lines`` hands
+the lines over a chunk at a time. Every record carries a ``cursor``;
+passing the last one seen to ``parse_cursor`` and the result as ``after``
+resumes the export just past it.
+"""
+
+import csv
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+
+from kingdoms.pagination import (
+    InvalidCursor,
+    clean_cursor_values,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+)
+from leadership.models import LeadershipAssignment
+from skills.models import KingdomSkillProficiency
+
+from .models import ActivityLog, KingdomTurn
+
+CHUNK_SIZE = 500
+
+
+class Section:
+    """One exported table: its rows, columns and resume ordering."""
+
+    def __init__(self, name, model, columns, ordering, annotations=None):
+        self.name = name
+        self.model = model
+        self.columns = columns
+        self.ordering = ordering
+        self.annotations = annotations or {}
+
+    def clean_position(self, values):
+        """``values`` coerced to the ordering's field types.
+
+        Raises:
+            InvalidCursor: If ``values`` don't fit the ordering.
+        """
+        queryset = self.model.objects.annotate(**self.annotations)
+        return clean_cursor_values(queryset, self.ordering, values)
+
+    def rows(self, kingdom, after=None):
+        queryset = (
+            self.model.objects.filter(kingdom=kingdom)
+            .annotate(**self.annotations)
+            .order_by(*self.ordering)
+        )
+        if after is not None:
+            queryset = queryset.filter(keyset_filter(self.ordering, after))
+        # Ordering keys ride along so each row can carry its own cursor.
+        keys = [key for key in self.ordering if key not in self.columns]
+        for row in queryset.values(*self.columns, *keys).iterator(
+            chunk_size=CHUNK_SIZE
+        ):
+            position = [self.name, *(row[key] for key in self.ordering)]
+            record = {column: row[column] for column in self.columns}
+            record["cursor"] = encode_cursor(position)
+            yield record
+
+
+SECTIONS = {
+    section.name: section
+    for section in [
+        Section(
+            "leadership",
+            LeadershipAssignment,
+            [
+                "role",
+                "character_name",
+                "is_pc",
+                "is_invested",
+                "is_vacant",
+                "downtime_fulfilled",
+            ],
+            ["role", "pk"],
+        ),
+        Section("skills", KingdomSkillProficiency, ["skill", "proficiency"], ["pk"]),
+        Section(
+            "turns",
+            KingdomTurn,
+            [
+                "turn_number",
+                "in_game_month",
+                "starting_rp",
+                "resource_dice_rolled",
+                "collected_taxes",
+                "improved_lifestyle",
+                "tapped_treasury",
+                "event_occurred",
+                "event_xp",
+                "ending_rp",
+                "rp_converted_to_xp",
+                "xp_gained",
+                "leveled_up",
+                "notes",
+                "created_at",
+                "completed_at",
+            ],
+            ["turn_number", "created_at", "pk"],
+        ),
+        Section(
+            "activities",
+            ActivityLog,
+            [
+                "turn_number",
+                "activity_name",
+                "activity_trait",
+                "skill_used",
+                "performer_role",
+                "roll_result",
+                "total_modifier",
+                "dc",
+                "degree_of_success",
+                "notes",
+                "created_at",
+            ],
+            ["turn_number", "created_at", "pk"],
+            annotations={
+                "turn_number": F("turn__turn_number"),
+                "performer_role": F("performed_by__role"),
+            },
+        ),
+    ]
+}
+
+
+def parse_cursor(cursor):
+    """Split an ``after`` cursor into its section name and ordering values.
+
+    Decode the cursor with this before streaming starts, so a bad one is
+    an error response rather than a truncated download.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed, names an unknown section
+            or holds values that don't fit the section's ordering.
+    """
+    try:
+        values = decode_cursor(cursor)
+    except InvalidCursor:
+        raise InvalidCursor("Invalid export cursor.")
+    if not values or not isinstance(values[0], str) or values[0] not in SECTIONS:
+        raise InvalidCursor("Invalid export cursor.")
+    section = SECTIONS[values[0]]
+    try:
+        return section.name, section.clean_position(values[1:])
+    except InvalidCursor:
+        raise InvalidCursor("Invalid export cursor.")
+
+
+def iter_records(kingdom, sections, after=None):
+    """Yield ``(section name, record)`` for each section in order.
+
+    With ``after``, a ``parse_cursor`` result, sections before the cursor's
+    are skipped and the cursor's own section resumes just past it.
+    """
+    resume_section, resume_values = after or (None, None)
+    names = list(sections)
+    if resume_section is not None:
+        if resume_section not in names:
+            raise InvalidCursor("Cursor is for a section not being exported.")
+        names = names[names.index(resume_section) :]
+    for name in names:
+        section_after = resume_values if name == resume_section else None
+        for record in SECTIONS[name].rows(kingdom, after=section_after):
+            yield name, record
+
+
+def jsonl_lines(kingdom, sections, after=None):
+    for name, record in iter_records(kingdom, sections, after):
+        yield json.dumps({"type": name, **record}, cls=DjangoJSONEncoder) + "\n"
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(kingdom, section, after=None):
+    """Stream one section as CSV, header first (omitted when resuming)."""
+    columns = [*SECTIONS[section].columns, "cursor"]
+    writer = csv.DictWriter(_Echo(), fieldnames=columns)
+    if after is None:
+        yield writer.writeheader()
+    for _, record in iter_records(kingdom, [section], after):
+        yield writer.writerow(record)
+
+
+async def aiter_lines(lines):
+    """Serve ``jsonl_lines`` or ``csv_lines`` to an ASGI response.
+
+    Django's ASGI handler reads a sync iterator into a list before sending
+    any of it. This pulls ``CHUNK_SIZE`` lines per hop to the request's sync
+    thread, where the ``.iterator()`` cursors live, and yields them joined.
+    """
+    next_chunk = sync_to_async(lambda: "".join(islice(lines, CHUNK_SIZE)))
+    try:
+        while chunk := await next_chunk():
+            yield chunk
+    finally:
+        await sync_to_async(lines.close)()
@@ -1,9 +1,11 @@
 from django import forms
 
+from kingdoms.constants import KingdomSkill
 from kingdoms.models import MembershipRole
 from leadership.models import LeadershipAssignment
 
 from .models import ActivityLog, KingdomTurn
+from .simulation import DEFAULT_TRIALS, MAX_TRIALS
 
 
 class TurnCreateForm(forms.ModelForm):
@@ -52,7 +54,7 @@ class ActivityForm(forms.ModelForm):
         if kingdom:
             self.fields["performed_by"].queryset = LeadershipAssignment.objects.filter(
                 kingdom=kingdom
-            )
+            ).with_display_names()
             self.fields["performed_by"].label_from_instance = lambda obj: (
                 f"{obj.get_role_display()} — {obj.display_name}"
             )
@@ -61,8 +63,45 @@ class ActivityForm(forms.ModelForm):
                 and membership.role == MembershipRole.PLAYER
                 and not self.instance.pk
             ):
-                user_roles = LeadershipAssignment.objects.filter(
-                    kingdom=kingdom, user=membership.user, is_vacant=False
+                user_roles = list(
+                    LeadershipAssignment.objects.filter(
+                        kingdom=kingdom, user_id=membership.user_id, is_vacant=False
+                    )[:2]
                 )
-                if user_roles.count() == 1:
-                    self.fields["performed_by"].initial = user_roles.first()
+                if len(user_roles) == 1:
+                    self.fields["performed_by"].initial = user_roles[0]
+
+
+class CampaignImportForm(forms.Form):
+    file = forms.FileField(
+        help_text=(
+            "An activities CSV, or JSON Lines of turns and activities, in the "
+            "layout the export produces."
+        )
+    )
+    file_format = forms.ChoiceField(
+        label="Format",
+        choices=[("csv", "CSV"), ("jsonl", "JSON Lines")],
+        initial="csv",
+    )
+
+    def clean_file(self):
+        upload = self.cleaned_data["file"]
+        try:
+            return upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise forms.ValidationError("File must be UTF-8 text.")
+
+
+class SimulationForm(forms.Form):
+    skill = forms.ChoiceField(choices=KingdomSkill.choices)
+    dc = forms.IntegerField(
+        label="DC",
+        required=False,
+        min_value=0,
+        max_value=99,
+        help_text="Leave blank to use the kingdom's control DC.",
+    )
+    trials = forms.IntegerField(
+        initial=DEFAULT_TRIALS, min_value=1000, max_value=MAX_TRIALS
+    )
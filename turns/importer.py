@@ -0,0 +1,189 @@
+"""Bulk import of turns and activity logs.
+
+Accepts the layouts ``turns.export`` produces: an activities CSV, or JSON
+Lines mixing ``turns`` and ``activities`` records (other record types are
+skipped). Every row is validated with the same field rules as the activity
+and turn forms before anything is written; then the whole import lands in
+one transaction with chunked ``bulk_create`` calls.
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from kingdoms.models import Kingdom, KingdomSummary
+from metrics.collectors import ACTIVITIES_LOGGED, count_on_commit
+
+from .degrees import populate_degrees
+from .forms import ActivityForm, TurnUpdateForm
+from .models import ActivityLog, KingdomTurn
+
+BATCH_SIZE = 1000
+
+# Stop collecting errors past this many; the file needs fixing either way.
+MAX_ERRORS = 50
+
+
+class ActivityImportForm(ActivityForm):
+    """``ActivityForm`` rules minus ``performed_by``, which is matched by role.
+
+    Validating a model choice would cost a query per row.
+    """
+
+    class Meta(ActivityForm.Meta):
+        fields = [f for f in ActivityForm.Meta.fields if f != "performed_by"]
+
+
+@dataclass
+class ImportResult:
+    turns_created: int
+    activities_created: int
+
+
+def read_rows(content, file_format):
+    """Yield ``(line number, record type, row)`` from CSV or JSONL text."""
+    if file_format == "csv":
+        for line, row in enumerate(csv.DictReader(io.StringIO(content)), start=2):
+            yield line, "activities", row
+        return
+    for line, raw in enumerate(content.splitlines(), start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            raise ValidationError(f"Line {line}: not valid JSON.")
+        if not isinstance(record, dict):
+            raise ValidationError(f"Line {line}: expected a JSON object.")
+        yield line, record.get("type", "activities"), record
+
+
+def _form_data(row):
+    # Exported nulls and CSV blanks both mean "no value".
+    return {key: ("" if value is None else value) for key, value in row.items()}
+
+
+def _turn_number(row):
+    try:
+        number = int(row.get("turn_number"))
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _created_at(row):
+    """The row's exported ``created_at``, or None if it has none.
+
+    Raises:
+        ValueError: If the value isn't a date and time.
+    """
+    value = row.get("created_at")
+    if value in (None, ""):
+        return None
+    try:
+        parsed = parse_datetime(value)
+    except TypeError:
+        parsed = None
+    if parsed is None:
+        raise ValueError(value)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def import_campaign(kingdom, content, file_format="csv", created_by=None):
+    """Validate and import ``content`` into ``kingdom``.
+
+    Turns referenced by activities but missing from the kingdom are created.
+    Existing turns are left as they are. Activities keep the ``created_at``
+    an export recorded; rows without one are stamped with the import time.
+
+    Raises:
+        ValidationError: With one message per bad row; nothing is written.
+    """
+    roles = {
+        assignment.role: assignment
+        for assignment in kingdom.leadership_assignments.all()
+    }
+    existing_turns = set(kingdom.turns.values_list("turn_number", flat=True))
+    new_turns = {}
+    activities = []
+    restamped = []
+    errors = []
+
+    for line, record_type, row in read_rows(content, file_format):
+        if len(errors) >= MAX_ERRORS:
+            break
+        if record_type not in ("turns", "activities"):
+            continue
+        number = _turn_number(row)
+        if number is None:
+            errors.append(f"Line {line}: turn_number must be a positive integer.")
+            continue
+
+        if record_type == "turns":
+            form = TurnUpdateForm(data=_form_data(row))
+            if not form.is_valid():
+                errors.append(f"Line {line}: {form.errors.as_text()}")
+            elif number not in existing_turns:
+                form.instance.kingdom = kingdom
+                form.instance.turn_number = number
+                new_turns[number] = form.instance
+        elif record_type == "activities":
+            form = ActivityImportForm(data=_form_data(row))
+            role = row.get("performer_role") or ""
+            try:
+                created_at = _created_at(row)
+            except ValueError:
+                errors.append(f"Line {line}: created_at must be a date and time.")
+                continue
+            if role and role not in roles:
+                errors.append(f"Line {line}: unknown leadership role {role!r}.")
+            elif not form.is_valid():
+                errors.append(f"Line {line}: {form.errors.as_text()}")
+            else:
+                activity = form.instance
+                activity.kingdom = kingdom
+                activity.performed_by = roles.get(role)
+                activity.created_by = created_by
+                activities.append((number, activity))
+                if created_at is not None:
+                    restamped.append((activity, created_at))
+    if errors:
+        raise ValidationError(errors)
+    populate_degrees(activity for _, activity in activities)
+
+    with transaction.atomic():
+        for number, _ in activities:
+            if number not in existing_turns and number not in new_turns:
+                new_turns[number] = KingdomTurn(kingdom=kingdom, turn_number=number)
+        KingdomTurn.objects.bulk_create(new_turns.values(), batch_size=BATCH_SIZE)
+        turn_ids = dict(kingdom.turns.values_list("turn_number", "pk"))
+        for number, activity in activities:
+            activity.turn_id = turn_ids[number]
+        ActivityLog.objects.bulk_create(
+            [activity for _, activity in activities], batch_size=BATCH_SIZE
+        )
+        # auto_now_add overwrote created_at on insert; put the exported one back.
+        for activity, created_at in restamped:
+            activity.created_at = created_at
+        ActivityLog.objects.bulk_update(
+            [activity for activity, _ in restamped],
+            ["created_at"],
+            batch_size=BATCH_SIZE,
+        )
+        # bulk_create skips the per-activity tally updates; recount instead.
+        affected = {activity.turn_id for _, activity in activities}
+        KingdomTurn.recount(KingdomTurn.objects.filter(pk__in=affected))
+        count_on_commit(ACTIVITIES_LOGGED, len(activities))
+        if new_turns:
+            # bulk_create skips the signal that keeps this current.
+            KingdomSummary.refresh_turn_number(kingdom.pk)
+            Kingdom.bump_version(kingdom.pk)
+    return ImportResult(len(new_turns), len(activities))
@@ -0,0 +1,118 @@
+"""Live turn updates pushed to open kingdom pages over Server-Sent Events.
+
+Activity writes and turn completion publish a small event once the
+transaction commits. The broker fans each event out to every stream open on
+that kingdom, so connected players learn about changes without polling and
+only reload when something actually changed.
+
+``LocalBroker`` keeps subscribers in process memory, which reaches every
+viewer served by the same ASGI process. Deployments running several
+processes can point ``KINGDOM_LIVE_BROKER`` at a ``Broker`` subclass backed
+by a shared message bus. Streams need an ASGI server; under WSGI the
+endpoint answers 204 so browsers stop reconnecting.
+"""
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from functools import cache
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Events a slow stream may fall behind by before newer ones are dropped.
+QUEUE_SIZE = 100
+
+# How long a browser waits before reconnecting a dropped stream.
+RECONNECT_MS = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class LiveEvent:
+    type: str  # "activity.created", "activity.updated", ...
+    kingdom: int
+    turn: int
+    activity: int | None = None
+
+    def encode(self):
+        """The event as one Server-Sent Events message."""
+        data = json.dumps({k: v for k, v in asdict(self).items() if k != "kingdom"})
+        return f"event: {self.type}\ndata: {data}\n\n"
+
+
+class Broker:
+    """Fans events out to the streams subscribed to each kingdom."""
+
+    def publish(self, event):
+        raise NotImplementedError
+
+    def subscribe(self, kingdom_id):
+        """Async context manager yielding an ``asyncio.Queue`` of events."""
+        raise NotImplementedError
+
+
+class LocalBroker(Broker):
+    """In-process broker; safe to publish from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)  # kingdom id -> {(loop, queue)}
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(event.kingdom, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                pass  # The stream's loop has closed; it unsubscribes itself.
+
+    def subscriber_count(self, kingdom_id):
+        with self._lock:
+            return len(self._subscribers.get(kingdom_id, ()))
+
+    @asynccontextmanager
+    async def subscribe(self, kingdom_id):
+        entry = (asyncio.get_running_loop(), asyncio.Queue(QUEUE_SIZE))
+        with self._lock:
+            self._subscribers[kingdom_id].add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                self._subscribers[kingdom_id].discard(entry)
+                if not self._subscribers[kingdom_id]:
+                    del self._subscribers[kingdom_id]
+
+
+def _offer(queue, event):
+    if not queue.full():
+        queue.put_nowait(event)
+
+
+@cache
+def get_broker():
+    return import_string(settings.KINGDOM_LIVE_BROKER)()
+
+
+def publish_on_commit(event):
+    """Publish ``event`` once the current transaction commits."""
+    transaction.on_commit(lambda: get_broker().publish(event))
+
+
+async def event_stream(kingdom_id, keepalive=None):
+    """Yield SSE messages for ``kingdom_id`` until the client disconnects."""
+    keepalive = keepalive or settings.KINGDOM_LIVE_KEEPALIVE
+    async with get_broker().subscribe(kingdom_id) as queue:
+        yield f"retry: {RECONNECT_MS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), keepalive)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield event.encode()
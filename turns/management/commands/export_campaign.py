@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from kingdoms.models import Kingdom
+from kingdoms.pagination import InvalidCursor
+from turns.export import SECTIONS, csv_lines, jsonl_lines, parse_cursor
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a kingdom's leadership, skills, turns and activities as JSONL or CSV."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kingdom_id", type=int)
+        parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+        parser.add_argument(
+            "--section",
+            action="append",
+            choices=list(SECTIONS),
+            help="Section to export (repeatable). CSV takes exactly one.",
+        )
+        parser.add_argument(
+            "--after", help="Resume after the record carrying this cursor."
+        )
+        parser.add_argument(
+            "--output", "-o", help="File to write to (default: stdout)."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            kingdom = Kingdom.objects.get(pk=options["kingdom_id"])
+        except Kingdom.DoesNotExist:
+            raise CommandError(f"Kingdom {options['kingdom_id']} does not exist.")
+
+        sections = options["section"]
+        if options["format"] == "csv":
+            if sections and len(sections) > 1:
+                raise CommandError("CSV exports one section at a time.")
+            sections = sections or ["activities"]
+        else:
+            sections = sections or list(SECTIONS)
+        after = None
+        if options["after"]:
+            try:
+                after = parse_cursor(options["after"])
+            except InvalidCursor as exc:
+                raise CommandError(str(exc))
+            if after[0] not in sections:
+                raise CommandError("Cursor is for a section not being exported.")
+
+        if options["format"] == "csv":
+            lines = csv_lines(kingdom, sections[0], after)
+        else:
+            lines = jsonl_lines(kingdom, sections, after)
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as fh:
+                fh.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,71 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from turns.synthetic import generate_campaign
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the database with a seeded synthetic campaign for scale testing. "
+        "The same options always build the same data. Run rebuild_analytics "
+        "afterwards to fill the analytics rollups."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kingdoms", type=int, default=10)
+        parser.add_argument(
+            "--members", type=int, default=4, help="Members per kingdom, GM included."
+        )
+        parser.add_argument(
+            "--turns", type=int, default=12, help="Average turns per kingdom."
+        )
+        parser.add_argument(
+            "--activities", type=int, default=10, help="Average activities per turn."
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--prefix",
+            default="synthetic",
+            help="Start of the generated usernames and kingdom names.",
+        )
+
+    def handle(self, *args, **options):
+        for option in ("kingdoms", "members", "turns", "activities"):
+            if options[option] < 1:
+                raise CommandError(f"--{option} must be at least 1.")
+        prefix = options["prefix"]
+        if get_user_model().objects.filter(username__startswith=f"{prefix}-").exists():
+            raise CommandError(
+                f'Users named "{prefix}-..." already exist; pick another --prefix.'
+            )
+
+        kingdoms = options["kingdoms"]
+        step = max(1, kingdoms // 10)
+        verbose = options["verbosity"] > 1
+
+        def progress(campaign):
+            done = len(campaign.kingdoms)
+            if verbose and (done % step == 0 or done == kingdoms):
+                self.stdout.write(
+                    f"{done}/{kingdoms} kingdoms, {campaign.activities} activities"
+                )
+
+        started = time.perf_counter()
+        campaign = generate_campaign(
+            kingdoms=kingdoms,
+            members=options["members"],
+            turns=options["turns"],
+            activities=options["activities"],
+            seed=options["seed"],
+            prefix=prefix,
+            progress=progress,
+        )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(campaign.kingdoms)} kingdoms, {campaign.turns} "
+                f"turns and {campaign.activities} activities in {elapsed:.1f}s."
+            )
+        )
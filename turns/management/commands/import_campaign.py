@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from kingdoms.models import Kingdom
+from turns.importer import import_campaign
+
+
+class Command(BaseCommand):
+    help = "Bulk-import turns and activity logs from CSV or JSON Lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kingdom_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--user", help="Username recorded as the activities' creator."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            kingdom = Kingdom.objects.get(pk=options["kingdom_id"])
+        except Kingdom.DoesNotExist:
+            raise CommandError(f"Kingdom {options['kingdom_id']} does not exist.")
+
+        created_by = None
+        if options["user"]:
+            try:
+                created_by = get_user_model().objects.get(username=options["user"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"User {options['user']!r} does not exist.")
+
+        path = Path(options["path"])
+        file_format = options["format"] or (
+            "jsonl" if path.suffix in (".jsonl", ".ndjson") else "csv"
+        )
+        try:
+            result = import_campaign(
+                kingdom,
+                path.read_text(encoding="utf-8-sig"),
+                file_format=file_format,
+                created_by=created_by,
+            )
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except ValidationError as exc:
+            raise CommandError("\n".join(exc.messages))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.activities_created} activities and created "
+                f"{result.turns_created} turns."
+            )
+        )
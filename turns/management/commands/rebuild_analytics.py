@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from turns.analytics import rebuild_rollups
+from turns.models import KingdomTurn
+
+
+class Command(BaseCommand):
+    help = "Rebuild analytics rollups for completed turns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kingdom", type=int, help="Only this kingdom's turns.")
+
+    def handle(self, *args, **options):
+        turns = KingdomTurn.objects.all()
+        if options["kingdom"]:
+            turns = turns.filter(kingdom_id=options["kingdom"])
+        count = rebuild_rollups(turns)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rollups for {count} turns."))
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from turns.degrees import populate_degrees
+from turns.models import ActivityLog, KingdomTurn
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Fill in degrees of success from logged rolls, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kingdom", type=int, help="Only this kingdom's activities."
+        )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Replace degrees already set, not just blank ones.",
+        )
+
+    def handle(self, *args, **options):
+        activities = ActivityLog.objects.filter(
+            roll_result__isnull=False,
+            total_modifier__isnull=False,
+            dc__isnull=False,
+        ).only("turn", "roll_result", "total_modifier", "dc", "degree_of_success")
+        if options["kingdom"]:
+            activities = activities.filter(kingdom_id=options["kingdom"])
+        if not options["overwrite"]:
+            activities = activities.filter(degree_of_success="")
+
+        updated = 0
+        batch = []
+        with transaction.atomic():
+            for activity in activities.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+                batch.append(activity)
+                if len(batch) == BATCH_SIZE:
+                    updated += self._save(batch, options["overwrite"])
+                    batch = []
+            updated += self._save(batch, options["overwrite"])
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} activities."))
+
+    def _save(self, batch, overwrite):
+        changed = populate_degrees(batch, overwrite=overwrite)
+        ActivityLog.objects.bulk_update(changed, ["degree_of_success"])
+        # bulk_update skips the per-activity tally updates; recount instead.
+        turn_ids = {activity.turn_id for activity in changed}
+        KingdomTurn.recount(KingdomTurn.objects.filter(pk__in=turn_ids))
+        return len(changed)
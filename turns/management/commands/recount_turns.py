@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from turns.models import KingdomTurn
+
+
+class Command(BaseCommand):
+    help = "Recompute per-turn activity tallies from the activity log."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--kingdom", type=int, help="Only this kingdom's turns.")
+
+    def handle(self, *args, **options):
+        turns = KingdomTurn.objects.all()
+        if options["kingdom"]:
+            turns = turns.filter(kingdom_id=options["kingdom"])
+        changed = KingdomTurn.recount(turns)
+        self.stdout.write(self.style.SUCCESS(f"Repaired {changed} turns."))
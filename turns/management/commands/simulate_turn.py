@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kingdoms.constants import KingdomSkill
+from kingdoms.models import Kingdom
+from turns.simulation import DEFAULT_TRIALS, MAX_TRIALS, simulate_turn
+
+
+class Command(BaseCommand):
+    help = "Show a skill check's odds and estimate this turn's RP by simulation."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kingdom_id", type=int)
+        parser.add_argument(
+            "--skill", required=True, choices=[skill.value for skill in KingdomSkill]
+        )
+        parser.add_argument("--dc", type=int, help="Defaults to the control DC.")
+        parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+        parser.add_argument("--seed", type=int, help="Make the run repeatable.")
+
+    def handle(self, *args, **options):
+        if not 1 <= options["trials"] <= MAX_TRIALS:
+            raise CommandError(f"--trials must be between 1 and {MAX_TRIALS}.")
+        try:
+            kingdom = Kingdom.objects.get(pk=options["kingdom_id"])
+        except Kingdom.DoesNotExist:
+            raise CommandError(f"Kingdom {options['kingdom_id']} does not exist.")
+
+        started = time.perf_counter()
+        simulation = simulate_turn(
+            kingdom,
+            options["skill"],
+            dc=options["dc"],
+            trials=options["trials"],
+            seed=options["seed"],
+        )
+        elapsed = time.perf_counter() - started
+
+        check = simulation.check
+        resources = simulation.resources
+        self.stdout.write(
+            f"{KingdomSkill(simulation.skill).label} {check.modifier:+d} "
+            f"vs DC {check.dc}:"
+        )
+        for degree, percent in check.outcomes:
+            self.stdout.write(f"  {degree.label:<17} {percent:5.1f}%")
+        self.stdout.write(
+            f"Resource Dice {resources.expression}: mean {resources.mean:.1f} RP, "
+            f"80% between {resources.p10} and {resources.p90}"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"{resources.trials} turns simulated in {elapsed:.2f}s.")
+        )
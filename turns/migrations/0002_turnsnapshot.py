@@ -0,0 +1,60 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0017_backfill_kingdomsummary"),
+        ("turns", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TurnSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("turn_number", models.PositiveSmallIntegerField()),
+                ("is_keyframe", models.BooleanField(default=False)),
+                ("depth", models.PositiveSmallIntegerField(default=0)),
+                ("data", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "kingdom",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="turn_snapshots",
+                        to="kingdoms.kingdom",
+                    ),
+                ),
+                (
+                    "turn",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="snapshot",
+                        to="turns.kingdomturn",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "kingdoms_turnsnapshot",
+                "ordering": ["kingdom", "turn_number"],
+                "indexes": [
+                    models.Index(
+                        fields=["kingdom", "turn_number"],
+                        name="kingdoms_tu_kingdom_381020_idx",
+                    )
+                ],
+            },
+        ),
+    ]
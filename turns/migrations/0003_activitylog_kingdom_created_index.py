@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("turns", "0002_turnsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["kingdom", "-created_at"], name="kingdoms_ac_kingdom_d405bc_idx"
+            ),
+        ),
+    ]
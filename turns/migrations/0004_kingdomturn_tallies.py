@@ -0,0 +1,91 @@
+# Generated by Django 6.0.2 on 2026-10-17 01:08
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+DEGREES = ["critical_success", "success", "failure", "critical_failure"]
+TRAITS = ["upkeep", "commerce", "leadership", "region", "civic", "fortune", "downtime"]
+
+
+def backfill_tallies(apps, schema_editor):
+    KingdomTurn = apps.get_model("turns", "KingdomTurn")
+    ActivityLog = apps.get_model("turns", "ActivityLog")
+    aggregates = {"activities_logged": Count("pk")}
+    for degree in DEGREES:
+        aggregates[f"{degree}_count"] = Count("pk", filter=Q(degree_of_success=degree))
+    for trait in TRAITS:
+        aggregates[f"{trait}_count"] = Count("pk", filter=Q(activity_trait=trait))
+    rows = ActivityLog.objects.order_by().values("turn").annotate(**aggregates)
+    for row in rows:
+        KingdomTurn.objects.filter(pk=row.pop("turn")).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("turns", "0003_activitylog_kingdom_created_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="activities_logged",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="civic_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="commerce_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="critical_failure_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="critical_success_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="downtime_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="failure_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="fortune_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="leadership_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="region_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="success_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="kingdomturn",
+            name="upkeep_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_tallies, migrations.RunPython.noop),
+    ]
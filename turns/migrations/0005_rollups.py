@@ -0,0 +1,125 @@
+# Generated by Django 6.0.2 on 2026-10-17 01:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kingdoms", "0017_backfill_kingdomsummary"),
+        ("turns", "0004_kingdomturn_tallies"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("skill", "Skill"),
+                            ("role", "Leadership Role"),
+                            ("trait", "Trait"),
+                        ],
+                        max_length=5,
+                    ),
+                ),
+                ("key", models.CharField(max_length=15)),
+                ("logged", models.PositiveIntegerField(default=0)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("critical_successes", models.PositiveIntegerField(default=0)),
+                ("successes", models.PositiveIntegerField(default=0)),
+                ("failures", models.PositiveIntegerField(default=0)),
+                ("critical_failures", models.PositiveIntegerField(default=0)),
+                (
+                    "kingdom",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_rollups",
+                        to="kingdoms.kingdom",
+                    ),
+                ),
+                (
+                    "turn",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="activity_rollups",
+                        to="turns.kingdomturn",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "kingdoms_activityrollup",
+                "indexes": [
+                    models.Index(
+                        fields=["kingdom", "dimension"],
+                        name="kingdoms_ac_kingdom_8d4ab0_idx",
+                    )
+                ],
+                "unique_together": {("turn", "dimension", "key")},
+            },
+        ),
+        migrations.CreateModel(
+            name="TurnRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("turn_number", models.PositiveSmallIntegerField()),
+                ("level", models.PositiveSmallIntegerField()),
+                ("xp", models.PositiveIntegerField()),
+                ("xp_gained", models.PositiveIntegerField(null=True)),
+                ("starting_rp", models.PositiveIntegerField(null=True)),
+                ("ending_rp", models.PositiveIntegerField(null=True)),
+                ("rp_converted_to_xp", models.PositiveIntegerField(null=True)),
+                ("unrest", models.PositiveSmallIntegerField()),
+                ("corruption_points", models.PositiveSmallIntegerField()),
+                ("crime_points", models.PositiveSmallIntegerField()),
+                ("strife_points", models.PositiveSmallIntegerField()),
+                ("decay_points", models.PositiveSmallIntegerField()),
+                (
+                    "kingdom",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="turn_rollups",
+                        to="kingdoms.kingdom",
+                    ),
+                ),
+                (
+                    "turn",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rollup",
+                        to="turns.kingdomturn",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "kingdoms_turnrollup",
+                "ordering": ["kingdom", "turn_number"],
+                "indexes": [
+                    models.Index(
+                        fields=["kingdom", "turn_number"],
+                        name="kingdoms_tu_kingdom_61f67f_idx",
+                    )
+                ],
+            },
+        ),
+    ]
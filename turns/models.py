@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from kingdoms.constants import GolarionMonth, KingdomSkill, ResourceDie
@@ -22,6 +22,26 @@ class DegreeOfSuccess(models.TextChoices):
     CRITICAL_FAILURE = "critical_failure", "Critical Failure"
 
 
+# Per-turn counter columns, kept current by ActivityLog.save()/delete().
+DEGREE_COUNT_FIELDS = {
+    degree.value: f"{degree.value}_count" for degree in DegreeOfSuccess
+}
+TRAIT_COUNT_FIELDS = {trait.value: f"{trait.value}_count" for trait in ActivityTrait}
+TALLY_FIELDS = [
+    "activities_logged",
+    *DEGREE_COUNT_FIELDS.values(),
+    *TRAIT_COUNT_FIELDS.values(),
+]
+
+
+def tally_fields(trait, degree):
+    """Counter columns an activity with ``trait`` and ``degree`` counts toward."""
+    fields = {"activities_logged", TRAIT_COUNT_FIELDS.get(trait)}
+    fields.add(DEGREE_COUNT_FIELDS.get(degree))
+    fields.discard(None)
+    return fields
+
+
 class KingdomTurn(models.Model):
     kingdom = models.ForeignKey(
         "kingdoms.Kingdom",
@@ -64,6 +84,20 @@ class KingdomTurn(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    # Activity tallies (see TALLY_FIELDS); repaired by `manage.py recount_turns`
+    activities_logged = models.PositiveIntegerField(default=0, editable=False)
+    critical_success_count = models.PositiveIntegerField(default=0, editable=False)
+    success_count = models.PositiveIntegerField(default=0, editable=False)
+    failure_count = models.PositiveIntegerField(default=0, editable=False)
+    critical_failure_count = models.PositiveIntegerField(default=0, editable=False)
+    upkeep_count = models.PositiveIntegerField(default=0, editable=False)
+    commerce_count = models.PositiveIntegerField(default=0, editable=False)
+    leadership_count = models.PositiveIntegerField(default=0, editable=False)
+    region_count = models.PositiveIntegerField(default=0, editable=False)
+    civic_count = models.PositiveIntegerField(default=0, editable=False)
+    fortune_count = models.PositiveIntegerField(default=0, editable=False)
+    downtime_count = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         unique_together = [("kingdom", "turn_number")]
         ordering = ["-turn_number"]
@@ -80,13 +114,111 @@ class KingdomTurn(models.Model):
     def is_complete(self):
         return self.completed_at is not None
 
+    def save(self, *args, **kwargs):
+        # Tallies move by F() updates from ActivityLog; a full save of an
+        # instance loaded earlier must not write its stale counts back.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in TALLY_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def activity_count(self):
-        return self.activities.count()
+        return self.activities_logged
+
+    @property
+    def success_total(self):
+        return self.critical_success_count + self.success_count
+
+    @property
+    def failure_total(self):
+        return self.failure_count + self.critical_failure_count
+
+    @classmethod
+    def recount(cls, turns=None):
+        """Recompute the tallies of ``turns`` (default: every turn).
+
+        Counts come from one GROUP BY over the turns' activities; only turns
+        whose stored counts differ are written, and their kingdoms' versions
+        bumped. Returns how many changed.
+        """
+        from kingdoms.models import Kingdom
+
+        turns = cls.objects.all() if turns is None else turns
+        aggregates = {"activities_logged": models.Count("pk")}
+        for degree, field in DEGREE_COUNT_FIELDS.items():
+            aggregates[field] = models.Count(
+                "pk", filter=models.Q(degree_of_success=degree)
+            )
+        for trait, field in TRAIT_COUNT_FIELDS.items():
+            aggregates[field] = models.Count(
+                "pk", filter=models.Q(activity_trait=trait)
+            )
+        counts = {
+            row.pop("turn"): row
+            for row in ActivityLog.objects.filter(turn__in=turns)
+            .order_by()
+            .values("turn")
+            .annotate(**aggregates)
+        }
+        zero = dict.fromkeys(TALLY_FIELDS, 0)
+        changed = []
+        for turn in turns.only("pk", "kingdom_id", *TALLY_FIELDS):
+            values = counts.get(turn.pk, zero)
+            if any(getattr(turn, field) != values[field] for field in TALLY_FIELDS):
+                for field in TALLY_FIELDS:
+                    setattr(turn, field, values[field])
+                changed.append(turn)
+        cls.objects.bulk_update(changed, TALLY_FIELDS, batch_size=500)
+        # bulk_update skips the signal that retires cached dashboard fragments.
+        for kingdom_id in {turn.kingdom_id for turn in changed}:
+            Kingdom.bump_version(kingdom_id)
+        return len(changed)
 
     def complete_turn(self):
+        from metrics.collectors import TURNS_COMPLETED, count_on_commit
+
+        from .analytics import refresh_rollups
+        from .live import LiveEvent, publish_on_commit
+        from .snapshots import record_snapshot
+
         self.completed_at = timezone.now()
-        self.save(update_fields=["completed_at"])
+        with transaction.atomic():
+            self.save(update_fields=["completed_at"])
+            record_snapshot(self)
+            refresh_rollups(self)
+            publish_on_commit(
+                LiveEvent(type="turn.completed", kingdom=self.kingdom_id, turn=self.pk)
+            )
+            count_on_commit(TURNS_COMPLETED)
+
+
+class ActivityLogQuerySet(models.QuerySet):
+    def with_trait_order(self):
+        """Annotate ``trait_order``: the trait's place in the turn's phases."""
+        return self.annotate(
+            trait_order=models.Case(
+                *(
+                    models.When(activity_trait=trait, then=position)
+                    for position, trait in enumerate(ActivityTrait)
+                ),
+                output_field=models.PositiveSmallIntegerField(),
+            )
+        )
+
+    def with_performers(self):
+        """Prefetch performers with their display names, two queries total."""
+        from leadership.models import LeadershipAssignment
+
+        return self.prefetch_related(
+            models.Prefetch(
+                "performed_by",
+                queryset=LeadershipAssignment.objects.with_display_names(),
+            )
+        )
 
 
 class ActivityLog(models.Model):
@@ -136,18 +268,91 @@ class ActivityLog(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActivityLogQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "activity log"
         verbose_name_plural = "activity logs"
         indexes = [
             models.Index(fields=["turn", "-created_at"]),
+            models.Index(fields=["kingdom", "-created_at"]),
         ]
         db_table = "kingdoms_activitylog"
 
     def __str__(self):
         return self.activity_name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if {"turn_id", "activity_trait", "degree_of_success"} <= loaded.keys():
+            instance._loaded_tally = (
+                loaded["turn_id"],
+                tally_fields(loaded["activity_trait"], loaded["degree_of_success"]),
+            )
+        return instance
+
+    def _stored_tally(self):
+        """``(turn_id, tally fields)`` as the row stands in the database."""
+        if self._state.adding:
+            return None, set()
+        if hasattr(self, "_loaded_tally"):
+            return self._loaded_tally
+        # Loaded with deferred fields: read what the row counted toward.
+        row = (
+            ActivityLog.objects.filter(pk=self.pk)
+            .values_list("turn_id", "activity_trait", "degree_of_success")
+            .first()
+        )
+        if row is None:
+            return None, set()
+        return row[0], tally_fields(row[1], row[2])
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            before = self._stored_tally()
+            super().save(*args, **kwargs)
+            after = (
+                self.turn_id,
+                tally_fields(self.activity_trait, self.degree_of_success),
+            )
+            self._adjust_tallies(before, after)
+        self._loaded_tally = after
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            before = self._stored_tally()
+            result = super().delete(*args, **kwargs)
+            self._adjust_tallies(before, (None, set()))
+        self.__dict__.pop("_loaded_tally", None)
+        return result
+
+    def _adjust_tallies(self, before, after):
+        (old_turn, old_fields), (new_turn, new_fields) = before, after
+        if old_turn == new_turn:
+            deltas = {
+                new_turn: {
+                    **{field: 1 for field in new_fields - old_fields},
+                    **{field: -1 for field in old_fields - new_fields},
+                }
+            }
+        else:
+            deltas = {
+                old_turn: {field: -1 for field in old_fields},
+                new_turn: {field: 1 for field in new_fields},
+            }
+        for turn_id, changes in deltas.items():
+            if turn_id is None or not changes:
+                continue
+            KingdomTurn.objects.filter(pk=turn_id).update(
+                **{field: models.F(field) + delta for field, delta in changes.items()}
+            )
+            if ActivityLog.turn.is_cached(self) and self.turn.pk == turn_id:
+                for field, delta in changes.items():
+                    setattr(self.turn, field, getattr(self.turn, field) + delta)
+
     @property
     def performer_name(self):
         if self.performed_by:
@@ -222,5 +427,120 @@ class ActivityLog(models.Model):
         from kingdoms.models import MembershipRole
 
         is_gm = membership.role == MembershipRole.GM
-        is_creator = self.created_by == user
+        is_creator = self.created_by_id == user.pk
         return is_gm or is_creator
+
+
+class TurnSnapshot(models.Model):
+    """Kingdom state at the end of a turn; see ``turns.snapshots``.
+
+    ``data`` holds the full flattened state on keyframes and only the changed
+    keys otherwise. ``depth`` counts deltas since the last keyframe.
+    """
+
+    kingdom = models.ForeignKey(
+        "kingdoms.Kingdom",
+        on_delete=models.CASCADE,
+        related_name="turn_snapshots",
+    )
+    turn = models.OneToOneField(
+        KingdomTurn,
+        on_delete=models.CASCADE,
+        related_name="snapshot",
+    )
+    turn_number = models.PositiveSmallIntegerField()
+    is_keyframe = models.BooleanField(default=False)
+    depth = models.PositiveSmallIntegerField(default=0)
+    data = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["kingdom", "turn_number"]
+        indexes = [
+            models.Index(fields=["kingdom", "turn_number"]),
+        ]
+        db_table = "kingdoms_turnsnapshot"
+
+    def __str__(self):
+        kind = "keyframe" if self.is_keyframe else "delta"
+        return f"Turn {self.turn_number} snapshot ({kind})"
+
+
+class TurnRollup(models.Model):
+    """A completed turn's XP, RP, unrest and ruin; see ``turns.analytics``."""
+
+    kingdom = models.ForeignKey(
+        "kingdoms.Kingdom",
+        on_delete=models.CASCADE,
+        related_name="turn_rollups",
+    )
+    turn = models.OneToOneField(
+        KingdomTurn,
+        on_delete=models.CASCADE,
+        related_name="rollup",
+    )
+    turn_number = models.PositiveSmallIntegerField()
+    level = models.PositiveSmallIntegerField()
+    xp = models.PositiveIntegerField()
+    xp_gained = models.PositiveIntegerField(null=True)
+    starting_rp = models.PositiveIntegerField(null=True)
+    ending_rp = models.PositiveIntegerField(null=True)
+    rp_converted_to_xp = models.PositiveIntegerField(null=True)
+    unrest = models.PositiveSmallIntegerField()
+    corruption_points = models.PositiveSmallIntegerField()
+    crime_points = models.PositiveSmallIntegerField()
+    strife_points = models.PositiveSmallIntegerField()
+    decay_points = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ["kingdom", "turn_number"]
+        indexes = [
+            models.Index(fields=["kingdom", "turn_number"]),
+        ]
+        db_table = "kingdoms_turnrollup"
+
+    def __str__(self):
+        return f"Turn {self.turn_number} rollup"
+
+
+class RollupDimension(models.TextChoices):
+    SKILL = "skill", "Skill"
+    ROLE = "role", "Leadership Role"
+    TRAIT = "trait", "Trait"
+
+
+class ActivityRollup(models.Model):
+    """One turn's activity outcomes for one skill, role or trait.
+
+    ``attempts`` counts activities with a degree of success recorded;
+    ``logged`` counts every activity.
+    """
+
+    kingdom = models.ForeignKey(
+        "kingdoms.Kingdom",
+        on_delete=models.CASCADE,
+        related_name="activity_rollups",
+    )
+    turn = models.ForeignKey(
+        KingdomTurn,
+        on_delete=models.CASCADE,
+        related_name="activity_rollups",
+    )
+    dimension = models.CharField(max_length=5, choices=RollupDimension)
+    key = models.CharField(max_length=15)
+    logged = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    critical_successes = models.PositiveIntegerField(default=0)
+    successes = models.PositiveIntegerField(default=0)
+    failures = models.PositiveIntegerField(default=0)
+    critical_failures = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = [("turn", "dimension", "key")]
+        indexes = [
+            models.Index(fields=["kingdom", "dimension"]),
+        ]
+        db_table = "kingdoms_activityrollup"
+
+    def __str__(self):
+        return f"Turn {self.turn_id} {self.dimension} {self.key}"
@@ -0,0 +1,43 @@
+"""Signal handlers keeping snapshot chains decodable, live pages and metrics current."""
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from kingdoms.models import Kingdom
+from metrics.collectors import ACTIVITIES_LOGGED, count_on_commit
+
+from .live import LiveEvent, publish_on_commit
+from .models import ActivityLog, KingdomTurn, TurnSnapshot
+from .snapshots import promote_successor
+
+
+@receiver(pre_delete, sender=TurnSnapshot)
+def keep_successor_decodable(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Kingdom):
+        return  # The whole chain is going.
+    promote_successor(instance)
+
+
+@receiver(post_save, sender=ActivityLog)
+@receiver(post_delete, sender=ActivityLog)
+def publish_activity_change(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, (Kingdom, KingdomTurn)):
+        return  # Nobody is left watching the deleted turn.
+    if kwargs.get("signal") is post_delete:
+        action = "deleted"
+    else:
+        action = "created" if kwargs.get("created") else "updated"
+    publish_on_commit(
+        LiveEvent(
+            type=f"activity.{action}",
+            kingdom=instance.kingdom_id,
+            turn=instance.turn_id,
+            activity=instance.pk,
+        )
+    )
+
+
+@receiver(post_save, sender=ActivityLog)
+def count_logged_activity(sender, created=False, **kwargs):
+    if created:
+        count_on_commit(ACTIVITIES_LOGGED)
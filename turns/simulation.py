@@ -0,0 +1,191 @@
+"""Odds for planning a kingdom turn.
+
+Gives the chance of each degree of success for one skill check against a DC
+and the spread of RP from one Resource Dice roll, so a GM can weigh a plan
+before committing to it. The check uses the skill's full modifier from the
+kingdom stat sheet (proficiency, status bonus, unrest and ruin); its odds are
+exact, read from ``turns.degrees.degree_odds``. Resource Dice are ``level + 4
++ bonus dice - penalty dice`` of the kingdom's size die, and their spread is
+estimated by Monte Carlo.
+
+Dice are sampled with NumPy (pinned in requirements.txt) in vectorized
+chunks, well over 100k simulated turns a second. On an install without it
+the standard library ``random`` module does the same work more slowly, so
+fewer trials are allowed.
+"""
+
+import random
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised where NumPy is absent
+    np = None
+
+from django.conf import settings
+from django.core.cache import cache
+
+from metrics.collectors import record_cache_lookup
+
+from .degrees import DEGREES, degree_odds
+
+# The pure-Python sampler rolls a few hundred thousand dice a second, so
+# without NumPy the trial count is held down to keep the page responsive.
+if np is not None:
+    DEFAULT_TRIALS = 100_000
+    MAX_TRIALS = 1_000_000
+else:  # pragma: no cover - exercised where NumPy is absent
+    DEFAULT_TRIALS = 20_000
+    MAX_TRIALS = 50_000
+
+# Samples drawn per vectorized step; bounds memory for large dice pools.
+CHUNK_SIZE = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class CheckOdds:
+    modifier: int
+    dc: int
+    percents: tuple  # Percent chance per degree rank, critical failure first
+
+    @property
+    def probabilities(self):
+        return tuple(percent / 100 for percent in self.percents)
+
+    @property
+    def success_chance(self):
+        """Chance of a success or critical success."""
+        return (self.percents[2] + self.percents[3]) / 100
+
+    @property
+    def outcomes(self):
+        """``(degree, percent chance)`` pairs, critical success first."""
+        return [
+            (DEGREES[rank], self.percents[rank])
+            for rank in reversed(range(len(DEGREES)))
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceOdds:
+    dice: int
+    die_sides: int
+    trials: int
+    mean: float
+    minimum: int
+    p10: int
+    median: int
+    p90: int
+    maximum: int
+
+    @property
+    def expression(self):
+        return f"{self.dice}d{self.die_sides}"
+
+
+@dataclass(frozen=True, slots=True)
+class TurnSimulation:
+    kingdom_id: int
+    stats_version: int
+    skill: str
+    check: CheckOdds
+    resources: ResourceOdds
+
+
+def resource_dice(kingdom):
+    """Number of Resource Dice the kingdom rolls this turn."""
+    return max(kingdom.level + 4 + kingdom.bonus_dice - kingdom.penalty_dice, 0)
+
+
+def _chunks(trials):
+    while trials > 0:
+        size = min(trials, CHUNK_SIZE)
+        yield size
+        trials -= size
+
+
+def _quantile(ordered, q):
+    return int(ordered[round(q * (len(ordered) - 1))])
+
+
+def simulate_resources(dice, sides, trials=DEFAULT_TRIALS, rng=None):
+    """Roll ``dice``d``sides`` ``trials`` times; return the sorted totals.
+
+    ``rng`` is a ``numpy.random.Generator`` or a ``random.Random``.
+    """
+    if np is not None and isinstance(rng, np.random.Generator):
+        totals = [
+            rng.integers(1, sides + 1, size=(size, dice)).sum(axis=1)
+            for size in _chunks(trials)
+        ]
+        return np.sort(np.concatenate(totals))
+    rng = rng or random.Random()
+    faces = range(1, sides + 1)
+    return sorted(sum(rng.choices(faces, k=dice)) for _ in range(trials))
+
+
+def _generator(seed, use_numpy):
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+def simulate_turn(
+    kingdom, skill, dc=None, trials=DEFAULT_TRIALS, seed=None, use_numpy=None
+):
+    """Odds of ``skill`` against ``dc`` plus ``trials`` Resource Dice rolls.
+
+    ``dc`` defaults to the kingdom's control DC. ``seed`` makes the run
+    repeatable; ``use_numpy`` forces or disables the NumPy sampler.
+    """
+    sheet = kingdom.stat_sheet
+    modifier = sheet.skill(skill).total
+    dc = sheet.control_dc if dc is None else dc
+
+    check = CheckOdds(modifier=modifier, dc=dc, percents=degree_odds(modifier, dc))
+    dice = resource_dice(kingdom)
+    sides = int(sheet.resource_die_type.removeprefix("d"))
+    totals = simulate_resources(dice, sides, trials, _generator(seed, use_numpy))
+    if np is not None and isinstance(totals, np.ndarray):
+        mean = float(totals.mean())
+    else:
+        mean = sum(totals) / trials
+    resources = ResourceOdds(
+        dice=dice,
+        die_sides=sides,
+        trials=trials,
+        mean=mean,
+        minimum=int(totals[0]),
+        p10=_quantile(totals, 0.1),
+        median=_quantile(totals, 0.5),
+        p90=_quantile(totals, 0.9),
+        maximum=int(totals[-1]),
+    )
+    return TurnSimulation(
+        kingdom_id=kingdom.pk,
+        stats_version=kingdom.stats_version,
+        skill=skill,
+        check=check,
+        resources=resources,
+    )
+
+
+def simulation_cache_key(kingdom_id, stats_version, skill, dc, trials):
+    return f"turns:simulation:{kingdom_id}:{stats_version}:{skill}:{dc}:{trials}"
+
+
+def get_simulation(kingdom, skill, dc=None, trials=DEFAULT_TRIALS):
+    """Return the cached simulation for the kingdom's current stats version.
+
+    Any kingdom, skill, leadership or hex write bumps the stats version, so
+    a cached result always reflects the current modifiers, DC and dice.
+    """
+    key = simulation_cache_key(kingdom.pk, kingdom.stats_version, skill, dc, trials)
+    simulation = cache.get(key)
+    record_cache_lookup("simulation", hit=simulation is not None)
+    if simulation is None:
+        simulation = simulate_turn(kingdom, skill, dc=dc, trials=trials)
+        cache.set(key, simulation, settings.KINGDOM_SIMULATION_CACHE_TIMEOUT)
+    return simulation
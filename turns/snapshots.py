@@ -0,0 +1,153 @@
+"""Turn-by-turn kingdom state snapshots, stored as keyframes plus deltas.
+
+A kingdom's state is flattened to ``{"kingdom.unrest": 2,
+"leadership.ruler.is_vacant": False, "skills.arts": "trained", ...}``. Every
+``KEYFRAME_INTERVAL`` turns (and for a kingdom's first snapshot) the full
+mapping is stored; in between, only the keys that changed since the previous
+snapshot. Rebuilding any turn reads one keyframe and at most
+``KEYFRAME_INTERVAL - 1`` deltas.
+"""
+
+from .models import TurnSnapshot
+
+KEYFRAME_INTERVAL = 10
+
+# Bookkeeping fields that aren't part of the game state.
+_SKIPPED_KINGDOM_FIELDS = {"id", "invite_code", "version", "stats_version"}
+_SKIPPED_ROW_FIELDS = {"id", "kingdom"}
+
+
+def _row_state(obj, skipped):
+    return {
+        field.attname: getattr(obj, field.attname)
+        for field in obj._meta.concrete_fields
+        if field.name not in skipped
+    }
+
+
+def capture_state(kingdom):
+    """Flatten a kingdom, its leadership and its skills into one mapping."""
+    state = {
+        f"kingdom.{name}": value
+        for name, value in _row_state(kingdom, _SKIPPED_KINGDOM_FIELDS).items()
+    }
+    for assignment in kingdom.leadership_assignments.all():
+        row = _row_state(assignment, _SKIPPED_ROW_FIELDS | {"role"})
+        for name, value in row.items():
+            state[f"leadership.{assignment.role}.{name}"] = value
+    for proficiency in kingdom.skill_proficiencies.all():
+        state[f"skills.{proficiency.skill}"] = proficiency.proficiency
+    return state
+
+
+def diff_states(old, new):
+    delta = {"set": {k: v for k, v in new.items() if k not in old or old[k] != v}}
+    removed = [k for k in old if k not in new]
+    if removed:
+        delta["unset"] = removed
+    return delta
+
+
+def apply_delta(state, delta):
+    state.update(delta.get("set", {}))
+    for key in delta.get("unset", ()):
+        state.pop(key, None)
+    return state
+
+
+def unflatten(state):
+    """Nest a flat state: ``{"kingdom": {...}, "leadership": {role: {...}}, ...}``."""
+    nested = {}
+    for key, value in state.items():
+        *path, leaf = key.split(".")
+        node = nested
+        for part in path:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+    return nested
+
+
+def state_at(kingdom_id, turn_number):
+    """Return the flat state recorded at the end of ``turn_number``.
+
+    Returns ``None`` if that turn has no snapshot.
+    """
+    snapshots = list(
+        TurnSnapshot.objects.filter(
+            kingdom_id=kingdom_id,
+            turn_number__lte=turn_number,
+            turn_number__gte=TurnSnapshot.objects.filter(
+                kingdom_id=kingdom_id,
+                turn_number__lte=turn_number,
+                is_keyframe=True,
+            )
+            .order_by("-turn_number")
+            .values("turn_number")[:1],
+        ).order_by("turn_number")
+    )
+    if not snapshots or snapshots[-1].turn_number != turn_number:
+        return None
+    state = {}
+    for snapshot in snapshots:
+        if snapshot.is_keyframe:
+            state = dict(snapshot.data)
+        else:
+            apply_delta(state, snapshot.data)
+    return state
+
+
+def record_snapshot(turn):
+    """Snapshot the kingdom's current state as the end of ``turn``.
+
+    Run inside a transaction (``KingdomTurn.complete_turn`` does).
+    """
+    kingdom = turn.kingdom
+    state = capture_state(kingdom)
+    TurnSnapshot.objects.filter(turn=turn).delete()
+    latest = (
+        TurnSnapshot.objects.filter(kingdom=kingdom)
+        .order_by("-turn_number")
+        .defer("data")
+        .first()
+    )
+    # A snapshot for a later turn was encoded without this one, so this can't
+    # be a link in its chain; a keyframe keeps both sides intact.
+    keyframe = (
+        latest is None
+        or latest.turn_number > turn.turn_number
+        or latest.depth + 1 >= KEYFRAME_INTERVAL
+    )
+    if keyframe:
+        data, depth = state, 0
+    else:
+        data = diff_states(state_at(kingdom.pk, latest.turn_number), state)
+        depth = latest.depth + 1
+    return TurnSnapshot.objects.create(
+        kingdom=kingdom,
+        turn=turn,
+        turn_number=turn.turn_number,
+        is_keyframe=keyframe,
+        depth=depth,
+        data=data,
+    )
+
+
+def promote_successor(snapshot):
+    """Rewrite the snapshot after ``snapshot`` as a keyframe.
+
+    Called before ``snapshot`` is deleted so the next delta doesn't lose its
+    base.
+    """
+    successor = (
+        TurnSnapshot.objects.filter(
+            kingdom_id=snapshot.kingdom_id, turn_number__gt=snapshot.turn_number
+        )
+        .order_by("turn_number")
+        .first()
+    )
+    if successor is None or successor.is_keyframe:
+        return
+    successor.data = state_at(successor.kingdom_id, successor.turn_number)
+    successor.is_keyframe = True
+    successor.depth = 0
+    successor.save(update_fields=["data", "is_keyframe", "depth"])
@@ -0,0 +1,369 @@
+"""Synthetic campaigns for benchmarks and scale testing.
+
+``generate_campaign`` builds kingdoms with members, leadership, skill
+proficiencies, turns and activities from a seeded ``random.Random``, so the
+same arguments always give the same data. Sizes and outcomes are drawn from
+rough play-like distributions: kingdoms skew low-level, campaigns run for
+different lengths and some have gone quiet, and activities follow the turn
+structure in docs/KINGDOM_TURNS.md with checks made against the kingdom's own
+modifiers and Control DC.
+
+Each kingdom is set up by ``kingdoms.provisioning`` and written in its own
+transaction with ``bulk_create``; turn tallies are counted as the activities
+are generated, and the summaries that the skipped ``save()`` calls and
+signals would keep are refreshed per kingdom.
+Analytics rollups are not built; run ``rebuild_analytics`` afterwards.
+"""
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from kingdoms.constants import GolarionMonth, KingdomSkill, Proficiency
+from kingdoms.models import Kingdom, KingdomMembership, KingdomSummary, MembershipRole
+from kingdoms.provisioning import provision_kingdom
+from kingdoms.stats import KingdomStatSheet
+from leadership.models import LeadershipAssignment
+from skills.models import KingdomSkillProficiency
+
+from .degrees import populate_degrees
+from .models import ActivityLog, ActivityTrait, KingdomTurn, tally_fields
+
+BATCH_SIZE = 1000
+
+# Relative frequency of each trait in the log, and the activities (with the
+# skill rolled, or None for entries that take no check) logged under it.
+ACTIVITIES = {
+    ActivityTrait.UPKEEP: (
+        1,
+        [
+            ("Assign Leadership", None),
+            ("Pay Consumption", None),
+            ("Deal with Unrest", KingdomSkill.POLITICS),
+        ],
+    ),
+    ActivityTrait.COMMERCE: (
+        2,
+        [
+            ("Collect Taxes", KingdomSkill.TRADE),
+            ("Improve Lifestyle", KingdomSkill.POLITICS),
+            ("Tap Treasury", KingdomSkill.STATECRAFT),
+            ("Trade Commodities", KingdomSkill.INDUSTRY),
+            ("Manage Trade Agreements", KingdomSkill.TRADE),
+        ],
+    ),
+    ActivityTrait.LEADERSHIP: (
+        5,
+        [
+            ("Celebrate Holiday", KingdomSkill.FOLKLORE),
+            ("Clandestine Business", KingdomSkill.INTRIGUE),
+            ("Create a Masterpiece", KingdomSkill.ARTS),
+            ("Hire Adventurers", KingdomSkill.WARFARE),
+            ("Infiltration", KingdomSkill.INTRIGUE),
+            ("Quell Unrest", KingdomSkill.POLITICS),
+            ("Request Foreign Aid", KingdomSkill.STATECRAFT),
+            ("Send Diplomatic Envoy", KingdomSkill.STATECRAFT),
+            ("Establish Trade Agreement", KingdomSkill.TRADE),
+            ("Creative Solution", KingdomSkill.SCHOLARSHIP),
+        ],
+    ),
+    ActivityTrait.REGION: (
+        3,
+        [
+            ("Claim Hex", KingdomSkill.EXPLORATION),
+            ("Clear Hex", KingdomSkill.ENGINEERING),
+            ("Build Roads", KingdomSkill.ENGINEERING),
+            ("Establish Farmland", KingdomSkill.AGRICULTURE),
+            ("Establish Work Site", KingdomSkill.INDUSTRY),
+            ("Fortify Hex", KingdomSkill.DEFENSE),
+            ("Go Fishing", KingdomSkill.BOATING),
+            ("Gather Livestock", KingdomSkill.WILDERNESS),
+            ("Harvest Crops", KingdomSkill.AGRICULTURE),
+        ],
+    ),
+    ActivityTrait.CIVIC: (
+        2,
+        [
+            ("Build Structure", KingdomSkill.INDUSTRY),
+            ("Build Structure", KingdomSkill.ENGINEERING),
+            ("Demolish", KingdomSkill.ENGINEERING),
+        ],
+    ),
+    ActivityTrait.FORTUNE: (
+        0.5,
+        [
+            ("Prognostication", KingdomSkill.MAGIC),
+            ("Supernatural Solution", KingdomSkill.MAGIC),
+        ],
+    ),
+    ActivityTrait.DOWNTIME: (
+        0.5,
+        [
+            ("Rest and Relax", KingdomSkill.ARTS),
+            ("Craft Luxuries", KingdomSkill.ARTS),
+            ("Provide Care", KingdomSkill.FOLKLORE),
+        ],
+    ),
+}
+_TRAITS = list(ACTIVITIES)
+_TRAIT_WEIGHTS = list(accumulate(weight for weight, _ in ACTIVITIES.values()))
+
+CHARACTER_NAMES = [
+    "Amiri",
+    "Ekundayo",
+    "Ezren",
+    "Harrim",
+    "Jaethal",
+    "Jubilost",
+    "Kyra",
+    "Linzi",
+    "Merisiel",
+    "Nok-Nok",
+    "Octavia",
+    "Regongar",
+    "Seoni",
+    "Tristian",
+    "Valerie",
+    "Valeros",
+]
+
+# Share of kingdoms whose campaign stopped a while ago.
+DORMANT_SHARE = 0.3
+
+
+@dataclass
+class Campaign:
+    kingdoms: list = field(default_factory=list)
+    # gms[i] runs kingdoms[i]; the other members are players.
+    gms: list = field(default_factory=list)
+    users: list = field(default_factory=list)  # Every member, GMs included
+    turns: int = 0
+    activities: int = 0
+
+
+def _level(rng):
+    """Kingdom level, skewed low: most campaigns never reach the high levels."""
+    return min(20, 1 + int(rng.expovariate(1 / 4)))
+
+
+def _proficiency(rng, level):
+    """A skill rank for a level ``level`` kingdom; ranks open up as it levels."""
+    if rng.random() > 0.35 + 0.03 * level:
+        return Proficiency.UNTRAINED
+    rank = 1
+    for unlocked_at in (3, 7, 15):
+        if level < unlocked_at or rng.random() < 0.5:
+            break
+        rank += 1
+    return Proficiency.values[rank]
+
+
+def _new_kingdom(rng, name):
+    """An unsaved kingdom with a random level, size and ability scores."""
+    level = _level(rng)
+    kingdom = Kingdom(
+        name=name,
+        level=level,
+        xp=rng.randrange(1000),
+        unrest=min(20, int(rng.expovariate(1 / 2))),
+        claimed_hexes=rng.randint(level, level * 6),
+    )
+    for ability in ("culture", "economy", "loyalty", "stability"):
+        score = 10 + rng.randint(0, 4) + rng.randint(0, level // 2)
+        setattr(kingdom, f"{ability}_score", min(score, 30))
+    return kingdom
+
+
+def _staff_leadership(rng, kingdom, players):
+    """Seat the players' characters as PC leaders and fill the rest with NPCs.
+
+    Returns the seated (non-vacant) assignments.
+    """
+    assignments = list(kingdom.leadership_assignments.all())
+    rng.shuffle(assignments)
+    for assignment, (user, character_name) in zip(assignments, players):
+        assignment.user = user
+        assignment.character_name = character_name
+        assignment.is_pc = True
+        assignment.is_vacant = False
+        assignment.is_invested = rng.random() < 0.9
+    for assignment in assignments[len(players) :]:
+        assignment.is_pc = False
+        assignment.is_vacant = rng.random() < 0.4
+        if not assignment.is_vacant:
+            assignment.character_name = rng.choice(CHARACTER_NAMES)
+            assignment.is_invested = rng.random() < 0.5
+    LeadershipAssignment.objects.bulk_update(
+        assignments,
+        ["user", "character_name", "is_pc", "is_vacant", "is_invested"],
+    )
+    return [assignment for assignment in assignments if not assignment.is_vacant]
+
+
+def _train_skills(rng, kingdom, leaders):
+    """Give the kingdom's skills ranks; returns its stat sheet.
+
+    The sheet is built from the rows just written, so checks are rolled with
+    the same modifiers the dashboard shows.
+    """
+    proficiencies = list(kingdom.skill_proficiencies.order_by("skill"))
+    for proficiency in proficiencies:
+        proficiency.proficiency = _proficiency(rng, kingdom.level)
+    KingdomSkillProficiency.objects.bulk_update(proficiencies, ["proficiency"])
+    return KingdomStatSheet.build(kingdom, proficiencies, leaders)
+
+
+def _activity(rng, kingdom, turn, leaders, modifiers, control_dc):
+    trait = rng.choices(_TRAITS, cum_weights=_TRAIT_WEIGHTS)[0]
+    name, skill = rng.choice(ACTIVITIES[trait][1])
+    activity = ActivityLog(
+        kingdom=kingdom, turn=turn, activity_name=name, activity_trait=trait
+    )
+    if leaders and (trait == ActivityTrait.LEADERSHIP or rng.random() < 0.5):
+        activity.performed_by = rng.choice(leaders)
+    if skill is not None:
+        activity.skill_used = skill
+        activity.roll_result = rng.randint(1, 20)
+        activity.total_modifier = modifiers[skill] + rng.randint(-2, 2)
+        activity.dc = control_dc + rng.choice((-2, 0, 0, 0, 2, 5))
+    return activity
+
+
+def _generate_kingdom(rng, campaign, index, members, turns, activities, prefix, now):
+    User = get_user_model()
+    users = User.objects.bulk_create(
+        [
+            User(
+                username=f"{prefix}-{index}-{m}",
+                email=f"{prefix}-{index}-{m}@example.com",
+                password=make_password(None),
+            )
+            for m in range(members)
+        ]
+    )
+    kingdom = provision_kingdom(
+        _new_kingdom(rng, f"{prefix.title()} Kingdom {index + 1}"), users[0]
+    )
+    players = [
+        KingdomMembership(
+            user=user,
+            kingdom=kingdom,
+            role=MembershipRole.PLAYER,
+            character_name=rng.choice(CHARACTER_NAMES),
+        )
+        for user in users[1:]
+    ]
+    KingdomMembership.objects.bulk_create(players)
+    leaders = _staff_leadership(
+        rng, kingdom, [(player.user, player.character_name) for player in players]
+    )
+    sheet = _train_skills(rng, kingdom, leaders)
+    modifiers = {line.skill: line.total for line in sheet.skills}
+    control_dc = sheet.control_dc
+    resource_die = sheet.resource_die_type
+
+    # Campaigns play about a turn a week; dormant ones stopped months ago.
+    last_played = now - timedelta(
+        days=(
+            rng.randint(30, 365) if rng.random() < DORMANT_SHARE else rng.random() * 6
+        )
+    )
+    turn_count = max(1, round(rng.triangular(turns / 2, turns * 1.5)))
+    first_month = rng.randrange(12)
+    new_turns, turn_logs = [], []
+    for number in range(1, turn_count + 1):
+        complete = number < turn_count
+        turn = KingdomTurn(
+            kingdom=kingdom,
+            turn_number=number,
+            in_game_month=GolarionMonth.values[(first_month + number) % 12],
+            starting_rp=kingdom.level + rng.randint(0, 10),
+            resource_dice_rolled=resource_die,
+            collected_taxes=rng.random() < 0.8,
+            completed_at=(
+                last_played - timedelta(weeks=turn_count - number) if complete else None
+            ),
+        )
+        if complete:
+            turn.event_occurred = rng.random() < 0.25
+            turn.event_xp = rng.choice((30, 60, 80)) if turn.event_occurred else 0
+            turn.ending_rp = rng.randint(0, turn.starting_rp)
+            turn.xp_gained = turn.event_xp + rng.randint(0, 40)
+        new_turns.append(turn)
+        count = max(1, round(rng.gauss(activities, activities / 3)))
+        turn_logs.append(
+            [
+                _activity(rng, kingdom, turn, leaders, modifiers, control_dc)
+                for _ in range(count)
+            ]
+        )
+    logs = [log for batch in turn_logs for log in batch]
+    populate_degrees(logs)
+    for turn, batch in zip(new_turns, turn_logs):
+        tallies = Counter(
+            name
+            for log in batch
+            for name in tally_fields(log.activity_trait, log.degree_of_success)
+        )
+        for name, count in tallies.items():
+            setattr(turn, name, count)
+
+    KingdomTurn.objects.bulk_create(new_turns)
+    ActivityLog.objects.bulk_create(logs, batch_size=BATCH_SIZE)
+    # auto_now_add stamped every row with now; date activities to their turn.
+    ActivityLog.objects.filter(kingdom=kingdom).update(
+        created_at=Coalesce(
+            models.Subquery(
+                KingdomTurn.objects.filter(pk=models.OuterRef("turn")).values(
+                    "completed_at"
+                )[:1]
+            ),
+            models.Value(last_played),
+        )
+    )
+    KingdomSummary.refresh_turn_number(kingdom.pk)
+    KingdomSummary.refresh_member_count(kingdom.pk)
+    Kingdom.bump_version(kingdom.pk, stats=True)
+
+    campaign.kingdoms.append(kingdom)
+    campaign.gms.append(users[0])
+    campaign.users.extend(users)
+    campaign.turns += len(new_turns)
+    campaign.activities += len(logs)
+
+
+def generate_campaign(
+    kingdoms=1,
+    members=4,
+    turns=10,
+    activities=8,
+    seed=0,
+    prefix="synthetic",
+    progress=None,
+):
+    """Create ``kingdoms`` kingdoms, each with ``members`` (at least one)
+    members, the first the GM. Kingdoms average ``turns`` turns (all but the
+    last complete) and turns average ``activities`` activities. Usernames and
+    kingdom names start with ``prefix``.
+
+    ``progress``, if given, is called with the campaign after each kingdom.
+    """
+    rng = random.Random(seed)
+    campaign = Campaign()
+    now = timezone.now()
+    for index in range(kingdoms):
+        with transaction.atomic():
+            _generate_kingdom(
+                rng, campaign, index, members, turns, activities, prefix, now
+            )
+        if progress is not None:
+            progress(campaign)
+    return campaign
@@ -1,11 +1,66 @@
+import asyncio
+import csv
+import io
+import json
+import random
+import tempfile
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from kingdoms.constants import KingdomSkill
+from kingdoms.models import (
+    Kingdom,
+    KingdomMembership,
+    KingdomSummary,
+    MembershipRole,
+)
+from kingdoms.pagination import decode_cursor, encode_cursor
+from kingdoms.testing import QueryBudgetMixin
 from leadership.models import LeadershipRole
 
-from .models import ActivityLog, ActivityTrait, DegreeOfSuccess, KingdomTurn
+from . import degrees, live, simulation
+from .analytics import load_dashboard, rebuild_rollups
+from .degrees import (
+    degree_odds,
+    degree_rank,
+    evaluate_degrees,
+    populate_degrees,
+)
+from .export import SECTIONS, jsonl_lines
+from .importer import import_campaign
+from .models import (
+    TALLY_FIELDS,
+    ActivityLog,
+    ActivityRollup,
+    ActivityTrait,
+    DegreeOfSuccess,
+    KingdomTurn,
+    RollupDimension,
+    TurnRollup,
+    TurnSnapshot,
+)
+from .simulation import (
+    MAX_TRIALS,
+    get_simulation,
+    simulate_resources,
+    simulate_turn,
+    simulation_cache_key,
+)
+from .snapshots import KEYFRAME_INTERVAL, state_at, unflatten
+from .synthetic import generate_campaign
+from .views import ActivityFeedView, TurnDetailView
 
 User = get_user_model()
 
@@ -64,6 +119,182 @@ class KingdomTurnModelTests(TestCase):
         self.assertEqual(ActivityLog.objects.count(), 0)
 
 
+class TurnTallyTests(TestCase):
+    def setUp(self):
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+
+    def _log(self, trait=ActivityTrait.REGION, **fields):
+        return ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=self.turn,
+            activity_name="Claim Hex",
+            activity_trait=trait,
+            **fields,
+        )
+
+    def _tallies(self, turn=None):
+        turn = turn or self.turn
+        return {
+            field: value
+            for field, value in KingdomTurn.objects.values(*TALLY_FIELDS)
+            .get(pk=turn.pk)
+            .items()
+            if value
+        }
+
+    def test_create_counts_activity(self):
+        self._log(degree_of_success=DegreeOfSuccess.SUCCESS)
+        self._log(ActivityTrait.CIVIC)
+        self.assertEqual(
+            self._tallies(),
+            {
+                "activities_logged": 2,
+                "success_count": 1,
+                "region_count": 1,
+                "civic_count": 1,
+            },
+        )
+
+    def test_update_moves_counts(self):
+        activity = self._log(degree_of_success=DegreeOfSuccess.SUCCESS)
+        activity.activity_trait = ActivityTrait.CIVIC
+        activity.degree_of_success = DegreeOfSuccess.CRITICAL_FAILURE
+        activity.save()
+        self.assertEqual(
+            self._tallies(),
+            {
+                "activities_logged": 1,
+                "critical_failure_count": 1,
+                "civic_count": 1,
+            },
+        )
+
+    def test_moving_to_another_turn(self):
+        other = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=2)
+        activity = ActivityLog.objects.get(pk=self._log().pk)
+        activity.turn = other
+        activity.save()
+        self.assertEqual(self._tallies(), {})
+        self.assertEqual(
+            self._tallies(other), {"activities_logged": 1, "region_count": 1}
+        )
+
+    def test_deferred_load_still_counts_correctly(self):
+        self._log(degree_of_success=DegreeOfSuccess.FAILURE)
+        activity = ActivityLog.objects.only("activity_name").get()
+        activity.degree_of_success = DegreeOfSuccess.SUCCESS
+        activity.save()
+        self.assertEqual(
+            self._tallies(),
+            {"activities_logged": 1, "success_count": 1, "region_count": 1},
+        )
+
+    def test_delete_uncounts(self):
+        self._log(degree_of_success=DegreeOfSuccess.SUCCESS).delete()
+        self.assertEqual(self._tallies(), {})
+
+    def test_cached_turn_updated(self):
+        activity = self._log()
+        self.assertEqual(activity.turn.activity_count, 1)
+
+    def test_stale_turn_save_keeps_counts(self):
+        stale = KingdomTurn.objects.get(pk=self.turn.pk)
+        self._log()
+        stale.notes = "Edited"
+        stale.save()
+        self.assertEqual(KingdomTurn.objects.get(pk=self.turn.pk).activity_count, 1)
+
+    def test_recount_repairs_drift(self):
+        self._log(degree_of_success=DegreeOfSuccess.SUCCESS)
+        self._log()
+        expected = self._tallies()
+        KingdomTurn.objects.update(activities_logged=9, success_count=0)
+        self.assertEqual(KingdomTurn.recount(), 1)
+        self.assertEqual(self._tallies(), expected)
+        self.assertEqual(KingdomTurn.recount(), 0)
+
+    def test_recount_command(self):
+        self._log()
+        KingdomTurn.objects.update(activities_logged=0)
+        out = io.StringIO()
+        call_command("recount_turns", "--kingdom", self.kingdom.pk, stdout=out)
+        self.assertIn("Repaired 1 turns", out.getvalue())
+        self.assertEqual(KingdomTurn.objects.get().activity_count, 1)
+
+
+class TurnSnapshotTests(TestCase):
+    def setUp(self):
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+
+    def _play_turns(self, count):
+        """Complete ``count`` turns, raising unrest by one each turn."""
+        start = self.kingdom.turns.count()
+        for number in range(start + 1, start + count + 1):
+            turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=number)
+            self.kingdom.unrest = number
+            self.kingdom.save()
+            turn.complete_turn()
+
+    def test_first_snapshot_is_keyframe(self):
+        self._play_turns(1)
+        snapshot = TurnSnapshot.objects.get()
+        self.assertTrue(snapshot.is_keyframe)
+        self.assertEqual(snapshot.data["kingdom.unrest"], 1)
+        self.assertEqual(snapshot.data["skills.arts"], "untrained")
+
+    def test_deltas_store_only_changes(self):
+        self._play_turns(2)
+        snapshot = TurnSnapshot.objects.get(turn_number=2)
+        self.assertFalse(snapshot.is_keyframe)
+        self.assertEqual(snapshot.data, {"set": {"kingdom.unrest": 2}})
+
+    def test_keyframe_interval(self):
+        self._play_turns(KEYFRAME_INTERVAL * 2 + 1)
+        keyframes = TurnSnapshot.objects.filter(is_keyframe=True)
+        self.assertEqual(
+            list(keyframes.values_list("turn_number", flat=True)),
+            [1, KEYFRAME_INTERVAL + 1, KEYFRAME_INTERVAL * 2 + 1],
+        )
+
+    def test_state_at_reconstructs_every_turn(self):
+        self._play_turns(KEYFRAME_INTERVAL + 5)
+        self.kingdom.skill_proficiencies.filter(skill="arts").update(
+            proficiency="expert"
+        )
+        self._play_turns(1)
+        for number in range(1, KEYFRAME_INTERVAL + 6):
+            self.assertEqual(
+                state_at(self.kingdom.pk, number)["kingdom.unrest"], number
+            )
+        latest = unflatten(state_at(self.kingdom.pk, KEYFRAME_INTERVAL + 6))
+        self.assertEqual(latest["skills"]["arts"], "expert")
+        self.assertEqual(latest["leadership"]["ruler"]["is_vacant"], True)
+
+    def test_state_at_reads_one_keyframe_window(self):
+        self._play_turns(KEYFRAME_INTERVAL * 3)
+        with self.assertNumQueries(1):
+            state_at(self.kingdom.pk, KEYFRAME_INTERVAL * 3)
+
+    def test_state_at_missing_turn(self):
+        self._play_turns(1)
+        self.assertIsNone(state_at(self.kingdom.pk, 2))
+
+    def test_deleting_turn_keeps_later_turns_decodable(self):
+        self._play_turns(4)
+        KingdomTurn.objects.get(kingdom=self.kingdom, turn_number=2).delete()
+        self.assertTrue(TurnSnapshot.objects.get(turn_number=3).is_keyframe)
+        self.assertEqual(state_at(self.kingdom.pk, 4)["kingdom.unrest"], 4)
+
+    def test_completing_earlier_turn_after_later_one(self):
+        early = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        self._play_turns(1)  # turn 2
+        early.complete_turn()
+        self.assertTrue(TurnSnapshot.objects.get(turn_number=1).is_keyframe)
+        self.assertEqual(state_at(self.kingdom.pk, 2)["kingdom.unrest"], 2)
+
+
 class ActivityLogModelTests(TestCase):
     def setUp(self):
         self.kingdom = Kingdom.objects.create(name="Test Kingdom")
@@ -205,6 +436,7 @@ class ActivityLogModelTests(TestCase):
 
 class TurnCreateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -264,6 +496,7 @@ class TurnCreateViewTests(TestCase):
 
 class TurnDetailViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -322,6 +555,51 @@ class TurnDetailViewTests(TestCase):
         response = self.client.get(self.url)
         self.assertContains(response, "Claim Hex")
 
+    def test_activities_grouped_by_trait_in_phase_order(self):
+        for trait in (ActivityTrait.CIVIC, ActivityTrait.UPKEEP, ActivityTrait.CIVIC):
+            ActivityLog.objects.create(
+                kingdom=self.kingdom,
+                turn=self.turn,
+                activity_name=f"{trait.label} activity",
+                activity_trait=trait,
+            )
+        self.client.force_login(self.gm)
+        response = self.client.get(self.url)
+        self.assertEqual(
+            [a.activity_trait for a in response.context["activities"]],
+            [ActivityTrait.UPKEEP, ActivityTrait.CIVIC, ActivityTrait.CIVIC],
+        )
+
+    def test_activities_paginate_by_cursor(self):
+        for i in range(5):
+            ActivityLog.objects.create(
+                kingdom=self.kingdom,
+                turn=self.turn,
+                activity_name=f"Activity {i}",
+                activity_trait=ActivityTrait.REGION,
+            )
+        self.client.force_login(self.gm)
+        with patch.object(TurnDetailView, "per_page", 3):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url, {"after": first.context["next_cursor"]})
+        names = [a.activity_name for a in first.context["activities"]]
+        names += [a.activity_name for a in second.context["activities"]]
+        self.assertEqual(names, [f"Activity {i}" for i in reversed(range(5))])
+        self.assertIsNone(second.context["next_cursor"])
+        self.assertContains(second, "First")
+
+    def test_mistyped_cursor_404(self):
+        # The ordering is (trait_order, -created_at, -pk).
+        self.client.force_login(self.gm)
+        for values in (
+            ["upkeep", "2026-01-01T00:00:00+00:00", 1],
+            [0, "2026-13-45", 1],
+            [0, "2026-01-01T00:00:00+00:00", {"pk": 1}],
+        ):
+            with self.subTest(values=values):
+                response = self.client.get(self.url, {"after": encode_cursor(values)})
+                self.assertEqual(response.status_code, 404)
+
     def test_gm_sees_controls(self):
         self.client.force_login(self.gm)
         response = self.client.get(self.url)
@@ -351,9 +629,39 @@ class TurnDetailViewTests(TestCase):
         response = self.client.get(self.url)
         self.assertNotContains(response, "Event Phase")
 
+    def test_unchanged_turn_304(self):
+        self.client.force_login(self.player)
+        etag = self.client.get(self.url)["ETag"]
+        # session, user, membership+kingdom; no turn or activity queries
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_activity_write_changes_etag(self):
+        self.client.force_login(self.player)
+        etag = self.client.get(self.url)["ETag"]
+        ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=self.turn,
+            activity_name="Claim Hex",
+            activity_trait=ActivityTrait.REGION,
+        )
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertContains(response, "Claim Hex")
+
+    def test_etag_differs_per_turn(self):
+        self.client.force_login(self.player)
+        other = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=2)
+        etag = self.client.get(self.url)["ETag"]
+        url = reverse(
+            "turns:turn_detail", kwargs={"pk": self.kingdom.pk, "turn_pk": other.pk}
+        )
+        self.assertNotEqual(self.client.get(url)["ETag"], etag)
+
 
 class TurnUpdateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -463,6 +771,7 @@ class TurnUpdateViewTests(TestCase):
 
 class TurnDeleteViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -509,6 +818,7 @@ class TurnDeleteViewTests(TestCase):
 
 class TurnCompleteViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -541,6 +851,7 @@ class TurnCompleteViewTests(TestCase):
 
 class ActivityCreateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -663,6 +974,7 @@ class ActivityCreateViewTests(TestCase):
 
 class ActivityUpdateViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -736,6 +1048,7 @@ class ActivityUpdateViewTests(TestCase):
 
 class ActivityDeleteViewTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
@@ -802,116 +1115,1203 @@ class ActivityDeleteViewTests(TestCase):
         self.assertTrue(ActivityLog.objects.filter(pk=self.activity.pk).exists())
 
 
-@override_settings(DEBUG=True)
-class QueryCountTests(TestCase):
-    """
-    Verify views don't perform duplicate database queries.
+class KingdomExportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.user,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+        )
+        for number in (1, 2):
+            turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=number)
+            for i in range(3):
+                ActivityLog.objects.create(
+                    kingdom=self.kingdom,
+                    turn=turn,
+                    activity_name=f"Activity {number}.{i}",
+                    activity_trait=ActivityTrait.REGION,
+                )
+        self.client.force_login(self.user)
+        self.url = reverse("turns:kingdom_export", kwargs={"pk": self.kingdom.pk})
+
+    def _jsonl(self, response):
+        self.assertEqual(response.status_code, 200)
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
 
-    The dispatch() pattern in mixins intentionally duplicates lookups
-    to avoid calling super().dispatch() multiple times, but should not
-    result in double queries to the database.
-    """
+    def test_jsonl_streams_every_section(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = self._jsonl(response)
+        types = [record["type"] for record in records]
+        self.assertEqual(types.count("leadership"), 8)
+        self.assertEqual(types.count("skills"), 16)
+        self.assertEqual(types.count("turns"), 2)
+        self.assertEqual(types.count("activities"), 6)
+        activities = [r["activity_name"] for r in records if r["type"] == "activities"]
+        self.assertEqual(activities[0], "Activity 1.0")
+        self.assertEqual(activities[-1], "Activity 2.2")
+
+    async def test_asgi_streams_in_chunks(self):
+        await self.async_client.aforce_login(self.user)
+        with patch("turns.export.CHUNK_SIZE", 2):
+            response = await self.async_client.get(self.url, {"format": "csv"})
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+        # Header plus six activities, two lines per chunk.
+        self.assertEqual(len(chunks), 4)
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        self.assertEqual(
+            [row["activity_name"] for row in rows][::5],
+            ["Activity 1.0", "Activity 2.2"],
+        )
 
+    def test_resume_after_cursor(self):
+        records = self._jsonl(self.client.get(self.url, {"section": "activities"}))
+        resumed = self._jsonl(
+            self.client.get(
+                self.url, {"section": "activities", "after": records[2]["cursor"]}
+            )
+        )
+        self.assertEqual(
+            [r["activity_name"] for r in resumed],
+            [r["activity_name"] for r in records[3:]],
+        )
+
+    def test_resume_skips_finished_sections(self):
+        records = self._jsonl(self.client.get(self.url))
+        last_turn = [r for r in records if r["type"] == "turns"][-1]
+        resumed = self._jsonl(self.client.get(self.url, {"after": last_turn["cursor"]}))
+        self.assertEqual({r["type"] for r in resumed}, {"activities"})
+
+    def test_csv_single_section(self):
+        response = self.client.get(self.url, {"format": "csv", "section": "turns"})
+        self.assertEqual(response.status_code, 200)
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual([row["turn_number"] for row in rows], ["1", "2"])
+
+    def test_csv_rejects_several_sections(self):
+        response = self.client.get(
+            self.url, {"format": "csv", "section": ["turns", "skills"]}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_bad_cursor_404(self):
+        response = self.client.get(self.url, {"after": "garbage"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_mistyped_cursor_404_before_streaming(self):
+        for values in (
+            ["activities", "one", "2026-01-01T00:00:00+00:00", 1],
+            ["activities", 1, "yesterday", 1],
+            ["activities", 1, "2026-01-01T00:00:00+00:00"],
+            [["activities"], 1],
+        ):
+            with self.subTest(values=values):
+                response = self.client.get(self.url, {"after": encode_cursor(values)})
+                self.assertEqual(response.status_code, 404)
+                self.assertFalse(response.streaming)
+
+    def test_non_member_404(self):
+        other = Kingdom.objects.create(name="Other")
+        url = reverse("turns:kingdom_export", kwargs={"pk": other.pk})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_management_command(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "export.jsonl"
+            call_command(
+                "export_campaign",
+                self.kingdom.pk,
+                "--section",
+                "turns",
+                "--output",
+                str(path),
+                stdout=out,
+            )
+            lines = path.read_text().splitlines()
+        self.assertEqual([json.loads(line)["turn_number"] for line in lines], [1, 2])
+        self.assertEqual(out.getvalue(), "")
+
+    def test_management_command_rejects_bad_cursor(self):
+        out = io.StringIO()
+        cursor = encode_cursor(["turns", "one", 1])
+        with self.assertRaisesMessage(CommandError, "Invalid export cursor."):
+            call_command(
+                "export_campaign", self.kingdom.pk, "--after", cursor, stdout=out
+            )
+        self.assertEqual(out.getvalue(), "")
+
+
+class LiveUpdateTests(TestCase):
     def setUp(self):
+        cache.clear()
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=self.player,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+        )
+        self.turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        self.url = reverse("turns:kingdom_events", kwargs={"pk": self.kingdom.pk})
+        # A fresh broker per test; streams left open don't leak between tests.
+        live.get_broker.cache_clear()
+        self.addCleanup(live.get_broker.cache_clear)
+        self.broker = live.get_broker()
+
+    def _published(self, action):
+        with (
+            patch.object(self.broker, "publish") as publish,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            action()
+        return [call.args[0] for call in publish.call_args_list]
+
+    def _log(self):
+        return ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=self.turn,
+            activity_name="Claim Hex",
+            activity_trait=ActivityTrait.REGION,
+        )
+
+    def test_activity_writes_publish_after_commit(self):
+        [created] = self._published(self._log)
+        self.assertEqual(
+            created,
+            live.LiveEvent(
+                type="activity.created",
+                kingdom=self.kingdom.pk,
+                turn=self.turn.pk,
+                activity=created.activity,
+            ),
+        )
+        activity = ActivityLog.objects.get()
+        activity.notes = "Edited"
+        [updated] = self._published(activity.save)
+        self.assertEqual(updated.type, "activity.updated")
+        [deleted] = self._published(activity.delete)
+        self.assertEqual((deleted.type, deleted.activity), ("activity.deleted", 1))
+
+    def test_turn_completion_publishes(self):
+        events = self._published(self.turn.complete_turn)
+        self.assertEqual([event.type for event in events], ["turn.completed"])
+
+    def test_turn_delete_publishes_nothing_per_activity(self):
+        self._log()
+        self.assertEqual(self._published(self.turn.delete), [])
+
+    def test_rolled_back_write_publishes_nothing(self):
+        with patch.object(self.broker, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=False):
+                self._log()
+        publish.assert_not_called()
+
+    def test_event_encoding(self):
+        event = live.LiveEvent("activity.created", kingdom=1, turn=2, activity=3)
+        self.assertEqual(
+            event.encode(),
+            'event: activity.created\ndata: {"type": "activity.created", '
+            '"turn": 2, "activity": 3}\n\n',
+        )
+
+    def test_wsgi_request_gets_204(self):
+        self.client.force_login(self.player)
+        self.assertEqual(self.client.get(self.url).status_code, 204)
+
+    def test_non_member_404(self):
+        other = Kingdom.objects.create(name="Other")
+        self.client.force_login(self.player)
+        url = reverse("turns:kingdom_events", kwargs={"pk": other.pk})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_anonymous_redirected_to_login(self):
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+    async def test_stream_fans_out_and_unsubscribes(self):
+        await self.async_client.aforce_login(self.player)
+        streams = []
+        try:
+            for _ in range(2):
+                response = await self.async_client.get(self.url)
+                self.assertEqual(response["Content-Type"], "text/event-stream")
+                stream = aiter(response.streaming_content)
+                self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+                streams.append(stream)
+            self.assertEqual(self.broker.subscriber_count(self.kingdom.pk), 2)
+
+            event = live.LiveEvent("turn.completed", kingdom=self.kingdom.pk, turn=1)
+            self.broker.publish(event)
+            for stream in streams:
+                self.assertEqual(await anext(stream), event.encode().encode())
+
+            # A client disconnect cancels the read in progress, as the ASGI
+            # handler does; that is what ends the stream's subscription.
+            for stream in streams:
+                read = asyncio.ensure_future(anext(stream))
+                await asyncio.sleep(0)
+                read.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await read
+            self.assertEqual(self.broker.subscriber_count(self.kingdom.pk), 0)
+        finally:
+            for stream in streams:
+                await stream.aclose()
+
+    async def test_idle_stream_keeps_alive_and_unsubscribes_on_close(self):
+        stream = live.event_stream(self.kingdom.pk, keepalive=0.01)
+        await anext(stream)
+        self.assertEqual(self.broker.subscriber_count(self.kingdom.pk), 1)
+        self.assertEqual(await anext(stream), ": keepalive\n\n")
+        await stream.aclose()
+        self.assertEqual(self.broker.subscriber_count(self.kingdom.pk), 0)
+
+    def test_kingdom_and_turn_pages_subscribe(self):
+        self.client.force_login(self.player)
+        turn_url = reverse(
+            "turns:turn_detail",
+            kwargs={"pk": self.kingdom.pk, "turn_pk": self.turn.pk},
+        )
+        self.assertContains(self.client.get(turn_url), f'data-turn="{self.turn.pk}"')
+        kingdom_url = reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        self.assertContains(self.client.get(kingdom_url), 'data-turn=""')
+
+
+class ActivityFeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=self.player,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+        )
+        for number in (1, 2):
+            turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=number)
+            for i in range(2):
+                ActivityLog.objects.create(
+                    kingdom=self.kingdom,
+                    turn=turn,
+                    activity_name=f"Activity {number}.{i}",
+                    activity_trait=ActivityTrait.REGION,
+                )
+        self.client.force_login(self.player)
+        self.url = reverse("turns:activity_feed", kwargs={"pk": self.kingdom.pk})
+
+    def test_lists_every_turn_newest_first(self):
+        response = self.client.get(self.url)
+        self.assertEqual(
+            [a.activity_name for a in response.context["activities"]],
+            ["Activity 2.1", "Activity 2.0", "Activity 1.1", "Activity 1.0"],
+        )
+        self.assertContains(response, "Turn 2")
+        self.assertIsNone(response.context["next_cursor"])
+
+    def test_resumes_after_cursor(self):
+        with patch.object(ActivityFeedView, "per_page", 3):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url, {"after": first.context["next_cursor"]})
+        self.assertEqual(
+            [a.activity_name for a in second.context["activities"]], ["Activity 1.0"]
+        )
+
+    def test_bad_cursor_404(self):
+        self.assertEqual(self.client.get(self.url, {"after": "x"}).status_code, 404)
+
+    def test_tampered_cursor_404(self):
+        with patch.object(ActivityFeedView, "per_page", 3):
+            created_at, pk = decode_cursor(
+                self.client.get(self.url).context["next_cursor"]
+            )
+            for values in ([created_at, "1 OR 1=1"], ["last week", pk], [pk]):
+                with self.subTest(values=values):
+                    response = self.client.get(
+                        self.url, {"after": encode_cursor(values)}
+                    )
+                    self.assertEqual(response.status_code, 404)
+
+    def test_non_member_404(self):
+        other = Kingdom.objects.create(name="Other")
+        url = reverse("turns:activity_feed", kwargs={"pk": other.pk})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class CampaignImportTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        cache.clear()
         self.gm = User.objects.create_user(
             username="gm",
             email="gm@example.com",
             password=TEST_PASSWORD,
         )
-        self.player = User.objects.create_user(
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        self.client.force_login(self.gm)
+        self.url = reverse("turns:campaign_import", kwargs={"pk": self.kingdom.pk})
+
+    def _csv(self, rows):
+        columns = ["turn_number", "activity_name", "activity_trait", "performer_role"]
+        columns += ["roll_result", "total_modifier", "dc", "degree_of_success"]
+        columns += ["created_at"]
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+        return out.getvalue()
+
+    def _row(self, turn_number=1, **extra):
+        return {
+            "turn_number": turn_number,
+            "activity_name": "Claim Hex",
+            "activity_trait": ActivityTrait.REGION,
+            **extra,
+        }
+
+    def test_imports_rows_and_creates_turns(self):
+        result = import_campaign(
+            self.kingdom,
+            self._csv([self._row(1), self._row(1), self._row(3)]),
+            created_by=self.gm,
+        )
+        self.assertEqual((result.turns_created, result.activities_created), (2, 3))
+        self.assertEqual(
+            list(self.kingdom.turns.values_list("turn_number", flat=True)), [3, 1]
+        )
+        self.assertEqual(self.kingdom.activities.filter(created_by=self.gm).count(), 3)
+        self.kingdom.summary.refresh_from_db()
+        self.assertEqual(self.kingdom.summary.current_turn_number, 3)
+        self.assertEqual(self.kingdom.turns.get(turn_number=1).activity_count, 2)
+
+    def test_resolves_performer_role(self):
+        import_campaign(
+            self.kingdom, self._csv([self._row(performer_role=LeadershipRole.RULER)])
+        )
+        activity = self.kingdom.activities.get()
+        self.assertEqual(activity.performed_by.role, LeadershipRole.RULER)
+
+    def test_computes_degree_of_success(self):
+        import_campaign(
+            self.kingdom,
+            self._csv([self._row(roll_result=20, total_modifier=5, dc=15)]),
+        )
+        self.assertEqual(
+            self.kingdom.activities.get().degree_of_success,
+            DegreeOfSuccess.CRITICAL_SUCCESS,
+        )
+
+    def test_invalid_row_writes_nothing(self):
+        content = self._csv(
+            [
+                self._row(1),
+                self._row(2, activity_trait="bogus"),
+                self._row(3, performer_role="jester"),
+                self._row("x"),
+            ]
+        )
+        with self.assertRaises(ValidationError) as ctx:
+            import_campaign(self.kingdom, content)
+        messages = ctx.exception.messages
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(messages[0].startswith("Line 3:"))
+        self.assertIn("jester", messages[1])
+        self.assertFalse(self.kingdom.turns.exists())
+        self.assertFalse(self.kingdom.activities.exists())
+
+    def test_round_trips_export(self):
+        source = Kingdom.objects.create(name="Source")
+        source.initialize_defaults()
+        ruler = source.leadership_assignments.get(role=LeadershipRole.RULER)
+        turn = KingdomTurn.objects.create(
+            kingdom=source, turn_number=1, in_game_month="abadius", xp_gained=40
+        )
+        logged = ActivityLog.objects.create(
+            kingdom=source,
+            turn=turn,
+            activity_name="Rest and Relax",
+            activity_trait=ActivityTrait.LEADERSHIP,
+            performed_by=ruler,
+            roll_result=3,
+            total_modifier=4,
+            dc=14,
+            degree_of_success=DegreeOfSuccess.FAILURE,
+        )
+        logged_at = datetime(2025, 3, 1, 18, 30, tzinfo=UTC)
+        ActivityLog.objects.filter(pk=logged.pk).update(created_at=logged_at)
+        content = "".join(jsonl_lines(source, SECTIONS))
+        result = import_campaign(self.kingdom, content, file_format="jsonl")
+        self.assertEqual((result.turns_created, result.activities_created), (1, 1))
+        imported = self.kingdom.turns.get()
+        self.assertEqual((imported.in_game_month, imported.xp_gained), ("abadius", 40))
+        activity = self.kingdom.activities.get()
+        self.assertEqual(activity.performed_by.role, LeadershipRole.RULER)
+        self.assertEqual(activity.degree_of_success, DegreeOfSuccess.FAILURE)
+        self.assertEqual(activity.created_at, logged_at)
+
+    def test_keeps_csv_created_at(self):
+        import_campaign(
+            self.kingdom,
+            self._csv(
+                [
+                    self._row(created_at="2025-03-01 18:30:00+00:00"),
+                    self._row(created_at="2025-03-02 09:00:00"),
+                    self._row(),
+                ]
+            ),
+        )
+        stamps = list(self.kingdom.activities.values_list("created_at", flat=True))
+        self.assertEqual(
+            stamps[1:],
+            [
+                datetime(2025, 3, 2, 9, tzinfo=UTC),
+                datetime(2025, 3, 1, 18, 30, tzinfo=UTC),
+            ],
+        )
+        self.assertGreater(stamps[0], stamps[1])
+
+    def test_rejects_bad_created_at(self):
+        with self.assertRaises(ValidationError) as ctx:
+            import_campaign(
+                self.kingdom, self._csv([self._row(created_at="last Tuesday")])
+            )
+        self.assertIn("created_at", ctx.exception.messages[0])
+        self.assertFalse(self.kingdom.activities.exists())
+
+    def test_queries_do_not_scale_with_rows(self):
+        few = self._csv([self._row(1)] * 2)
+        many = self._csv([self._row(n % 5 + 2) for n in range(60)])
+        with CaptureQueriesContext(connection) as small:
+            import_campaign(self.kingdom, few)
+        with CaptureQueriesContext(connection) as large:
+            import_campaign(self.kingdom, many)
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(self.kingdom.activities.count(), 62)
+
+    def test_view_imports_upload(self):
+        upload = SimpleUploadedFile("turns.csv", self._csv([self._row()]).encode())
+        response = self.client.post(self.url, {"file": upload, "file_format": "csv"})
+        self.assertRedirects(
+            response, reverse("kingdoms:kingdom_detail", kwargs={"pk": self.kingdom.pk})
+        )
+        self.assertEqual(self.kingdom.activities.count(), 1)
+
+    def test_view_shows_row_errors(self):
+        upload = SimpleUploadedFile(
+            "turns.csv", self._csv([self._row(performer_role="jester")]).encode()
+        )
+        response = self.client.post(self.url, {"file": upload, "file_format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "unknown leadership role")
+
+    def test_view_gm_only(self):
+        player = User.objects.create_user(
             username="player",
             email="player@example.com",
             password=TEST_PASSWORD,
         )
-        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        self.client.force_login(player)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_management_command(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "activities.csv"
+            path.write_text(self._csv([self._row(), self._row(2)]))
+            call_command(
+                "import_campaign",
+                self.kingdom.pk,
+                str(path),
+                "--user",
+                "gm",
+                stdout=out,
+            )
+        self.assertEqual(self.kingdom.activities.filter(created_by=self.gm).count(), 2)
+        self.assertIn("Imported 2 activities", out.getvalue())
+
+    def test_management_command_reports_errors(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "activities.csv"
+            path.write_text(self._csv([self._row("x")]))
+            with self.assertRaises(CommandError):
+                call_command("import_campaign", self.kingdom.pk, str(path), stdout=out)
+        self.assertEqual(out.getvalue(), "")
+        self.assertFalse(self.kingdom.activities.exists())
+
+
+class DegreeEvaluatorTests(TestCase):
+    """``evaluate_degrees`` must agree with the per-instance model method."""
+
+    def _cases(self):
+        # Every natural roll against every total-to-DC gap that matters,
+        # plus a random spread of out-of-range values and missing inputs.
+        cases = [
+            (roll, modifier, 15) for roll in range(1, 21) for modifier in range(-15, 36)
+        ]
+        rng = random.Random(20)
+        cases += [
+            (
+                rng.choice([None, *range(0, 31)]),
+                rng.choice([None, *range(-40, 41)]),
+                rng.choice([None, *range(0, 61)]),
+            )
+            for _ in range(2000)
+        ]
+        return cases
+
+    def _expected(self, cases):
+        return [
+            ActivityLog(
+                roll_result=roll, total_modifier=modifier, dc=dc
+            ).calculate_degree_of_success()
+            for roll, modifier, dc in cases
+        ]
+
+    def _evaluate(self, cases, use_numpy):
+        rolls, modifiers, dcs = zip(*cases)
+        return evaluate_degrees(rolls, modifiers, dcs, use_numpy=use_numpy)
+
+    def test_python_matches_model(self):
+        cases = self._cases()
+        self.assertEqual(self._evaluate(cases, False), self._expected(cases))
+
+    def test_numpy_matches_model(self):
+        cases = self._cases()
+        self.assertEqual(self._evaluate(cases, True), self._expected(cases))
+
+    def test_empty_input(self):
+        self.assertEqual(evaluate_degrees([], [], []), [])
+
+    def test_odds_table_matches_model(self):
+        for modifier in range(-20, 50):
+            for dc in range(0, 70):
+                counts = Counter(
+                    ActivityLog(
+                        roll_result=face, total_modifier=modifier, dc=dc
+                    ).calculate_degree_of_success()
+                    for face in range(1, 21)
+                )
+                expected = tuple(5 * counts[degree] for degree in degrees.DEGREES)
+                self.assertEqual(degree_odds(modifier, dc), expected, (modifier, dc))
+
+    def test_activity_form_embeds_odds_table(self):
+        user = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        kingdom = Kingdom.objects.create(name="Test Kingdom")
+        KingdomMembership.objects.create(
+            user=user, kingdom=kingdom, role=MembershipRole.PLAYER
+        )
+        turn = KingdomTurn.objects.create(kingdom=kingdom, turn_number=1)
+        self.client.force_login(user)
+        response = self.client.get(
+            reverse(
+                "turns:activity_create", kwargs={"pk": kingdom.pk, "turn_pk": turn.pk}
+            )
+        )
+        self.assertEqual(response.context["degree_odds"]["odds"], degrees.ODDS_TABLE)
+        self.assertContains(response, 'id="degree-odds-table"')
+
+    def test_populate_keeps_manual_degrees(self):
+        manual = ActivityLog(
+            roll_result=20, total_modifier=5, dc=15, degree_of_success="failure"
+        )
+        blank = ActivityLog(roll_result=1, total_modifier=5, dc=15)
+        no_roll = ActivityLog()
+        self.assertEqual(populate_degrees([manual, blank, no_roll]), [blank])
+        self.assertEqual(manual.degree_of_success, DegreeOfSuccess.FAILURE)
+        self.assertEqual(blank.degree_of_success, DegreeOfSuccess.CRITICAL_FAILURE)
+        self.assertEqual(no_roll.degree_of_success, "")
+
+        self.assertEqual(populate_degrees([manual], overwrite=True), [manual])
+        self.assertEqual(manual.degree_of_success, DegreeOfSuccess.CRITICAL_SUCCESS)
+
+    def test_recompute_command(self):
+        kingdom = Kingdom.objects.create(name="Test Kingdom")
+        turn = KingdomTurn.objects.create(kingdom=kingdom, turn_number=1)
+        blank, manual = ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    kingdom=kingdom,
+                    turn=turn,
+                    activity_name="Claim Hex",
+                    activity_trait=ActivityTrait.REGION,
+                    roll_result=10,
+                    total_modifier=5,
+                    dc=15,
+                ),
+                ActivityLog(
+                    kingdom=kingdom,
+                    turn=turn,
+                    activity_name="Claim Hex",
+                    activity_trait=ActivityTrait.REGION,
+                    roll_result=10,
+                    total_modifier=5,
+                    dc=15,
+                    degree_of_success=DegreeOfSuccess.FAILURE,
+                ),
+            ]
+        )
+        call_command("recompute_degrees", stdout=io.StringIO())
+        blank.refresh_from_db()
+        manual.refresh_from_db()
+        self.assertEqual(blank.degree_of_success, DegreeOfSuccess.SUCCESS)
+        self.assertEqual(manual.degree_of_success, DegreeOfSuccess.FAILURE)
+        turn.refresh_from_db()
+        self.assertEqual((turn.success_count, turn.failure_count), (1, 1))
+
+        call_command("recompute_degrees", "--overwrite", stdout=io.StringIO())
+        manual.refresh_from_db()
+        self.assertEqual(manual.degree_of_success, DegreeOfSuccess.SUCCESS)
+
+
+class TurnSimulationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(
+            name="Test Kingdom", level=3, bonus_dice=2, penalty_dice=1
+        )
         self.kingdom.initialize_defaults()
         KingdomMembership.objects.create(
             user=self.gm,
             kingdom=self.kingdom,
             role=MembershipRole.GM,
         )
+        self.url = reverse("turns:turn_simulate", kwargs={"pk": self.kingdom.pk})
+
+    def _expected_odds(self, modifier, dc):
+        ranks = [degree_rank(face, modifier, dc) for face in range(1, 21)]
+        return [ranks.count(rank) / 20 for rank in range(4)]
+
+    def _samplers(self):
+        yield False
+        yield True
+
+    def test_check_odds_are_exact(self):
+        for dc in (5, 15, 40):
+            with self.subTest(dc=dc):
+                check = simulate_turn(self.kingdom, KingdomSkill.TRADE, dc=dc).check
+                self.assertEqual(
+                    list(check.probabilities), self._expected_odds(check.modifier, dc)
+                )
+                self.assertAlmostEqual(sum(check.probabilities), 1)
+
+    def test_resource_totals_stay_in_range(self):
+        for use_numpy in self._samplers():
+            with self.subTest(use_numpy=use_numpy):
+                rng = simulation._generator(7, use_numpy)
+                totals = simulate_resources(8, 6, 20_000, rng)
+                self.assertGreaterEqual(totals[0], 8)
+                self.assertLessEqual(totals[-1], 48)
+                self.assertAlmostEqual(sum(totals) / 20_000, 28, delta=0.3)
+
+    def test_simulate_turn_uses_stat_sheet(self):
+        result = simulate_turn(self.kingdom, KingdomSkill.AGRICULTURE, seed=1)
+        sheet = self.kingdom.stat_sheet
+        self.assertEqual(
+            result.check.modifier, sheet.skill(KingdomSkill.AGRICULTURE).total
+        )
+        self.assertEqual(result.check.dc, sheet.control_dc)
+        # level 3 + 4 + 2 bonus - 1 penalty, on a Territory's d4
+        self.assertEqual(result.resources.expression, "8d4")
+
+    def test_seed_repeats(self):
+        first = simulate_turn(self.kingdom, KingdomSkill.TRADE, dc=18, seed=5)
+        second = simulate_turn(self.kingdom, KingdomSkill.TRADE, dc=18, seed=5)
+        self.assertEqual(first, second)
+
+    def test_view_shows_odds(self):
+        self.client.force_login(self.gm)
+        response = self.client.get(
+            self.url, {"skill": KingdomSkill.TRADE, "dc": 15, "trials": 1000}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["simulation"].check.dc, 15)
+        self.assertContains(response, "Critical Success")
+
+    def test_view_rejects_too_many_trials(self):
+        self.client.force_login(self.gm)
+        response = self.client.get(
+            self.url, {"skill": KingdomSkill.TRADE, "trials": MAX_TRIALS + 1}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("simulation", response.context)
+        self.assertTrue(response.context["form"].errors["trials"])
+
+    def test_view_without_query_shows_form_only(self):
+        self.client.force_login(self.gm)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("simulation", response.context)
+
+    def test_view_gm_only(self):
+        player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        KingdomMembership.objects.create(
+            user=player, kingdom=self.kingdom, role=MembershipRole.PLAYER
+        )
+        self.client.force_login(player)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_result_cached_per_kingdom_version(self):
+        cache.clear()
+        first = get_simulation(self.kingdom, KingdomSkill.TRADE, trials=1000)
+        key = simulation_cache_key(
+            self.kingdom.pk, self.kingdom.stats_version, KingdomSkill.TRADE, None, 1000
+        )
+        self.assertEqual(cache.get(key), first)
+        self.assertEqual(
+            get_simulation(self.kingdom, KingdomSkill.TRADE, trials=1000), first
+        )
+        self.kingdom.unrest = 5
+        self.kingdom.save()
+        updated = get_simulation(self.kingdom, KingdomSkill.TRADE, trials=1000)
+        self.assertEqual(updated.stats_version, self.kingdom.stats_version)
+        self.assertEqual(updated.check.modifier, first.check.modifier - 2)
+
+    def test_management_command(self):
+        out = io.StringIO()
+        call_command(
+            "simulate_turn",
+            self.kingdom.pk,
+            "--skill",
+            "trade",
+            "--trials",
+            "1000",
+            "--seed",
+            "3",
+            stdout=out,
+        )
+        self.assertIn("Resource Dice 8d4", out.getvalue())
+        self.assertIn("1000 turns simulated", out.getvalue())
+
+
+class KingdomAnalyticsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
         KingdomMembership.objects.create(
             user=self.player,
             kingdom=self.kingdom,
             role=MembershipRole.PLAYER,
         )
+        self.ruler = self.kingdom.leadership_assignments.get(role=LeadershipRole.RULER)
         self.turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        self.url = reverse("turns:kingdom_analytics", kwargs={"pk": self.kingdom.pk})
 
-    def test_turn_create_view_queries(self):
-        """GMRequiredMixin should not double-query kingdom/membership."""
-        self.client.force_login(self.gm)
-        url = reverse("turns:turn_create", kwargs={"pk": self.kingdom.pk})
+    def _log(self, degree, skill=KingdomSkill.TRADE, turn=None, **fields):
+        return ActivityLog.objects.create(
+            kingdom=self.kingdom,
+            turn=turn or self.turn,
+            activity_name="Establish Trade Agreement",
+            activity_trait=ActivityTrait.REGION,
+            skill_used=skill,
+            degree_of_success=degree,
+            **fields,
+        )
+
+    def _rates(self, dimension):
+        return {
+            line.key: line for line in load_dashboard(self.kingdom).rates[dimension]
+        }
+
+    def test_completing_turn_writes_rollups(self):
+        self._log(DegreeOfSuccess.CRITICAL_SUCCESS, performed_by=self.ruler)
+        self._log(DegreeOfSuccess.FAILURE)
+        self._log("", skill="")
+        self.kingdom.xp = 40
+        self.kingdom.unrest = 2
+        self.kingdom.save()
+        self.turn.complete_turn()
 
-        # session, user, kingdom, membership
-        # No extra queries - form doesn't need leadership roles on GET
-        with self.assertNumQueries(4):
-            response = self.client.get(url)
+        rollup = TurnRollup.objects.get(turn=self.turn)
+        self.assertEqual((rollup.xp, rollup.unrest), (40, 2))
+        trade = ActivityRollup.objects.get(
+            turn=self.turn, dimension=RollupDimension.SKILL, key=KingdomSkill.TRADE
+        )
+        self.assertEqual(
+            (trade.logged, trade.attempts, trade.critical_successes, trade.failures),
+            (2, 2, 1, 1),
+        )
+        region = ActivityRollup.objects.get(
+            dimension=RollupDimension.TRAIT, key=ActivityTrait.REGION
+        )
+        self.assertEqual((region.logged, region.attempts), (3, 2))
+        self.assertTrue(
+            ActivityRollup.objects.filter(
+                dimension=RollupDimension.ROLE, key=LeadershipRole.RULER, logged=1
+            ).exists()
+        )
+
+    def test_recompleting_turn_replaces_rollups(self):
+        self._log(DegreeOfSuccess.SUCCESS)
+        self.turn.complete_turn()
+        self._log(DegreeOfSuccess.FAILURE, skill=KingdomSkill.ARTS)
+        self.turn.complete_turn()
+        self.assertEqual(TurnRollup.objects.count(), 1)
+        self.assertEqual(
+            set(
+                ActivityRollup.objects.filter(
+                    dimension=RollupDimension.SKILL
+                ).values_list("key", "logged")
+            ),
+            {(KingdomSkill.TRADE, 1), (KingdomSkill.ARTS, 1)},
+        )
+
+    def test_dashboard_sums_turns(self):
+        self._log(DegreeOfSuccess.SUCCESS)
+        self._log(DegreeOfSuccess.CRITICAL_FAILURE)
+        self.turn.complete_turn()
+        second = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=2)
+        self._log(DegreeOfSuccess.CRITICAL_SUCCESS, turn=second)
+        self._log(DegreeOfSuccess.SUCCESS, turn=second)
+        second.complete_turn()
+
+        trade = self._rates(RollupDimension.SKILL)[KingdomSkill.TRADE]
+        self.assertEqual((trade.label, trade.attempts), ("Trade", 4))
+        self.assertEqual(trade.success_rate, 75)
+        self.assertEqual(
+            [row.turn_number for row in load_dashboard(self.kingdom).turns], [1, 2]
+        )
+
+    def test_open_turns_not_counted(self):
+        self._log(DegreeOfSuccess.SUCCESS)
+        self.assertEqual(self._rates(RollupDimension.SKILL), {})
+
+    def test_rebuild_uses_snapshot_state(self):
+        self.kingdom.unrest = 3
+        self.kingdom.save()
+        self.turn.complete_turn()
+        self._log(DegreeOfSuccess.SUCCESS)
+        TurnRollup.objects.all().delete()
+        self.kingdom.unrest = 9
+        self.kingdom.save()
 
+        self.assertEqual(rebuild_rollups(self.kingdom.turns.all()), 1)
+        self.assertEqual(TurnRollup.objects.get().unrest, 3)
+        self.assertEqual(
+            self._rates(RollupDimension.SKILL)[KingdomSkill.TRADE].attempts, 1
+        )
+
+    def test_view_shows_rates_and_trends(self):
+        self._log(DegreeOfSuccess.SUCCESS)
+        self.turn.complete_turn()
+        self.client.force_login(self.player)
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [label for label, _ in response.context["rates"]],
+            ["Skill", "Leadership Role", "Trait"],
+        )
+        self.assertEqual(len(response.context["turn_rollups"]), 1)
+        self.assertContains(response, "100%")
 
-    def test_turn_detail_view_queries(self):
-        """KingdomAccessMixin should efficiently load kingdom and activities."""
-        ActivityLog.objects.create(
+    def test_view_empty_state(self):
+        self.client.force_login(self.player)
+        self.assertContains(self.client.get(self.url), "No completed turns yet.")
+
+    def test_non_member_404(self):
+        other = Kingdom.objects.create(name="Other")
+        self.client.force_login(self.player)
+        url = reverse("turns:kingdom_analytics", kwargs={"pk": other.pk})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_management_command(self):
+        self.turn.complete_turn()
+        TurnRollup.objects.all().delete()
+        out = io.StringIO()
+        call_command("rebuild_analytics", "--kingdom", self.kingdom.pk, stdout=out)
+        self.assertIn("Rebuilt rollups for 1 turns.", out.getvalue())
+        self.assertTrue(TurnRollup.objects.filter(turn=self.turn).exists())
+
+
+class SyntheticCampaignTests(TestCase):
+    def _fingerprint(self):
+        return list(
+            ActivityLog.objects.order_by("pk").values_list(
+                "activity_trait", "roll_result", "dc", "degree_of_success"
+            )
+        )
+
+    def test_builds_requested_shape(self):
+        campaign = generate_campaign(kingdoms=3, members=3, turns=4, activities=5)
+        self.assertEqual(len(campaign.kingdoms), 3)
+        self.assertEqual(KingdomTurn.objects.count(), campaign.turns)
+        self.assertEqual(ActivityLog.objects.count(), campaign.activities)
+        kingdom = campaign.kingdoms[0]
+        self.assertEqual(kingdom.leadership_assignments.count(), 8)
+        self.assertEqual(kingdom.skill_proficiencies.count(), 16)
+        memberships = list(kingdom.kingdom_memberships.order_by("pk"))
+        self.assertEqual(
+            [membership.role for membership in memberships],
+            [MembershipRole.GM, MembershipRole.PLAYER, MembershipRole.PLAYER],
+        )
+        self.assertEqual(memberships[0].user, campaign.gms[0])
+        # Each player's character holds a leadership role.
+        self.assertEqual(
+            set(
+                kingdom.leadership_assignments.filter(is_pc=True).values_list(
+                    "user", flat=True
+                )
+            ),
+            {membership.user_id for membership in memberships[1:]},
+        )
+        turns = list(kingdom.turns.order_by("turn_number"))
+        self.assertEqual(
+            [turn.is_complete for turn in turns], [True] * (len(turns) - 1) + [False]
+        )
+        summary = KingdomSummary.objects.get(pk=kingdom.pk)
+        self.assertEqual(
+            (summary.member_count, summary.current_turn_number), (3, len(turns))
+        )
+        # Tallies were counted while generating; a recount finds nothing to fix.
+        self.assertEqual(KingdomTurn.recount(), 0)
+        # Activities are dated to the turn they belong to.
+        activity = ActivityLog.objects.filter(turn=turns[0]).first()
+        self.assertEqual(activity.created_at, turns[0].completed_at)
+
+    def test_rolls_use_stat_sheet_modifiers(self):
+        kingdom = generate_campaign(turns=3, activities=10, seed=3).kingdoms[0]
+        sheet = Kingdom.objects.get(pk=kingdom.pk).stat_sheet
+        checks = ActivityLog.objects.filter(kingdom=kingdom).exclude(skill_used="")
+        self.assertTrue(checks)
+        for skill, modifier, dc in checks.values_list(
+            "skill_used", "total_modifier", "dc"
+        ):
+            self.assertLessEqual(abs(modifier - sheet.skill(skill).total), 2)
+            self.assertIn(dc - sheet.control_dc, (-2, 0, 2, 5))
+
+    def test_covers_every_trait_and_degree(self):
+        generate_campaign(kingdoms=2, turns=10, activities=10)
+        logged = ActivityLog.objects.order_by()
+        self.assertEqual(
+            set(logged.values_list("activity_trait", flat=True)),
+            set(ActivityTrait.values),
+        )
+        self.assertEqual(
+            set(logged.values_list("degree_of_success", flat=True)),
+            {*DegreeOfSuccess.values, ""},
+        )
+
+    def test_same_seed_same_data(self):
+        generate_campaign(turns=3, activities=6, seed=7, prefix="first")
+        first = self._fingerprint()
+        ActivityLog.objects.all().delete()
+        generate_campaign(turns=3, activities=6, seed=7, prefix="second")
+        self.assertEqual(self._fingerprint(), first)
+
+    def test_command_reports_counts(self):
+        out = io.StringIO()
+        call_command(
+            "generate_campaign",
+            "--kingdoms=2",
+            "--turns=3",
+            "--activities=4",
+            stdout=out,
+        )
+        self.assertEqual(Kingdom.objects.count(), 2)
+        self.assertIn(f"{ActivityLog.objects.count()} activities", out.getvalue())
+
+    def test_command_refuses_existing_prefix(self):
+        call_command("generate_campaign", "--kingdoms=1", stdout=io.StringIO())
+        with self.assertRaises(CommandError):
+            call_command("generate_campaign", "--kingdoms=1", stdout=io.StringIO())
+
+
+class QueryCountTests(QueryBudgetMixin, TestCase):
+    """
+    Pin the query count of every turns view.
+
+    Budgets count session + user lookups. Views listing activities must stay
+    flat as more activities (and PC performers) are logged.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.gm = User.objects.create_user(
+            username="gm",
+            email="gm@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.player = User.objects.create_user(
+            username="player",
+            email="player@example.com",
+            password=TEST_PASSWORD,
+        )
+        self.kingdom = Kingdom.objects.create(name="Test Kingdom")
+        self.kingdom.initialize_defaults()
+        KingdomMembership.objects.create(
+            user=self.gm,
+            kingdom=self.kingdom,
+            role=MembershipRole.GM,
+        )
+        KingdomMembership.objects.create(
+            user=self.player,
+            kingdom=self.kingdom,
+            role=MembershipRole.PLAYER,
+        )
+        self.turn = KingdomTurn.objects.create(kingdom=self.kingdom, turn_number=1)
+        self.activity = ActivityLog.objects.create(
             kingdom=self.kingdom,
             turn=self.turn,
             activity_name="Test Activity",
             activity_trait=ActivityTrait.REGION,
             created_by=self.player,
         )
-        self.client.force_login(self.player)
-        url = reverse(
-            "turns:turn_detail",
+
+    def _turn_url(self, name):
+        return reverse(
+            f"turns:{name}",
             kwargs={"pk": self.kingdom.pk, "turn_pk": self.turn.pk},
         )
 
-        # session, user, kingdom, membership, turn, activities (with select_related), user again
-        # Note: Extra user query from template checking activity.created_by
-        with self.assertNumQueries(7):
-            response = self.client.get(url)
+    def _activity_url(self, name):
+        return reverse(
+            f"turns:{name}",
+            kwargs={"pk": self.kingdom.pk, "activity_pk": self.activity.pk},
+        )
 
-        self.assertEqual(response.status_code, 200)
+    def _log_more_activities(self):
+        self.kingdom.leadership_assignments.update(
+            user=self.player, is_pc=True, is_vacant=False
+        )
+        for assignment in self.kingdom.leadership_assignments.all():
+            for trait in (ActivityTrait.LEADERSHIP, ActivityTrait.CIVIC):
+                ActivityLog.objects.create(
+                    kingdom=self.kingdom,
+                    turn=self.turn,
+                    activity_name="Celebrate Holiday",
+                    activity_trait=trait,
+                    performed_by=assignment,
+                    created_by=self.gm,
+                )
 
-    def test_activity_update_view_queries(self):
-        """ActivityUpdateView dispatch() + get_object() results in some duplicate queries."""
-        activity = ActivityLog.objects.create(
-            kingdom=self.kingdom,
-            turn=self.turn,
-            activity_name="Test Activity",
-            activity_trait=ActivityTrait.REGION,
-            created_by=self.player,
+    def test_turn_create_view_queries(self):
+        """GMRequiredMixin should not double-query kingdom/membership."""
+        self.client.force_login(self.gm)
+        url = reverse("turns:turn_create", kwargs={"pk": self.kingdom.pk})
+        # session, user, membership+kingdom
+        self.assertQueryBudget(3, url)
+
+    def test_turn_detail_view_queries(self):
+        """KingdomAccessMixin should efficiently load kingdom and activities."""
+        self.client.force_login(self.player)
+        # session, user, membership+kingdom, turn, activities
+        self.assertQueryBudget(5, self._turn_url("turn_detail"))
+
+    def test_turn_detail_does_not_scale(self):
+        self.client.force_login(self.player)
+        self._log_more_activities()
+        self.assertQueriesDoNotScale(
+            self._turn_url("turn_detail"), self._log_more_activities
         )
+
+    def test_activity_feed_view_queries(self):
         self.client.force_login(self.player)
-        url = reverse(
-            "turns:activity_update",
-            kwargs={"pk": self.kingdom.pk, "activity_pk": activity.pk},
+        url = reverse("turns:activity_feed", kwargs={"pk": self.kingdom.pk})
+        # session, user, membership+kingdom, activities+turns, performers
+        self._log_more_activities()
+        self.assertQueryBudget(5, url)
+        self.assertQueriesDoNotScale(url, self._log_more_activities)
+
+    def test_kingdom_analytics_view_queries(self):
+        self.client.force_login(self.player)
+        url = reverse("turns:kingdom_analytics", kwargs={"pk": self.kingdom.pk})
+
+        def play_more():
+            self._log_more_activities()
+            self.turn.complete_turn()
+            self.turn = KingdomTurn.objects.create(
+                kingdom=self.kingdom, turn_number=self.turn.turn_number + 1
+            )
+
+        # session, user, membership+kingdom, activity totals, turn rollups
+        play_more()
+        self.assertQueryBudget(5, url)
+        self.assertQueriesDoNotScale(url, play_more)
+
+    def test_turn_update_view_queries(self):
+        self.client.force_login(self.gm)
+        # session, user, membership+kingdom, turn
+        self.assertQueryBudget(4, self._turn_url("turn_update"))
+
+    def test_turn_delete_view_queries(self):
+        self.client.force_login(self.gm)
+        # session, user, membership+kingdom, turn
+        self.assertQueryBudget(4, self._turn_url("turn_delete"))
+
+    def test_turn_complete_view_queries(self):
+        self.client.force_login(self.gm)
+        # session, user, membership+kingdom, turn, update, version bump,
+        # snapshot, and rollups: turn row delete+insert, group-by, activity
+        # rows delete+insert
+        self.assertQueryBudget(
+            18, self._turn_url("turn_complete"), method="post", status=302
         )
 
-        # session, user, kingdom, membership, activity+turn (select_related),
-        # then get_object() refetches: kingdom, activity, turn, leadership roles
-        # Note: Could be optimized by caching get_object() result from dispatch()
-        with self.assertNumQueries(9):
-            response = self.client.get(url)
+    def test_activity_create_view_queries(self):
+        self.client.force_login(self.player)
+        # session, user, turn, membership+kingdom, player roles, role options
+        self.assertQueryBudget(6, self._turn_url("activity_create"))
 
-        self.assertEqual(response.status_code, 200)
+    def test_activity_update_view_queries(self):
+        """ActivityUpdateView reuses the activity loaded in dispatch()."""
+        self.client.force_login(self.player)
+        # session, user, membership+kingdom, activity+turn, role options
+        self.assertQueryBudget(5, self._activity_url("activity_update"))
 
     def test_activity_delete_view_queries(self):
         """ActivityDeleteView should efficiently check permissions and delete."""
-        activity = ActivityLog.objects.create(
-            kingdom=self.kingdom,
-            turn=self.turn,
-            activity_name="Test Activity",
-            activity_trait=ActivityTrait.REGION,
-            created_by=self.player,
-        )
         self.client.force_login(self.player)
-        url = reverse(
-            "turns:activity_delete",
-            kwargs={"pk": self.kingdom.pk, "activity_pk": activity.pk},
+        # session, user, membership+kingdom, activity+turn, savepoint, delete,
+        # turn tallies, version bump, release
+        self.assertQueryBudget(
+            9, self._activity_url("activity_delete"), method="post", status=302
         )
-
-        # session, user, kingdom, membership, activity, user again, turn, delete
-        # Note: Extra user query from can_be_modified_by checking created_by
-        with self.assertNumQueries(8):
-            response = self.client.post(url)
-
-        self.assertEqual(response.status_code, 302)
@@ -3,11 +3,17 @@ from django.urls import path
 from .views import (
     ActivityCreateView,
     ActivityDeleteView,
+    ActivityFeedView,
     ActivityUpdateView,
+    CampaignImportView,
+    KingdomAnalyticsView,
+    KingdomEventsView,
+    KingdomExportView,
     TurnCompleteView,
     TurnCreateView,
     TurnDeleteView,
     TurnDetailView,
+    TurnSimulationView,
     TurnUpdateView,
 )
 
@@ -39,7 +45,17 @@ urlpatterns = [
         TurnCompleteView.as_view(),
         name="turn_complete",
     ),
+    path(
+        "<int:pk>/turns/simulate/",
+        TurnSimulationView.as_view(),
+        name="turn_simulate",
+    ),
     # Activities
+    path(
+        "<int:pk>/activities/",
+        ActivityFeedView.as_view(),
+        name="activity_feed",
+    ),
     path(
         "<int:pk>/turns/<int:turn_pk>/activities/create/",
         ActivityCreateView.as_view(),
@@ -55,4 +71,27 @@ urlpatterns = [
         ActivityDeleteView.as_view(),
         name="activity_delete",
     ),
+    # Live updates
+    path(
+        "<int:pk>/events/",
+        KingdomEventsView.as_view(),
+        name="kingdom_events",
+    ),
+    # Analytics
+    path(
+        "<int:pk>/analytics/",
+        KingdomAnalyticsView.as_view(),
+        name="kingdom_analytics",
+    ),
+    # Export
+    path(
+        "<int:pk>/export/",
+        KingdomExportView.as_view(),
+        name="kingdom_export",
+    ),
+    path(
+        "<int:pk>/import/",
+        CampaignImportView.as_view(),
+        name="campaign_import",
+    ),
 ]
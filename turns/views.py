@@ -1,19 +1,43 @@
-from collections import defaultdict
-
+from asgiref.sync import sync_to_async
 from django.contrib import messages
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect
 from django.views import View
-from django.views.generic import CreateView, DetailView, UpdateView
+from django.views.generic import CreateView, DetailView, FormView, UpdateView
 from django.views.generic.base import TemplateView
 
-from kingdoms.mixins import GMRequiredMixin, KingdomAccessMixin
-from kingdoms.models import Kingdom, KingdomMembership, MembershipRole
+from kingdoms.mixins import (
+    ConditionalGetMixin,
+    GMRequiredMixin,
+    KingdomAccessMixin,
+)
+from kingdoms.models import MembershipRole
+from kingdoms.pagination import InvalidCursor, keyset_paginate
+from kingdoms.permissions import get_membership
 from kingdoms.url_helpers import kingdom_url, turn_url
 
-from .forms import ActivityForm, TurnCreateForm, TurnUpdateForm
-from .models import ActivityLog, KingdomTurn
+from .analytics import load_dashboard
+from .degrees import MAX_GAP, MIN_GAP, ODDS_TABLE
+from .export import SECTIONS, aiter_lines, csv_lines, jsonl_lines, parse_cursor
+from .forms import (
+    ActivityForm,
+    CampaignImportForm,
+    SimulationForm,
+    TurnCreateForm,
+    TurnUpdateForm,
+)
+from .importer import import_campaign
+from .live import event_stream
+from .models import ActivityLog, KingdomTurn, RollupDimension
+from .simulation import get_simulation
 
 # --- Turn views ---
 
@@ -33,23 +57,36 @@ class TurnCreateView(GMRequiredMixin, CreateView):
         return turn_url("turn_detail", self.kingdom.pk, self.object.pk)
 
 
-class TurnDetailView(KingdomAccessMixin, DetailView):
+class TurnDetailView(KingdomAccessMixin, ConditionalGetMixin, DetailView):
     model = KingdomTurn
     template_name = "kingdoms/turn_detail.html"
     context_object_name = "turn"
     pk_url_kwarg = "turn_pk"
+    per_page = 50
 
     def get_queryset(self):
         return KingdomTurn.objects.filter(kingdom_id=self.kwargs["pk"])
 
+    def get_etag_parts(self):
+        # Turn and activity writes bump the kingdom version, so the turn needs
+        # no query of its own; a deleted turn's URL re-renders as a 404.
+        return (self.kwargs["turn_pk"],)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        activities = self.object.activities.select_related("performed_by").all()
-        context["activities"] = activities
-        activities_by_trait = defaultdict(list)
-        for activity in activities:
-            activities_by_trait[activity.get_activity_trait_display()].append(activity)
-        context["activities_by_trait"] = dict(activities_by_trait)
+        # Sorted by trait in the database so the template only marks where
+        # each trait's run begins.
+        cursor = self.request.GET.get("after")
+        try:
+            context["activities"], context["next_cursor"] = keyset_paginate(
+                self.object.activities.with_trait_order().with_performers(),
+                ("trait_order", "-created_at", "-pk"),
+                cursor=cursor,
+                per_page=self.per_page,
+            )
+        except InvalidCursor:
+            raise Http404("Invalid page cursor.")
+        context["is_first_page"] = not cursor
         return context
 
 
@@ -94,15 +131,48 @@ class TurnCompleteView(GMRequiredMixin, View):
         if turn.is_complete:
             messages.warning(request, "Turn is already complete.")
         else:
+            turn.kingdom = self.kingdom
             turn.complete_turn()
             messages.success(request, f"Turn {turn.turn_number} marked as complete.")
         return redirect(turn_url("turn_detail", self.kingdom.pk, turn.pk))
 
 
+class TurnSimulationView(GMRequiredMixin, TemplateView):
+    """Odds for a planned check and this turn's Resource Dice."""
+
+    template_name = "kingdoms/turn_simulation.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        form = SimulationForm(self.request.GET or None)
+        if form.is_valid():
+            context["simulation"] = get_simulation(
+                self.kingdom,
+                form.cleaned_data["skill"],
+                dc=form.cleaned_data["dc"],
+                trials=form.cleaned_data["trials"],
+            )
+        context["form"] = form
+        return context
+
+
 # --- Activity views ---
 
 
-class ActivityCreateView(KingdomAccessMixin, CreateView):
+class DegreeOddsMixin:
+    """Hand activity forms the exact d20 odds table, shown as rolls are typed."""
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["degree_odds"] = {
+            "min_gap": MIN_GAP,
+            "max_gap": MAX_GAP,
+            "odds": ODDS_TABLE,
+        }
+        return context
+
+
+class ActivityCreateView(DegreeOddsMixin, KingdomAccessMixin, CreateView):
     model = ActivityLog
     form_class = ActivityForm
     template_name = "kingdoms/activity_form.html"
@@ -143,39 +213,28 @@ class ActivityCreateView(KingdomAccessMixin, CreateView):
         return turn_url("turn_detail", self.kingdom.pk, self.turn.pk)
 
 
-class ActivityUpdateView(KingdomAccessMixin, UpdateView):
-    model = ActivityLog
-    form_class = ActivityForm
-    template_name = "kingdoms/activity_form.html"
-    pk_url_kwarg = "activity_pk"
-
-    def get_queryset(self):
-        return ActivityLog.objects.filter(kingdom_id=self.kwargs["pk"])
+class ActivityModifyMixin(KingdomAccessMixin):
+    """Load the URL's activity and allow only its creator or a GM."""
 
-    def dispatch(self, request, *args, **kwargs):
-        # Duplicate lookup to check creator/GM before super processes form.
-        if not request.user.is_authenticated:
-            return self.handle_no_permission()
-        try:
-            self.kingdom = Kingdom.objects.get(pk=kwargs["pk"])
-        except Kingdom.DoesNotExist:
-            raise Http404
-        try:
-            self.membership = KingdomMembership.objects.get(
-                user=request.user, kingdom=self.kingdom
-            )
-        except KingdomMembership.DoesNotExist:
-            raise Http404
+    def has_kingdom_permission(self):
+        # Runs before super().dispatch() processes any form.
         try:
             self.activity_obj = ActivityLog.objects.select_related("turn").get(
-                pk=kwargs["activity_pk"], kingdom=self.kingdom
+                pk=self.kwargs["activity_pk"], kingdom=self.kingdom
             )
         except ActivityLog.DoesNotExist:
             raise Http404
-        if not self.activity_obj.can_be_modified_by(request.user, self.membership):
-            raise Http404
-        # Skip KingdomAccessMixin.dispatch to avoid duplicate lookups
-        return LoginRequiredMixin.dispatch(self, request, *args, **kwargs)
+        return self.activity_obj.can_be_modified_by(self.request.user, self.membership)
+
+
+class ActivityUpdateView(DegreeOddsMixin, ActivityModifyMixin, UpdateView):
+    model = ActivityLog
+    form_class = ActivityForm
+    template_name = "kingdoms/activity_form.html"
+    pk_url_kwarg = "activity_pk"
+
+    def get_object(self, queryset=None):
+        return self.activity_obj
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -196,14 +255,150 @@ class ActivityUpdateView(KingdomAccessMixin, UpdateView):
         return turn_url("turn_detail", self.kingdom.pk, self.object.turn.pk)
 
 
-class ActivityDeleteView(KingdomAccessMixin, View):
+class ActivityDeleteView(ActivityModifyMixin, View):
     def post(self, request, *args, **kwargs):
-        activity = get_object_or_404(
-            ActivityLog, pk=self.kwargs["activity_pk"], kingdom=self.kingdom
-        )
-        if not activity.can_be_modified_by(request.user, self.membership):
-            raise Http404
-        turn_pk = activity.turn.pk
+        activity = self.activity_obj
+        turn_pk = activity.turn_id
         activity.delete()
         messages.success(request, "Activity deleted.")
         return redirect(turn_url("turn_detail", self.kingdom.pk, turn_pk))
+
+
+class ActivityFeedView(KingdomAccessMixin, TemplateView):
+    """Every activity logged in the kingdom, newest first."""
+
+    template_name = "kingdoms/activity_feed.html"
+    per_page = 50
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        cursor = self.request.GET.get("after")
+        try:
+            context["activities"], context["next_cursor"] = keyset_paginate(
+                self.kingdom.activities.select_related("turn").with_performers(),
+                ("-created_at", "-pk"),
+                cursor=cursor,
+                per_page=self.per_page,
+            )
+        except InvalidCursor:
+            raise Http404("Invalid page cursor.")
+        context["is_first_page"] = not cursor
+        return context
+
+
+class KingdomAnalyticsView(KingdomAccessMixin, TemplateView):
+    """Success rates and turn-by-turn trends, read from rollup tables."""
+
+    template_name = "kingdoms/kingdom_analytics.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        dashboard = load_dashboard(self.kingdom)
+        context["rates"] = [
+            (RollupDimension(dimension).label, lines)
+            for dimension, lines in dashboard.rates.items()
+        ]
+        context["turn_rollups"] = dashboard.turns
+        # Bar widths in the trend table are relative to the largest value.
+        context["max_xp"] = max((row.xp for row in dashboard.turns), default=0)
+        context["max_unrest"] = max((row.unrest for row in dashboard.turns), default=0)
+        return context
+
+
+# --- Live updates ---
+
+
+class KingdomEventsView(View):
+    """Server-Sent Events stream of the kingdom's turn and activity changes.
+
+    Access matches ``KingdomAccessMixin``, checked without blocking the event
+    loop. Streaming needs ASGI; under WSGI the 204 stops EventSource retries.
+    """
+
+    async def get(self, request, pk):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        await sync_to_async(get_membership)(request, pk)
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse(status=204)
+        response = StreamingHttpResponse(
+            event_stream(pk), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # Don't let nginx hold events back.
+        return response
+
+
+# --- Export ---
+
+
+class KingdomExportView(KingdomAccessMixin, View):
+    """Stream the kingdom's leadership, skills, turns and activities.
+
+    Query parameters: ``format`` (``jsonl``, the default, or ``csv``),
+    ``section`` (repeatable; CSV takes exactly one, default ``activities``)
+    and ``after`` (a record's cursor, to resume past it).
+    """
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "jsonl")
+        sections = request.GET.getlist("section")
+        after = request.GET.get("after")
+        if export_format not in ("jsonl", "csv"):
+            return HttpResponseBadRequest("format must be jsonl or csv.")
+        if any(section not in SECTIONS for section in sections):
+            return HttpResponseBadRequest("Unknown section.")
+        if export_format == "csv":
+            if len(sections) > 1:
+                return HttpResponseBadRequest("CSV exports one section at a time.")
+            sections = sections or ["activities"]
+        else:
+            sections = sections or list(SECTIONS)
+        # Reject bad cursors before the response starts streaming.
+        if after:
+            try:
+                after = parse_cursor(after)
+            except InvalidCursor:
+                raise Http404("Invalid export cursor.")
+            if after[0] not in sections:
+                return HttpResponseBadRequest("Cursor is for another section.")
+
+        slug = f"kingdom-{self.kingdom.pk}"
+        if export_format == "csv":
+            lines = csv_lines(self.kingdom, sections[0], after)
+            content_type = "text/csv"
+            filename = f"{slug}-{sections[0]}.csv"
+        else:
+            lines = jsonl_lines(self.kingdom, sections, after)
+            content_type = "application/x-ndjson"
+            filename = f"{slug}.jsonl"
+        if isinstance(request, ASGIRequest):
+            lines = aiter_lines(lines)
+        response = StreamingHttpResponse(lines, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class CampaignImportView(GMRequiredMixin, FormView):
+    form_class = CampaignImportForm
+    template_name = "kingdoms/campaign_import.html"
+
+    def form_valid(self, form):
+        try:
+            result = import_campaign(
+                self.kingdom,
+                form.cleaned_data["file"],
+                file_format=form.cleaned_data["file_format"],
+                created_by=self.request.user,
+            )
+        except ValidationError as exc:
+            for message in exc.messages:
+                form.add_error(None, message)
+            return self.form_invalid(form)
+        messages.success(
+            self.request,
+            f"Imported {result.activities_created} activities and created "
+            f"{result.turns_created} turns.",
+        )
+        return redirect(kingdom_url("kingdom_detail", self.kingdom.pk))